@@ -0,0 +1,110 @@
+"""
+Measures what disabled debug logging costs on the bot's hot paths.
+
+Compares the eager f-string log calls the bot used to make with the deferred calls it makes now, for the carrier
+payloads logged while parsing, the /carriers response body logged by _request, and the per-message trace logging.
+It then times parsing a /carriers payload into BoozeCarrier objects with debug logging off and on.
+
+Run from the repository root with the bot's environment configured:
+
+    python -m benchmarks.logging_overhead
+"""
+
+import timeit
+from collections.abc import Callable
+from types import SimpleNamespace
+
+from loguru import logger as root_logger
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.classes.BoozeCarrier import BoozeCarrier
+
+logger = get_logger("boozebot.benchmarks.loggingoverhead")
+
+CARRIER_COUNT = 500
+REPEAT = 5
+
+
+def make_carrier(index: int) -> dict:
+    return {
+        "fcId": index,
+        "fcData": {
+            "fcName": f"P.T.N. Carrier {index}",
+            "fcCallsign": f"{index:03d}-ABC",
+            "currentSystem": "N0",
+            "currentBody": "Star",
+            "isInQueue": False,
+            "plottedSystem": "N16",
+            "plottedBody": "Planet 1",
+            "queueTs": "2026-01-01T00:00:00Z",
+            "staffComment": "Booze Cruise carrier",
+            "owner": {"username": f"owner{index}", "displayName": f"Owner {index}", "discordId": str(10**17 + index)},
+        },
+        "notable": {"status": "approved", "color": "ff0000", "notes": "First trip", "firstTime": True},
+        "cruiseId": 42,
+        "tripId": 1,
+        "wineTotal": 21000,
+        "wineStatus": "Full",
+        "status": "Loaded",
+        "availabilityStart": "2026-01-01T00:00:00Z",
+        "availabilityEnd": "2026-01-03T00:00:00Z",
+        "unloadOpened": None,
+        "unloadClosed": None,
+        "unloadDur": None,
+    }
+
+
+def set_level(level: str) -> None:
+    root_logger.remove()
+    root_logger.add(lambda _message: None, level=level)
+
+
+def bench(label: str, func: Callable[[], object], number: int) -> float:
+    per_call = min(timeit.repeat(func, number=number, repeat=REPEAT)) / number
+    print(f"{label:<58} {per_call * 1e6:>12.2f} us")
+    return per_call
+
+
+def compare(label: str, eager: Callable[[], object], deferred: Callable[[], object], number: int) -> None:
+    print(label)
+    before = bench("  eager f-string", eager, number)
+    after = bench("  deferred", deferred, number)
+    print(f"  {before / after:.0f}x faster\n")
+
+
+def main() -> None:
+    payload = [make_carrier(index) for index in range(CARRIER_COUNT)]
+    carrier = payload[0]
+    author = SimpleNamespace(name="pilot", id=10**17)
+    channel = SimpleNamespace(name="booze-cruise-chat", id=10**17 + 1)
+
+    set_level("INFO")
+    print(f"Debug logging disabled, {CARRIER_COUNT} carriers\n")
+    compare(
+        "Carrier payload, logged once per carrier parsed:",
+        lambda: logger.debug(f"Initializing BoozeCarrier with info_json: {carrier}"),
+        lambda: logger.debug("Initializing BoozeCarrier with info_json: {}", carrier),
+        2_000,
+    )
+    compare(
+        "/carriers response body, logged once per poll:",
+        lambda: logger.debug(f"Received response from BoozeSheets API: {payload}"),
+        lambda: logger.debug("Received response from BoozeSheets API: {}", payload),
+        20,
+    )
+    compare(
+        "Trace line, logged once per message handled:",
+        lambda: logger.trace(f"Checking auto responses for message from {author} in {channel.name}"),
+        lambda: logger.trace("Checking auto responses for message from {} in {}", author, channel.name),
+        100_000,
+    )
+
+    print("Parsing the /carriers payload into BoozeCarrier objects:")
+    disabled = bench("  debug logging disabled", lambda: [BoozeCarrier(c) for c in payload], 5)
+    set_level("DEBUG")
+    enabled = bench("  debug logging enabled", lambda: [BoozeCarrier(c) for c in payload], 5)
+    print(f"  logging is {1 - disabled / enabled:.0%} of parse time when enabled, and skipped when disabled")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,9 +5,9 @@ The Python script that starts the bot.
 
 import asyncio
 
-from discord import ConnectionClosed, DiscordException, GatewayNotFound, HTTPException, LoginFailure, Object
+from discord import ConnectionClosed, DiscordException, GatewayNotFound, HTTPException, LoginFailure
 from discord.ext.prometheus import PrometheusCog
-from ptn_utils.global_constants import DISCORD_GUILD, TOKEN, _production
+from ptn_utils.global_constants import TOKEN, _production
 from ptn_utils.logger.logger import Logger, get_logger
 
 from ptn.boozebot.botcommands.AutoResponses import AutoResponses
@@ -23,7 +23,13 @@ from ptn.boozebot.botcommands.PublicHoliday import PublicHoliday
 from ptn.boozebot.botcommands.Statistics import Statistics
 from ptn.boozebot.botcommands.Unloading import Unloading
 from ptn.boozebot.constants import bot
+from ptn.boozebot.database.database import database
+from ptn.boozebot.modules.boozeSheetsApi import booze_sheets_api
+from ptn.boozebot.modules.CommandSync import sync_command_tree
 from ptn.boozebot.modules.ErrorHandler import on_app_command_error, on_text_command_error
+from ptn.boozebot.modules.LogQueue import QueuedLogSink, install_queued_log_sink
+from ptn.boozebot.modules.Settings import settings
+from ptn.boozebot.modules.Startup import startup
 from ptn.boozebot.modules.Views import DynamicButton
 
 logger = get_logger("boozebot.application")
@@ -33,67 +39,95 @@ logger.info(f"Booze bot is connecting against production: {_production}.")
 
 def run():
     logger.info("Starting Booze Bot...")
-    asyncio.run(boozebot())
+    log_sink = install_queued_log_sink()
+    try:
+        asyncio.run(boozebot(log_sink))
+    finally:
+        if log_sink is not None:
+            log_sink.close()
+
+
+async def boozebot(log_sink: QueuedLogSink | None = None):
+    try:
+        await _start_bot()
+    finally:
+        if log_sink is not None:
+            logger.info("Flushing queued log output.")
+            # Waits in a thread, the writer may still be working through a backlog
+            if not await asyncio.to_thread(log_sink.drain):
+                logger.warning("Queued log output did not drain before shutdown.")
+            if log_sink.dropped:
+                logger.warning(f"{log_sink.dropped} log record(s) were dropped while the log queue was full.")
+
+
+async def _start_bot():
+    startup.begin()
+    with startup.stage("construct"):
+        database.open()
+        settings.load()
+        # Creating the HTTP client loads the TLS certificates
+        _ = booze_sheets_api.client
 
-
-async def boozebot():
     logger.info("Setting up bot cogs and event listeners.")
     async with bot:
-        await bot.add_cog(Logger())
-        logger.debug("Loaded Logger cog.")
-        await bot.add_cog(DiscordBotCommands(bot))
-        logger.debug("Loaded DiscordBotCommands cog.")
-        await bot.add_cog(Unloading(bot))
-        logger.debug("Loaded Unloading cog.")
-        await bot.add_cog(Statistics(bot))
-        logger.debug("Loaded Statistics cog.")
-        await bot.add_cog(PublicHoliday(bot))
-        logger.debug("Loaded PublicHoliday cog.")
-        await bot.add_cog(MimicSteve(bot))
-        logger.debug("Loaded MimicSteve cog.")
-        await bot.add_cog(Cleaner(bot))
-        logger.debug("Loaded Cleaner cog.")
-        await bot.add_cog(MakeWineCarrier(bot))
-        logger.debug("Loaded MakeWineCarrier cog.")
-        await bot.add_cog(Departures(bot))
-        logger.debug("Loaded Departures cog.")
-        await bot.add_cog(Loading(bot))
-        logger.debug("Loaded Loading cog.")
-        await bot.add_cog(BackgroundTaskCommands(bot))
-        logger.debug("Loaded BackgroundTaskCommands cog.")
-        await bot.add_cog(AutoResponses(bot))
-        logger.debug("Loaded AutoResponses cog.")
-        await bot.add_cog(Corked(bot))
-        logger.debug("Loaded Corked cog.")
-        await bot.add_cog(PrometheusCog(bot))
-        logger.debug("Loaded PrometheusCog cog.")
-
-        logger.info("Bot cogs and event listeners setup complete.")
-
-        logger.info("Setting up error handlers.")
-        # Start error handlers
-        bot.tree.on_error = on_app_command_error  # type: ignore[assignment]
-        bot.add_listener(on_text_command_error, "on_command_error")
-        logger.info("Error handlers setup complete.")
-
-        logger.info("Adding dynamic items to the bot.")
-        bot.add_dynamic_items(DynamicButton)
-        logger.info("Dynamic items added to the bot.")
+        with startup.stage("cogs"):
+            await bot.add_cog(Logger())
+            logger.debug("Loaded Logger cog.")
+            await bot.add_cog(DiscordBotCommands(bot))
+            logger.debug("Loaded DiscordBotCommands cog.")
+            await bot.add_cog(Unloading(bot))
+            logger.debug("Loaded Unloading cog.")
+            await bot.add_cog(Statistics(bot))
+            logger.debug("Loaded Statistics cog.")
+            await bot.add_cog(PublicHoliday(bot))
+            logger.debug("Loaded PublicHoliday cog.")
+            await bot.add_cog(MimicSteve(bot))
+            logger.debug("Loaded MimicSteve cog.")
+            await bot.add_cog(Cleaner(bot))
+            logger.debug("Loaded Cleaner cog.")
+            await bot.add_cog(MakeWineCarrier(bot))
+            logger.debug("Loaded MakeWineCarrier cog.")
+            await bot.add_cog(Departures(bot))
+            logger.debug("Loaded Departures cog.")
+            await bot.add_cog(Loading(bot))
+            logger.debug("Loaded Loading cog.")
+            await bot.add_cog(BackgroundTaskCommands(bot))
+            logger.debug("Loaded BackgroundTaskCommands cog.")
+            await bot.add_cog(AutoResponses(bot))
+            logger.debug("Loaded AutoResponses cog.")
+            await bot.add_cog(Corked(bot))
+            logger.debug("Loaded Corked cog.")
+            await bot.add_cog(PrometheusCog(bot))
+            logger.debug("Loaded PrometheusCog cog.")
+
+            logger.info("Bot cogs and event listeners setup complete.")
+
+            logger.info("Setting up error handlers.")
+            # Start error handlers
+            bot.tree.on_error = on_app_command_error  # type: ignore[assignment]
+            bot.add_listener(on_text_command_error, "on_command_error")
+            logger.info("Error handlers setup complete.")
+
+            logger.info("Adding dynamic items to the bot.")
+            bot.add_dynamic_items(DynamicButton)
+            logger.info("Dynamic items added to the bot.")
+
+        # Warms the caches and starts the background tasks registered by the cogs
+        bot.add_listener(startup.on_ready, "on_ready")
 
         if not TOKEN:
             raise RuntimeError("No token provided.")
         try:
             logger.info("Logging in the bot...")
-            await bot.login(TOKEN)
+            with startup.stage("login"):
+                await bot.login(TOKEN)
             logger.info("Bot logged in successfully.")
         except (LoginFailure, HTTPException) as e:
             logger.exception(f"Error in bot login: {e}")
 
         try:
-            logger.info("Syncing command tree...")
-            bot.tree.copy_global_to(guild=Object(DISCORD_GUILD))
-            await bot.tree.sync(guild=Object(DISCORD_GUILD))
-            logger.info("Command tree synced successfully.")
+            with startup.stage("sync"):
+                await sync_command_tree()
         except DiscordException as e:
             logger.exception(f"Error in syncing command tree: {e}")
 
@@ -1,5 +1,4 @@
 import random
-import re
 from typing import override
 
 import discord
@@ -21,9 +20,12 @@ from ptn_utils.logger.logger import get_logger
 from ptn_utils.pagination.pagination import PaginationView
 
 from ptn.boozebot.classes.AutoResponse import AutoResponse
-from ptn.boozebot.constants import ping_response_messages
+from ptn.boozebot.classes.AutoResponseMatcher import AutoResponseMatcher
+from ptn.boozebot.constants import bot, ping_response_messages
 from ptn.boozebot.database.database import database
 from ptn.boozebot.modules.helpers import check_command_channel, check_roles
+from ptn.boozebot.modules.RegexSandbox import REGEX_STRIKE_LIMIT, REGEX_TIME_BUDGET, check_regex_trigger
+from ptn.boozebot.modules.SendQueue import send_queue
 
 """
 LISTENERS
@@ -39,6 +41,7 @@ logger = get_logger("boozebot.commands.autoresponses")
 
 class AutoResponses(commands.Cog):
     auto_responses: list[AutoResponse]
+    matcher: AutoResponseMatcher
     text_commands: list[str]
     bot: Bot
 
@@ -48,11 +51,19 @@ class AutoResponses(commands.Cog):
         self.text_commands = ["ping", "exit", "update", "version", "sync"]
 
         self.auto_responses = []
+        self.matcher = AutoResponseMatcher([])
 
     @override
     async def cog_load(self):
         self.auto_responses = await database.get_auto_responses()
-        logger.debug(f"Loaded {len(self.auto_responses)} auto responses from database.")
+        logger.debug("Loaded {} auto responses from database.", len(self.auto_responses))
+        self.rebuild_matcher()
+
+    def rebuild_matcher(self) -> None:
+        """
+        Rebuilds the auto response matcher, after auto responses have been created, edited or deleted.
+        """
+        self.matcher = AutoResponseMatcher(self.auto_responses)
 
     @commands.Cog.listener()
     async def on_message(self, message: discord.Message):
@@ -61,7 +72,7 @@ class AutoResponses(commands.Cog):
             CHANNEL_BC_WINE_CARRIER,
             CHANNEL_BC_WINE_CELLAR_DELIVERIES,
         ]:
-            logger.trace(f"Ignoring message in channel {message.channel.id} (not a monitored channel).")
+            logger.trace("Ignoring message in channel {} (not a monitored channel).", message.channel.id)
             return
 
         if message.is_system():
@@ -73,18 +84,22 @@ class AutoResponses(commands.Cog):
             return
 
         logger.trace(
-            f"Checking {len(self.auto_responses)} auto responses for message from {message.author} in {message.channel.name}"
+            "Checking {} auto responses for message from {} in {}",
+            len(self.auto_responses),
+            message.author,
+            message.channel.name,
         )
-        for auto_response in self.auto_responses:
-            if auto_response.matches(message):
-                logger.info(
-                    f"Auto response triggered: {auto_response.name} by {message.author} in {message.channel.name}"
-                )
-                await message.channel.send(
-                    auto_response.response,
-                    reference=message,
-                )
-                return
+        result = await self.matcher.match(message)
+        for timed_out in result.timed_out:
+            await self._record_regex_timeout(timed_out)
+
+        if auto_response := result.auto_response:
+            logger.info(f"Auto response triggered: {auto_response.name} by {message.author} in {message.channel.name}")
+            await message.channel.send(
+                auto_response.response,
+                reference=message,
+            )
+            return
 
         if not self.bot.user.mentioned_in(message):
             logger.trace("Bot not mentioned in message, ignoring.")
@@ -97,7 +112,7 @@ class AutoResponses(commands.Cog):
         msg_split = message.content.split()
 
         if len(msg_split) >= 2 and msg_split[1].lower() in self.text_commands:
-            logger.trace(f"Ignoring mention with text command: {msg_split[1].lower()}")
+            logger.trace("Ignoring mention with text command: {}", msg_split[1].lower())
             return
 
         logger.info(f"{message.author} ({message.author.id}) mentioned PirateSteve.")
@@ -107,6 +122,34 @@ class AutoResponses(commands.Cog):
             reference=message,
         )
 
+    async def _record_regex_timeout(self, auto_response: AutoResponse) -> None:
+        """
+        Counts a regex trigger overrunning its time budget, disabling the trigger and reporting it to staff once it has
+        overrun too many times.
+
+        :param auto_response: The auto response whose trigger overran.
+        """
+        auto_response.regex_timeouts += 1
+        logger.warning(
+            f"Regex trigger for auto response '{auto_response.name}' overran its time budget "
+            f"({auto_response.regex_timeouts}/{REGEX_STRIKE_LIMIT})."
+        )
+        if auto_response.regex_timeouts < REGEX_STRIKE_LIMIT or auto_response.disabled:
+            return
+
+        await database.disable_auto_response(auto_response.name)
+        self.rebuild_matcher()
+        logger.error(f"Disabled regex trigger for auto response '{auto_response.name}'.")
+
+        steve_says = await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS)
+        send_queue.send(
+            steve_says,
+            content=f"The regex trigger for auto response '{auto_response.name}' took longer than "
+            f"{REGEX_TIME_BUDGET}s on {REGEX_STRIKE_LIMIT} messages and has been disabled. Its `!{auto_response.name}` "
+            f"command still works, edit the trigger with `/booze_list_auto_responses` to re-enable it.\n"
+            f"Trigger: `{auto_response.trigger.pattern}`",
+        )
+
     @app_commands.command(name="booze_create_auto_response", description="Create a new auto response")
     @app_commands.describe(
         name="Name of the auto response",
@@ -141,12 +184,11 @@ class AutoResponses(commands.Cog):
         )
 
         if is_regex:
-            try:
-                re.compile(trigger)
-                logger.debug(f"Regex pattern '{trigger}' validated successfully.")
-            except re.error as e:
-                await interaction.edit_original_response(content=f"Invalid regex pattern: {trigger}. Error: {e}")
+            if reason := await check_regex_trigger(trigger):
+                logger.warning(f"Auto response creation failed: regex pattern '{trigger}' rejected: {reason}")
+                await interaction.edit_original_response(content=f"Regex pattern rejected: {trigger}. {reason}")
                 return
+            logger.debug("Regex pattern '{}' validated successfully.", trigger)
 
         if await database.get_auto_response_by_name(name):
             logger.warning(f"Auto response creation failed: name '{name}' already exists.")
@@ -155,17 +197,9 @@ class AutoResponses(commands.Cog):
 
         await database.add_auto_response(name, trigger, response, is_regex)
 
-        # Add the new auto response to the list
-        self.auto_responses.append(
-            AutoResponse(
-                {
-                    "name": name,
-                    "trigger": trigger,
-                    "is_regex": is_regex,
-                    "response": response,
-                }
-            )
-        )
+        # Add the new auto response to the list, sharing the database's in-memory object
+        self.auto_responses.append(await database.get_auto_response_by_name(name))
+        self.rebuild_matcher()
 
         logger.info(f"Auto response '{name}' created successfully.")
         await interaction.edit_original_response(content=f"Auto response '{name}' created successfully.")
@@ -195,6 +229,7 @@ class AutoResponses(commands.Cog):
 
         # Remove the auto response from the list
         self.auto_responses = [ar for ar in self.auto_responses if ar.name != name]
+        self.rebuild_matcher()
 
         logger.info(f"Auto response '{name}' deleted successfully.")
 
@@ -218,9 +253,14 @@ class AutoResponses(commands.Cog):
             await interaction.edit_original_response(content="No auto responses found.")
             return
 
-        logger.debug(f"Creating embed for {len(self.auto_responses)} auto responses to send to {interaction.user}.")
+        logger.debug("Creating embed for {} auto responses to send to {}.", len(self.auto_responses), interaction.user)
         content = [
-            (ar.name, f"Trigger: {ar.trigger.pattern if ar.is_regex else ar.trigger}") for ar in self.auto_responses
+            (
+                ar.name,
+                f"Trigger: {ar.trigger.pattern if ar.is_regex else ar.trigger}"
+                + (" (disabled)" if ar.disabled else ""),
+            )
+            for ar in self.auto_responses
         ]
 
         async def edit_callback(view: PaginationView, interaction: discord.Interaction, _title: str, index: int):
@@ -230,7 +270,7 @@ class AutoResponses(commands.Cog):
                 f"{interaction.user} ({interaction.user.id}) clicked edit button for auto response: {auto_response.name}"
             )
 
-            modal = EditAutoResponseModal(auto_response, index, view)
+            modal = EditAutoResponseModal(self, auto_response, index, view)
             await interaction.response.send_modal(modal)
 
         view = PaginationView(
@@ -251,10 +291,12 @@ class EditAutoResponseModal(discord.ui.Modal):
 
     response_input: TextInput[BaseView]
     trigger_input: TextInput[BaseView]
+    cog: AutoResponses
     auto_response: AutoResponse
 
-    def __init__(self, auto_response: AutoResponse, auto_response_index: int, view: PaginationView):
+    def __init__(self, cog: AutoResponses, auto_response: AutoResponse, auto_response_index: int, view: PaginationView):
         super().__init__(title=f"Edit Auto Response: {auto_response.name}")
+        self.cog = cog
         self.auto_response = auto_response
         self.view: PaginationView = view
         self.auto_response_index: int = auto_response_index
@@ -296,21 +338,21 @@ class EditAutoResponseModal(discord.ui.Modal):
             return
 
         if self.auto_response.is_regex:
-            try:
-                re.compile(new_trigger)
-                logger.debug(
-                    f"Regex pattern '{new_trigger}' validated successfully for auto response '{self.auto_response.name}'."
-                )
-            except re.error as e:
+            if reason := await check_regex_trigger(new_trigger):
                 logger.warning(
-                    f"Auto response update failed: invalid regex pattern for auto response '{self.auto_response.name}'. Error: {e}"
+                    f"Auto response update failed: regex pattern for auto response '{self.auto_response.name}' rejected: {reason}"
                 )
-                await interaction.followup.send(f"Invalid regex pattern: {new_trigger}. Error: {e}")
+                await interaction.followup.send(f"Regex pattern rejected: {new_trigger}. {reason}")
                 return
+            logger.debug(
+                "Regex pattern '{}' validated successfully for auto response '{}'.",
+                new_trigger,
+                self.auto_response.name,
+            )
 
-        self.auto_response.trigger = new_trigger if not self.auto_response.is_regex else re.compile(new_trigger)
-        self.auto_response.response = new_response
+        # Also re-enables a trigger that was disabled for overrunning its time budget
         await database.update_auto_response(self.auto_response.name, new_trigger, new_response)
+        self.cog.rebuild_matcher()
 
         self.view.content[self.auto_response_index] = (self.auto_response.name, f"Trigger: {new_trigger}")
         await self.view.refresh_page()
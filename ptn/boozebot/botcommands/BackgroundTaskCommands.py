@@ -11,6 +11,8 @@ from ptn_utils.logger.logger import get_logger
 from ptn.boozebot.constants import bot
 from ptn.boozebot.modules.boozeSheetsApi import booze_sheets_api
 from ptn.boozebot.modules.helpers import check_command_channel, check_roles
+from ptn.boozebot.modules.Scheduler import ScheduledJob
+from ptn.boozebot.modules.Startup import CACHE_CARRIERS, startup
 
 logger = get_logger("boozebot.commands.background")
 
@@ -21,10 +23,11 @@ class BackgroundTaskCommands(commands.Cog):
     bot: Bot
     task_choices: Final[list[Choice[str]]] = [
         Choice(name="periodic_stat_update", value="periodic_stat_update"),
-        Choice(name="check_departure_messages_loop", value="check_departure_messages_loop"),
+        Choice(name="departure_scheduler", value="departure_scheduler"),
         Choice(name="public_holiday_loop", value="public_holiday_loop"),
-        Choice(name="last_unload_time_loop", value="last_unload_time_loop"),
+        Choice(name="last_unload_reminder", value="last_unload_reminder"),
         Choice(name="periodic_signup_poll", value="periodic_signup_poll"),
+        Choice(name="carrier_poll", value="carrier_poll"),
     ]
 
     def __init__(self, bot: commands.Bot):
@@ -32,9 +35,11 @@ class BackgroundTaskCommands(commands.Cog):
         self.websocket_started = False
         self.carrier_polling_started = False
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        """Start BoozeSheets background listeners when the bot is ready."""
+    async def cog_load(self):
+        startup.add_warm_up(CACHE_CARRIERS, self._start_booze_sheets)
+
+    async def _start_booze_sheets(self):
+        """Start the BoozeSheets websocket listener, warm the carrier cache and start polling."""
         if not self.websocket_started:
             try:
                 await booze_sheets_api.start_websocket_listener()
@@ -43,13 +48,17 @@ class BackgroundTaskCommands(commands.Cog):
             except Exception as e:
                 logger.exception(f"Failed to start websocket listener: {e}")
 
-        if not self.carrier_polling_started:
-            try:
-                await booze_sheets_api.start_carrier_polling()
-                self.carrier_polling_started = True
-                logger.info("BoozeSheets carrier polling loop started")
-            except Exception as e:
-                logger.exception(f"Failed to start carrier polling loop: {e}")
+        try:
+            await booze_sheets_api.warm_up()
+        finally:
+            # Polling refreshes the cache straight away if the warm-up failed
+            if not self.carrier_polling_started:
+                try:
+                    await booze_sheets_api.start_carrier_polling()
+                    self.carrier_polling_started = True
+                    logger.info("BoozeSheets carrier polling loop started")
+                except Exception as e:
+                    logger.exception(f"Failed to start carrier polling loop: {e}")
 
     @app_commands.command(name="start_task", description="Starts a background task.")
     @check_roles([*any_moderation_role, ROLE_SOMM, *any_council_role])
@@ -61,9 +70,9 @@ class BackgroundTaskCommands(commands.Cog):
 
         task = self.get_task(task_name)
         if task:
-            logger.debug(f"Found task {task_name}")
+            logger.debug("Found task {}", task_name)
             if not task.is_running():
-                logger.debug(f"Starting task {task_name}")
+                logger.debug("Starting task {}", task_name)
                 task.start()
                 logger.info(f"Task {task_name} started successfully")
                 await interaction.response.send_message(f"Started task: {task_name}")
@@ -84,9 +93,9 @@ class BackgroundTaskCommands(commands.Cog):
 
         task = self.get_task(task_name)
         if task:
-            logger.debug(f"Found task {task_name}")
+            logger.debug("Found task {}", task_name)
             if task.is_running():
-                logger.debug(f"Stopping task {task_name}")
+                logger.debug("Stopping task {}", task_name)
                 task.cancel()
                 logger.info(f"Task {task_name} stopped successfully")
                 await interaction.response.send_message(f"Stopped task: {task_name}.")
@@ -110,9 +119,10 @@ class BackgroundTaskCommands(commands.Cog):
         if not task:
             logger.error(f"Task {task_name} not found.")
             await interaction.response.send_message(f"Task {task_name} not found.", ephemeral=True)
+            return
 
         last_run_time = getattr(task, "last_run_time", None)
-        logger.debug(f"Task {task_name} last run time: {last_run_time}")
+        logger.debug("Task {} last run time: {}", task_name, last_run_time)
         if last_run_time:
             unix_timestamp = int(last_run_time.timestamp())
             last_run_str = f"at <t:{unix_timestamp}:f> (<t:{unix_timestamp}:R>)"
@@ -120,28 +130,47 @@ class BackgroundTaskCommands(commands.Cog):
             last_run_str = "never"
 
         next_run_time = getattr(task, "next_iteration", None)
-        logger.debug(f"Task {task_name} next run time: {next_run_time}")
-        if task.is_running():
+        logger.debug("Task {} next run time: {}", task_name, next_run_time)
+        if task.is_running() and next_run_time:
             next_run_unix = int(next_run_time.timestamp())
             next_run_str = f", next at <t:{next_run_unix}:f> (<t:{next_run_unix}:R>)"
         else:
             next_run_str = ""
 
         status = "running" if task.is_running() else "stopped"
-        logger.debug(f"Task {task_name} is {status}, last run {last_run_str}{next_run_str}")
-        await interaction.response.send_message(
-            f"Task {task_name} is currently {status}, last run was {last_run_str}{next_run_str}."
+        logger.debug("Task {} is {}, last run {}{}", task_name, status, last_run_str, next_run_str)
+        message = f"Task {task_name} is currently {status}, last run was {last_run_str}{next_run_str}."
+        if isinstance(task, ScheduledJob):
+            message += self._format_job_stats(task)
+        await interaction.response.send_message(message)
+
+    @staticmethod
+    def _format_job_stats(job: ScheduledJob) -> str:
+        """
+        :param job: The scheduled job.
+        :returns: The job's interval and recent run stats, as lines to append to the task status.
+        """
+        lines = f"\nInterval: {job.current_interval:.0f}s (base {job.interval:.0f}s)"
+        stats = job.stats()
+        if stats is None:
+            return lines
+        return (
+            lines
+            + f"\nLast {stats.runs} run(s): {stats.failures} failed, {stats.overlaps} skipped while still running"
+            + f"\nDuration: mean {stats.mean_duration:.2f}s, max {stats.max_duration:.2f}s"
+            + f"\nStart lag: mean {stats.mean_lag:.2f}s, max {stats.max_lag:.2f}s"
         )
 
     def get_task(self, task_name: str):
         tasks = {
             "periodic_stat_update": bot.get_cog("Statistics").periodic_stat_update,
-            "check_departure_messages_loop": bot.get_cog("Departures").check_departure_messages_loop,
+            "departure_scheduler": bot.get_cog("Departures").departure_scheduler,
             "public_holiday_loop": bot.get_cog("PublicHoliday").public_holiday_loop,
-            "last_unload_time_loop": bot.get_cog("Unloading").last_unload_time_loop,
+            "last_unload_reminder": bot.get_cog("Unloading").last_unload_reminder,
             "periodic_signup_poll": bot.get_cog("MakeWineCarrier").booze_tracker_signup_check,
+            "carrier_poll": booze_sheets_api.carrier_poll,
         }
-        logger.debug(f"Retrieving task {task_name} from available tasks: {list(tasks.keys())}")
+        logger.debug("Retrieving task {} from available tasks: {}", task_name, list(tasks))
         return tasks.get(task_name)
 
     @app_commands.command(
@@ -160,7 +189,7 @@ class BackgroundTaskCommands(commands.Cog):
 
         if connection_type == "websocket":
             ws_status, last_message_time = booze_sheets_api.get_websocket_status()
-            logger.debug(f"BoozeSheets API websocket status: {ws_status}")
+            logger.debug("BoozeSheets API websocket status: {}", ws_status)
 
             discord_timestamp = f"<t:{int(last_message_time.timestamp())}:R>" if last_message_time else "N/A"
             await interaction.response.send_message(
@@ -170,7 +199,10 @@ class BackgroundTaskCommands(commands.Cog):
 
         poll_status, last_refresh_time, cache_size = booze_sheets_api.get_carrier_poll_status()
         logger.debug(
-            f"BoozeSheets carrier polling status: {poll_status}, last_refresh={last_refresh_time}, cache_size={cache_size}"
+            "BoozeSheets carrier polling status: {}, last_refresh={}, cache_size={}",
+            poll_status,
+            last_refresh_time,
+            cache_size,
         )
 
         discord_timestamp = f"<t:{int(last_refresh_time.timestamp())}:R>" if last_refresh_time else "N/A"
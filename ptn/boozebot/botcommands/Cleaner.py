@@ -3,6 +3,8 @@ Cog for all the commands related to
 
 """
 
+import asyncio
+from contextlib import suppress
 from datetime import UTC, datetime
 
 import discord
@@ -27,9 +29,13 @@ from ptn_utils.global_constants import (
 from ptn_utils.logger.logger import get_logger
 
 from ptn.boozebot.constants import BC_STATUS, BLURB_KEYS, BLURBS, WCO_ROLE_ICON_URL, bot
+from ptn.boozebot.database.database import database
 from ptn.boozebot.modules.boozeSheetsApi import booze_sheets_api
+from ptn.boozebot.modules.BulkRoles import BulkRoleRemoval
 from ptn.boozebot.modules.helpers import check_command_channel, check_roles
+from ptn.boozebot.modules.PermissionBatch import PermissionBatchResult, PermissionUpdate, apply_permission_batch
 from ptn.boozebot.modules.Settings import settings
+from ptn.boozebot.modules.Startup import startup
 from ptn.boozebot.modules.Views import ConfirmView
 
 """
@@ -47,48 +53,68 @@ CLEANER COMMANDS
 logger = get_logger("boozebot.commands.cleaner")
 
 
-async def _mass_remove_role(interaction: discord.Interaction, role: discord.Role) -> int:
-    removed_count = 0
-    logger.info(f"Removing {role} from all members.")
-    for member in role.members:
-        logger.debug(f"Removing {role} from member: {member.name}")
-        try:
-            await member.remove_roles(role)
-            removed_count += 1
-            logger.debug(f"Removed {role} from member: {member.name}")
-        except Exception as e:
-            logger.exception(f"Unable to remove {role} from {member}: {e}")
-            await interaction.channel.send(f"Unable to remove {role} from {member}")
-    return removed_count
-
-
 class Cleaner(commands.Cog):
     bot: Bot
+    bulk_role_tasks: set[asyncio.Task[None]]
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.bulk_role_tasks = set()
         logger.info("Initializing Cleaner cog.")
         self.init_blurbs()
 
+    async def cog_load(self):
+        startup.add_warm_up("bulk role removals", self._resume_bulk_role_removals)
+
+    async def _resume_bulk_role_removals(self):
+        for operation in await BulkRoleRemoval.load_unfinished():
+            logger.info(f"Resuming bulk role removal with status message {operation.status_message.id}")
+            self._run_bulk_role_removal(operation)
+
+    def _run_bulk_role_removal(self, operation: BulkRoleRemoval) -> asyncio.Task[None]:
+        task = asyncio.create_task(operation.run())
+        self.bulk_role_tasks.add(task)
+        task.add_done_callback(self.bulk_role_tasks.discard)
+        return task
+
     @staticmethod
     def init_blurbs():
         # Ensure all blurb files exist
         logger.info("Initializing blurb files if they do not exist.")
         for blurb in BLURBS.values():
-            logger.debug(f"Checking blurb file at: {blurb['file_path']}")
+            logger.debug("Checking blurb file at: {}", blurb["file_path"])
             if not blurb["file_path"].is_file():
                 logger.info(f"Blurb file not found. Creating default at: {blurb['file_path']}")
                 blurb["file_path"].parent.mkdir(parents=True, exist_ok=True)
                 blurb["file_path"].write_text(blurb["default_text"], encoding="utf-8")
-                logger.debug(f"Default blurb file created at: {blurb['file_path']}")
+                logger.debug("Default blurb file created at: {}", blurb["file_path"])
             else:
-                logger.debug(f"Blurb file already exists at: {blurb['file_path']}")
+                logger.debug("Blurb file already exists at: {}", blurb["file_path"])
         logger.info("Blurb file initialization complete.")
 
     """
     This class handles role and channel cleanup after a cruise, as well as opening channels in preparation for a cruise.
     """
 
+    @staticmethod
+    def _add_permission_batch_fields(
+        embed: discord.Embed, batch: PermissionBatchResult, success_name: str, failure_name: str
+    ) -> None:
+        """
+        Adds one field per channel in a permission batch to an embed, with the batch's wall time in the footer.
+
+        :param embed: The embed to add the fields to.
+        :param batch: The result of the permission batch.
+        :param success_name: The field name for channels updated successfully.
+        :param failure_name: The field name for channels that failed to update.
+        """
+        for result in batch.results:
+            if result.success:
+                embed.add_field(name=success_name, value=f"<#{result.channel_id}>", inline=False)
+            else:
+                embed.add_field(name=failure_name, value=f"<#{result.channel_id}>: {result.error}", inline=False)
+        embed.set_footer(text=f"Updated {len(batch.results)} channels in {batch.elapsed:.2f}s")
+
     @app_commands.command(name="booze_channels_open", description="Opens the Booze Cruise channels to the public.")
     @check_roles([*any_council_role, ROLE_SOMM, *any_moderation_role])
     @check_command_channel([CHANNEL_BC_STEVE_SAYS])
@@ -131,18 +157,12 @@ class Cleaner(commands.Cog):
             await booze_sheets_api.update_cruise_state("prep")
 
             logger.info("Opening Booze Cruise channels to the public.")
-            for channel_id, role in channels.items():
-                channel = await bot.get_or_fetch.channel(channel_id)
-                logger.debug(f"Setting permissions for channel ID: {channel_id} and role: {role.name}")
-                try:
-                    overwrite = channel.overwrites_for(role)
-                    overwrite.view_channel = True  # less confusing alias for read_messages
-                    await channel.set_permissions(role, overwrite=overwrite)
-                    embed.add_field(name="Opened", value="<#" + str(channel_id) + ">", inline=False)
-                    logger.debug(f"Channel ID: {channel_id} opened successfully for role: {role.name}")
-                except Exception as e:
-                    logger.exception(f"Failed to open channel ID: {channel_id} for role: {role.name}: {e}")
-                    embed.add_field(name="FAILED to open", value="<#" + str(channel_id) + f">: {e}", inline=False)
+            # view_channel is a less confusing alias for read_messages
+            batch = await apply_permission_batch(
+                [PermissionUpdate(channel_id, role, {"view_channel": True}) for channel_id, role in channels.items()],
+                scope="booze_channels_open",
+            )
+            self._add_permission_batch_fields(embed, batch, "Opened", "FAILED to open")
 
             await interaction.edit_original_response(
                 content=f"<@&{ROLE_SOMM}> Avast! We're ready to set sail!", embed=embed, view=None
@@ -194,17 +214,11 @@ class Cleaner(commands.Cog):
 
             logger.info("Closing Booze Cruise channels to the public.")
 
-            for channel_id, role in channels.items():
-                channel = await bot.get_or_fetch.channel(channel_id)
-                logger.debug(f"Setting permissions for channel ID: {channel_id} and role: {role.name}")
-                try:
-                    overwrite = channel.overwrites_for(role)
-                    overwrite.view_channel = False  # less confusing alias for read_messages
-                    await channel.set_permissions(role, overwrite=overwrite)
-                    embed.add_field(name="Closed", value="<#" + str(channel_id) + ">", inline=False)
-                except Exception as e:
-                    logger.exception(f"Failed to close channel ID: {channel_id} for role: {role.name}: {e}")
-                    embed.add_field(name="FAILED to close", value="<#" + str(channel_id) + f">: {e}", inline=False)
+            batch = await apply_permission_batch(
+                [PermissionUpdate(channel_id, role, {"view_channel": False}) for channel_id, role in channels.items()],
+                scope="booze_channels_close",
+            )
+            self._add_permission_batch_fields(embed, batch, "Closed", "FAILED to close")
 
             logger.info("Updating status embed to 'bc_end'.")
             await self.update_status_embed("bc_end")
@@ -261,26 +275,26 @@ class Cleaner(commands.Cog):
             hitch_role = await bot.get_or_fetch.role(ROLE_HITCHHIKER)
             ptnrpphtms_role = await bot.get_or_fetch.role(ROLE_PTNRPPHTMS)
 
-            await interaction.edit_original_response(
-                content="Removing roles, This may take a minute...", embed=None, view=None
-            )
             logger.debug("Beginning role removal process.")
 
             try:
-                wine_count = await _mass_remove_role(interaction, wine_carrier_role)
-                hitch_count = await _mass_remove_role(interaction, hitch_role)
-                ptnrpphtms_count = await _mass_remove_role(interaction, ptnrpphtms_role)
-
-                logger.info(
-                    f"Role removal process completed successfully. Removed {hitch_count} Hitchhiker roles, {wine_count} Wine Carrier roles, and {ptnrpphtms_count} PTNRPPHTMS roles."
+                # Progress is reported on a channel message, as the removal can outlive the interaction token
+                operation = await BulkRoleRemoval.start(
+                    [hitch_role, wine_carrier_role, ptnrpphtms_role], interaction.channel
                 )
                 await interaction.edit_original_response(
-                    content=f"Successfully removed {hitch_count} users from the Hitchhiker role.\n"
-                    + f"Successfully removed {wine_count} users from the Wine Carrier role.\n"
-                    + f"Successfully removed {ptnrpphtms_count} users from the PTNRPPHTMS role.",
+                    content=f"Removing roles, This may take a minute... Progress: {operation.status_message.jump_url}",
                     embed=None,
                     view=None,
                 )
+                await self._run_bulk_role_removal(operation)
+
+                logger.info(f"Role removal process completed. Removed: {operation.removed}")
+                with suppress(discord.HTTPException):
+                    # The interaction token expires after 15 minutes, the status message holds the result regardless
+                    await interaction.edit_original_response(
+                        content=f"Role removal complete, see {operation.status_message.jump_url}", embed=None, view=None
+                    )
             except Exception as e:
                 logger.exception(f"Clear roles command failed: {e}")
                 await interaction.channel.send("Clear roles command failed. Contact admin.")
@@ -323,7 +337,7 @@ class Cleaner(commands.Cog):
         def check(response: discord.Message) -> bool:
             valid = response.author == interaction.user and response.channel == interaction.channel
             if not valid:
-                logger.debug(f"Ignored message from {response.author.name} in channel {response.channel.name}.")
+                logger.debug("Ignored message from {} in channel {}.", response.author.name, response.channel.name)
             return valid
 
         try:
@@ -341,9 +355,9 @@ class Cleaner(commands.Cog):
         if message:
             logger.info(f"Received new {blurb} message from user {interaction.user.name}.")
             # Now try to replace the contents
-            logger.debug(f"Old {blurb} message: {blurb_message}")
-            logger.debug(f"New {blurb} message: {message.content.strip()}")
-            logger.debug(f"Writing new {blurb} message to file: {BLURBS[blurb]['file_path']}")
+            logger.debug("Old {} message: {}", blurb, blurb_message)
+            logger.debug("New {} message: {}", blurb, message.content.strip())
+            logger.debug("Writing new {} message to file: {}", blurb, BLURBS[blurb]["file_path"])
             BLURBS[blurb]["file_path"].write_text(message.content.strip())
             embed = discord.Embed(description=message.content)
             if blurb == "wco_welcome":
@@ -399,19 +413,37 @@ class Cleaner(commands.Cog):
 
     @classmethod
     async def update_status_embed(cls, status: BC_STATUS):
-        logger.debug(f"Updating status embed to: {status}")
+        """
+        Shows the blurb for a cruise status in the wine status channel. The bot's status message is edited in place
+        where possible, otherwise the channel is cleared and a new status message is posted.
+
+        :param BC_STATUS status: The cruise status to show.
+        """
+        logger.debug("Updating status embed to: {}", status)
         channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_STATUS)
-        async for message in channel.history():
-            logger.debug(f"Checking message ID: {message.id} for deletion.")
-            if message.author == bot.user or not message.pinned:
-                await message.delete()
-                logger.debug(f"Deleted message ID: {message.id}")
 
         if not BLURBS[status]["file_path"].is_file():
             logger.warning(f"Blurb file for status '{status}' not found. Initializing blurb files.")
             cls.init_blurbs()
         blurb_message = BLURBS[status]["file_path"].read_text()
         blurb_message += f"\n\n-# Updated: <t:{int(datetime.now(UTC).timestamp())}:F>"
-        embed_colour = BLURBS[status]["embed_colour"]
-        await channel.send(embed=discord.Embed(description=blurb_message, colour=embed_colour))
-        logger.debug(f"Sent new status embed for status: {status}")
+        embed = discord.Embed(description=blurb_message, colour=BLURBS[status]["embed_colour"])
+
+        if status_message_id := await database.get_status_message_id():
+            try:
+                await channel.get_partial_message(status_message_id).edit(embed=embed)
+                logger.debug("Edited status message ID: {} in place for status: {}", status_message_id, status)
+                return
+            except discord.NotFound:
+                logger.info(f"Status message ID: {status_message_id} no longer exists, posting a new one.")
+
+        # purge bulk deletes messages younger than 14 days and falls back to single deletes for older ones
+        deleted = await channel.purge(
+            check=lambda message: message.author == bot.user or not message.pinned,
+            reason="Replacing the booze cruise status embed",
+        )
+        logger.debug("Purged {} messages from the status channel.", len(deleted))
+
+        message = await channel.send(embed=embed)
+        await database.set_status_message_id(message.id)
+        logger.debug("Sent new status embed for status: {}", status)
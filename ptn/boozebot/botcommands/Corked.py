@@ -3,15 +3,15 @@ Cog for all the commands related to
 
 """
 
+import asyncio
 from pathlib import Path
 from typing import TYPE_CHECKING, cast
 
 import discord
-from discord import Embed, PermissionOverwrite, app_commands
+from discord import Embed, app_commands
 from discord.ext import commands
 from discord.ext.commands import Bot
 from ptn_utils.global_constants import (
-    CHANNEL_BC_BOOZE_CRUISE_CHAT,
     CHANNEL_BC_BOOZE_CRUISE_SIGNUPS,
     CHANNEL_BC_BOOZE_GUIDE,
     CHANNEL_BC_PUBLIC,
@@ -19,6 +19,7 @@ from ptn_utils.global_constants import (
     CHANNEL_BC_WINE_CARRIER_GUIDE,
     CHANNEL_BC_WINE_STATUS,
     DATA_DIR,
+    DISCORD_GUILD,
     EMBED_COLOUR_EVIL,
     EMBED_COLOUR_EXPIRED,
     EMBED_COLOUR_OK,
@@ -33,6 +34,13 @@ from ptn.boozebot.classes.CorkedUser import CorkedUser
 from ptn.boozebot.constants import bot
 from ptn.boozebot.database.database import database
 from ptn.boozebot.modules.helpers import check_command_channel, check_roles
+from ptn.boozebot.modules.PermissionBatch import (
+    PermissionBatchResult,
+    PermissionResult,
+    PermissionUpdate,
+    apply_permission_batch,
+)
+from ptn.boozebot.modules.Startup import startup
 from ptn.boozebot.modules.Views import ConfirmView
 
 if TYPE_CHECKING:
@@ -48,6 +56,11 @@ CLEANER COMMANDS
 
 logger = get_logger("boozebot.commands.corked")
 
+# Discord accepts at most 100 user IDs per gateway member request
+MEMBER_QUERY_CHUNK_SIZE = 100
+# How often a manual rebuild edits its response with progress
+CORK_REBUILD_PROGRESS_INTERVAL = 5.0
+
 
 def _build_failed_cork_embed(failed_users: list[tuple[int, str]]) -> Embed:
     try:
@@ -63,6 +76,10 @@ def _build_failed_cork_embed(failed_users: list[tuple[int, str]]) -> Embed:
     return embed
 
 
+def _format_permission_failures(batch: PermissionBatchResult) -> str:
+    return "\n".join(f"- <#{result.channel_id}>: {result.error}" for result in batch.failures)
+
+
 class Corked(commands.Cog):
     bot: Bot
 
@@ -81,23 +98,22 @@ class Corked(commands.Cog):
     This class handles corking and uncorking users
     """
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        try:
-            logger.info("Rebuilding corked permissions on startup.")
-            corked_users = await database.get_corked_users()
-            failed_users = await self._booze_rebuild_corked_perms(corked_users)
-            if failed_users:
-                embed = _build_failed_cork_embed(failed_users)
-                steve_says = cast("TextChannel", await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS))
-                await steve_says.send(embed=embed)
-        except Exception as e:
-            logger.exception(e)
+    async def cog_load(self):
+        startup.add_warm_up("corked permissions", self._rebuild_corked_perms_on_startup)
+
+    async def _rebuild_corked_perms_on_startup(self):
+        logger.info("Rebuilding corked permissions on startup.")
+        corked_users = await database.get_corked_users()
+        failed_users = await self._booze_rebuild_corked_perms(corked_users)
+        if failed_users:
+            embed = _build_failed_cork_embed(failed_users)
+            steve_says = cast("TextChannel", await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS))
+            await steve_says.send(embed=embed)
 
     @commands.Cog.listener()
     async def on_member_join(self, member: discord.Member):
         try:
-            logger.debug(f"Member joined: {member.display_name} ({member.name}/{member.id})")
+            logger.debug("Member joined: {} ({}/{})", member.display_name, member.name, member.id)
             if await database.is_user_corked(member.id):
                 logger.info(f"Found Corked user joining the server: {member.display_name} ({member.name}/{member.id})")
                 steve_says = cast("TextChannel", await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS))
@@ -119,7 +135,7 @@ class Corked(commands.Cog):
     @commands.Cog.listener()
     async def on_member_remove(self, member: discord.Member):
         try:
-            logger.debug(f"Member left: {member.display_name} ({member.name}/{member.id})")
+            logger.debug("Member left: {} ({}/{})", member.display_name, member.name, member.id)
             if await database.is_user_corked(member.id):
                 logger.info(f"Found Corked user leaving the server: {member.display_name} ({member.name}/{member.id})")
                 steve_says = await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS)
@@ -156,31 +172,28 @@ class Corked(commands.Cog):
             await interaction.followup.send(f"User {user.mention} ({user.name}) is already corked.")
             return
 
-        overwrite = PermissionOverwrite()
-        overwrite.view_channel = False
-
         logger.info(f"Corking user {user} from booze cruise channels.")
-        try:
-            for channel_id in self.CORK_CHANNELS:
-                logger.debug(f"Setting permissions for user {user} in channel ID {channel_id}.")
-                channel = await bot.get_or_fetch.channel(channel_id)
-                await channel.set_permissions(
-                    user, overwrite=overwrite, reason="User corked from booze cruise channels"
-                )
-
-            logger.info(f"User {user} successfully corked from booze cruise channels.")
-
-        except discord.DiscordException as e:
-            logger.exception(f"Error corking user {user}: {e}")
-            await interaction.followup.send("Failed to cork user due to a Discord error.")
+        batch = await apply_permission_batch(
+            [PermissionUpdate(channel_id, user, {"view_channel": False}) for channel_id in self.CORK_CHANNELS],
+            reason="User corked from booze cruise channels",
+            scope="booze_admin_cork",
+        )
+        if batch.failures:
+            logger.error(f"Error corking user {user} in {len(batch.failures)} channel(s).")
+            await interaction.followup.send(
+                f"Failed to cork user due to a Discord error in:\n{_format_permission_failures(batch)}"
+            )
             return
 
+        logger.info(f"User {user} successfully corked from booze cruise channels in {batch.elapsed:.2f}s.")
+
         await database.add_corked_user(user.id)
 
         logger.info(f"User {user} has been successfully corked.")
 
         await interaction.followup.send(
-            f"User {user.mention} ({user.name}) has been corked from the booze cruise channels."
+            f"User {user.mention} ({user.name}) has been corked from the booze cruise channels "
+            f"({len(batch.results)} channels in {batch.elapsed:.2f}s)."
         )
 
     @app_commands.command(name="booze_admin_uncork", description="Uncork a user from the booze cruise channels")
@@ -205,24 +218,26 @@ class Corked(commands.Cog):
             return
 
         logger.info(f"Uncorking user {user} from booze cruise channels.")
-        try:
-            for channel_id in self.CORK_CHANNELS:
-                logger.debug(f"Removing permissions for user {user} in channel ID {channel_id}.")
-                channel = await bot.get_or_fetch.channel(channel_id)
-                await channel.set_permissions(user, overwrite=None, reason="User uncorked for booze cruise channels")
-
-            logger.info(f"User {user} successfully uncorked from booze cruise channels.")
-
-        except discord.DiscordException as e:
-            logger.exception(f"Error uncorking user {user}: {e}")
-            await interaction.followup.send("Failed to uncork user due to a Discord error.")
+        batch = await apply_permission_batch(
+            [PermissionUpdate(channel_id, user, None) for channel_id in self.CORK_CHANNELS],
+            reason="User uncorked for booze cruise channels",
+            scope="booze_admin_uncork",
+        )
+        if batch.failures:
+            logger.error(f"Error uncorking user {user} in {len(batch.failures)} channel(s).")
+            await interaction.followup.send(
+                f"Failed to uncork user due to a Discord error in:\n{_format_permission_failures(batch)}"
+            )
             return
 
+        logger.info(f"User {user} successfully uncorked from booze cruise channels in {batch.elapsed:.2f}s.")
+
         await database.remove_corked_user(user.id)
 
         logger.info(f"User {user} has been successfully uncorked.")
         await interaction.followup.send(
-            f"User {user.mention} ({user.name}) has been uncorked from the booze cruise channels."
+            f"User {user.mention} ({user.name}) has been uncorked from the booze cruise channels "
+            f"({len(batch.results)} channels in {batch.elapsed:.2f}s)."
         )
 
     @app_commands.command(name="booze_admin_list_corked", description="List all corked users")
@@ -247,7 +262,7 @@ class Corked(commands.Cog):
             return
 
         for corked_user in corked_users:
-            logger.debug(f"Corked User - ID: {corked_user.user_id}, Timestamp: {corked_user.timestamp}")
+            logger.debug("Corked User - ID: {}, Timestamp: {}", corked_user.user_id, corked_user.timestamp)
 
         corked_user_data = [
             (
@@ -257,7 +272,7 @@ class Corked(commands.Cog):
             for corked_user in corked_users
             if (await corked_user.get_member()) is not None
         ]
-        logger.debug(f"Prepared corked user data for pagination: {corked_user_data}")
+        logger.debug("Prepared corked user data for pagination: {}", corked_user_data)
 
         logger.info("Creating pagination for corked users.")
 
@@ -265,38 +280,97 @@ class Corked(commands.Cog):
         message = await interaction.edit_original_response(view=view)
         view.message = message
 
-    async def _booze_rebuild_corked_perms(self, corked_users: list[CorkedUser]) -> list[tuple[int, str]]:
-        failed_users = []
+    async def _resolve_corked_members(self, user_ids: list[int]) -> dict[int, discord.Member]:
+        """
+        Resolves corked users to guild members, from the member cache where possible and otherwise with chunked
+        gateway member requests rather than one REST call per user.
 
-        # ASSUMPTION: presence of overwrites in BC chat is an acceptable indicator for whether a user is still corked
-        channel_chat = cast("TextChannel", await bot.get_or_fetch.channel(CHANNEL_BC_BOOZE_CRUISE_CHAT))
-        active_corks = [key.id for key in channel_chat.overwrites if not isinstance(key, discord.Role)]
-        for corked_user in corked_users:
-            if int(corked_user.user_id) not in active_corks:
-                logger.info(
-                    f"corked_user id: {corked_user.user_id}, active corks: {active_corks}, in active corks: {corked_user.user_id in active_corks}"
-                )
-                user = await bot.get_or_fetch.member(corked_user.user_id)
-                if user is None:
-                    logger.warning(f"Could not find member with ID {corked_user.user_id}, skipping.")
-                    failed_users.append((corked_user.user_id, "User not found"))
-                    continue
-                overwrite = PermissionOverwrite()
-                overwrite.view_channel = False
-                channel_id = -1
-                try:
-                    for channel_id in self.CORK_CHANNELS:
-                        logger.debug(f"Setting permissions for corked user {user} in channel ID {channel_id}.")
-                        channel = await bot.get_or_fetch.channel(channel_id)
-                        await channel.set_permissions(user, overwrite=overwrite, reason="Rebuilding corked permissions")
-                except discord.DiscordException as e:
-                    logger.exception(f"Error setting permissions for user {user} in channel ID {channel_id}: {e}")
-                    failed_users.append((corked_user.user_id, str(e)))
-            else:
-                logger.debug(f"Skipping user {corked_user.user_id} as their cork appears to remain intact.")
+        :param user_ids: The IDs of the corked users.
+        :returns: The members found, by user ID. Users no longer in the guild are left out.
+        """
+        guild = await bot.get_or_fetch.guild(DISCORD_GUILD)
+        members = {user_id: member for user_id in user_ids if (member := guild.get_member(user_id)) is not None}
+        missing = [user_id for user_id in user_ids if user_id not in members]
+        logger.debug("Resolved {} corked members from cache, querying {} from the gateway.", len(members), len(missing))
+
+        for start in range(0, len(missing), MEMBER_QUERY_CHUNK_SIZE):
+            chunk = missing[start : start + MEMBER_QUERY_CHUNK_SIZE]
+            try:
+                for member in await guild.query_members(user_ids=chunk, limit=len(chunk)):
+                    members[member.id] = member
+            except TimeoutError:
+                logger.warning(f"Timed out querying {len(chunk)} corked members from the gateway.")
+
+        return members
+
+    async def _booze_rebuild_corked_perms(
+        self, corked_users: list[CorkedUser], interaction: discord.Interaction | None = None
+    ) -> list[tuple[int, str]]:
+        """
+        Reapplies any cork overwrites that are missing from the cork channels.
+
+        :param corked_users: The corked users from the database.
+        :param interaction: If given, its response is edited with the rebuild progress.
+        :returns: The users whose corks could not be rebuilt, with the reason.
+        """
+        failed_users: list[tuple[int, str]] = []
+
+        user_ids = [int(corked_user.user_id) for corked_user in corked_users]
+        members = await self._resolve_corked_members(user_ids)
+        for user_id in user_ids:
+            if user_id not in members:
+                logger.warning(f"Could not find member with ID {user_id}, skipping.")
+                failed_users.append((user_id, "User not found"))
+
+        channels = [await bot.get_or_fetch.channel(channel_id) for channel_id in self.CORK_CHANNELS]
+        updates = [
+            PermissionUpdate(channel.id, member, {"view_channel": False})
+            for member in members.values()
+            for channel in channels
+            if channel.overwrites_for(member).view_channel is not False
+        ]
+        logger.info(
+            f"Found {len(updates)} missing cork overwrite(s) across {len(channels)} channels "
+            f"for {len(members)} corked members."
+        )
+        if not updates:
+            return failed_users
+
+        completed: list[PermissionResult] = []
+        progress_task = None
+        if interaction is not None:
+            progress_task = asyncio.create_task(self._report_rebuild_progress(interaction, completed, len(updates)))
+        try:
+            batch = await apply_permission_batch(
+                updates, reason="Rebuilding corked permissions", scope="corked_rebuild", on_result=completed.append
+            )
+        finally:
+            if progress_task is not None:
+                progress_task.cancel()
+
+        errors: dict[int, list[str]] = {}
+        for update, result in zip(updates, batch.results, strict=True):
+            if not result.success:
+                errors.setdefault(update.target.id, []).append(f"<#{result.channel_id}>: {result.error}")
+        failed_users.extend((user_id, ", ".join(channel_errors)) for user_id, channel_errors in errors.items())
 
         return failed_users
 
+    @staticmethod
+    async def _report_rebuild_progress(
+        interaction: discord.Interaction, completed: list[PermissionResult], total: int
+    ) -> None:
+        while True:
+            await asyncio.sleep(CORK_REBUILD_PROGRESS_INTERVAL)
+            failures = sum(not result.success for result in completed)
+            try:
+                await interaction.edit_original_response(
+                    content=f"Rebuilding corked permissions... {len(completed)}/{total} overwrites applied"
+                    + (f", {failures} failed." if failures else ".")
+                )
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to report corked permission rebuild progress: {e}")
+
     @app_commands.command(
         name="booze_admin_rebuild_corked_perms", description="Rebuild corked permissions for all corked users"
     )
@@ -346,7 +420,7 @@ class Corked(commands.Cog):
             content="Rebuilding corked permissions. This may take a while.", embed=None, view=None
         )
 
-        failed_users = await self._booze_rebuild_corked_perms(corked_users)
+        failed_users = await self._booze_rebuild_corked_perms(corked_users, interaction)
 
         if failed_users:
             logger.info(f"Rebuilding corked permissions completed with {len(failed_users)} failures.")
@@ -3,7 +3,12 @@ Cog for departure related commands
 
 """
 
+import asyncio
+import contextlib
+import heapq
+import re
 import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from typing import Any, Final, Literal, override
@@ -11,7 +16,7 @@ from typing import Any, Final, Literal, override
 import discord
 from discord import app_commands, ui
 from discord.app_commands import Choice, describe
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ext.commands import Bot
 from ptn_utils.global_constants import (
     CHANNEL_BC_DEPARTURE_ANNOUNCEMENT,
@@ -36,9 +41,10 @@ from ptn.boozebot.modules.helpers import (
     check_command_channel,
     check_roles,
     is_staff,
-    track_last_run,
 )
+from ptn.boozebot.modules.SendQueue import SendPriority, send_queue
 from ptn.boozebot.modules.Settings import settings
+from ptn.boozebot.modules.Startup import startup
 from ptn.boozebot.modules.Views import ConfirmView, DynamicButton
 
 """
@@ -48,6 +54,15 @@ DEPARTURE COMMANDS
 
 logger = get_logger("boozebot.commands.departures")
 
+# Owners are reminded this long after their scheduled departure time
+DEPARTURE_GRACE_PERIOD = 10 * 60
+# Thoon departures are assumed to leave this long after the notice is posted
+THOON_DEPARTURE_DELAY = 25 * 60
+# A reminder that fails to send is retried this long after the failure, until it is sent
+DEPARTURE_RETRY_INTERVAL = 5 * 60
+# The departure time in a scheduled departure notice
+DEPARTURE_TIMESTAMP_RE = re.compile(r"<t:(\d+)")
+
 
 class DepartureOperationError(Exception):
     """Raised when a departure operation cannot be posted or closed."""
@@ -67,13 +82,145 @@ class DepartureCloseResult:
     message_id: int
 
 
+async def _legacy_departure_time(message_id: int) -> int:
+    """
+    Works out the departure time of a notice posted before departure times were stored.
+
+    :param message_id: The discord message ID of the departure notice.
+    :returns: The time in the notice, or THOON_DEPARTURE_DELAY after it was posted for a thoon departure, as a unix
+        timestamp.
+    """
+    posted_at = int(discord.utils.snowflake_time(message_id).timestamp())
+    departure_channel = await bot.get_or_fetch.channel(CHANNEL_BC_DEPARTURE_ANNOUNCEMENT)
+    try:
+        message = await departure_channel.fetch_message(message_id)
+    except discord.NotFound:
+        # The reminder finds the notice deleted and removes it from the database
+        return posted_at + THOON_DEPARTURE_DELAY
+
+    if match := DEPARTURE_TIMESTAMP_RE.search(message.content):
+        return int(match[1])
+    return posted_at + THOON_DEPARTURE_DELAY
+
+
+class DepartureScheduler:
+    """
+    Fires overdue departure reminders at their due time from an in-memory min-heap.
+
+    Pending departures are loaded from the database when started, and new ones are pushed as they are posted.
+    Departures posted before departure times were stored get their time worked out from the notice and saved.
+    Entries are not removed when a departure is closed; the callback checks the database and skips stale ones. A
+    reminder whose callback raises is pushed back on the heap and retried every DEPARTURE_RETRY_INTERVAL seconds.
+    Exposes the same start/cancel/is_running/next_iteration surface as a tasks.loop so it can be managed by the
+    background task commands.
+    """
+
+    last_run_time: datetime | None
+    # (due time, carrier ID, message ID, departure time), the due time being a unix timestamp
+    _heap: list[tuple[float, str, int, int]]
+    _wakeup: asyncio.Event
+    _task: asyncio.Task[None] | None
+    _callback: Callable[[str, int, int], Awaitable[None]]
+
+    def __init__(self, callback: Callable[[str, int, int], Awaitable[None]]):
+        """
+        :param callback: Coroutine called with (carrier_id, message_id, departure_time) when a departure is due.
+        """
+        self.last_run_time = None
+        self._heap = []
+        self._wakeup = asyncio.Event()
+        self._task = None
+        self._callback = callback
+
+    @property
+    def next_iteration(self) -> datetime | None:
+        if not self._heap:
+            return None
+        return datetime.fromtimestamp(self._heap[0][0], tz=UTC)
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run(), name="departure_scheduler")
+
+    def cancel(self) -> None:
+        if self._task:
+            self._task.cancel()
+        self._heap.clear()
+
+    def schedule(self, carrier_id: str, message_id: int, departure_time: int) -> None:
+        """
+        Schedules a reminder for a departure.
+
+        :param carrier_id: The carrier ID string.
+        :param message_id: The discord message ID of the departure notice.
+        :param departure_time: The departure time as a unix timestamp.
+        """
+        logger.debug("Scheduling departure reminder for {} (message {}) at {}", carrier_id, message_id, departure_time)
+        self._push(departure_time + DEPARTURE_GRACE_PERIOD, carrier_id, message_id, departure_time)
+        self._wakeup.set()
+
+    def _push(self, due_at: float, carrier_id: str, message_id: int, departure_time: int) -> None:
+        heapq.heappush(self._heap, (due_at, carrier_id, message_id, departure_time))
+
+    async def _run(self) -> None:
+        self._heap.clear()
+        for row in await database.get_pending_departures():
+            self._push(
+                row["departure_time"] + DEPARTURE_GRACE_PERIOD,
+                row["carrier_id"],
+                row["departure_id"],
+                row["departure_time"],
+            )
+        for row in await database.get_departures_without_time():
+            try:
+                departure_time = await _legacy_departure_time(row["departure_id"])
+                await database.set_departure_time(row["carrier_id"], departure_time)
+            except Exception as e:
+                # Left without a time, so it is tried again on the next start
+                logger.exception(f"Failed to work out the departure time for {row['carrier_id']}: {e}")
+                continue
+            logger.info(
+                f"Set departure time {departure_time} for {row['carrier_id']}, posted before times were stored."
+            )
+            self._push(departure_time + DEPARTURE_GRACE_PERIOD, row["carrier_id"], row["departure_id"], departure_time)
+        logger.info(f"Departure scheduler started with {len(self._heap)} pending departure(s).")
+
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+
+            due_at = self._heap[0][0]
+            delay = due_at - time.time()
+            if delay > 0:
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                continue
+
+            _, carrier_id, message_id, departure_time = heapq.heappop(self._heap)
+            try:
+                await self._callback(carrier_id, message_id, departure_time)
+            except Exception as e:
+                logger.exception(
+                    f"Failed to process due departure for {carrier_id} ({message_id=}), "
+                    + f"retrying in {DEPARTURE_RETRY_INTERVAL}s: {e}"
+                )
+                self._push(time.time() + DEPARTURE_RETRY_INTERVAL, carrier_id, message_id, departure_time)
+            self.last_run_time = datetime.now(UTC)
+
+
 # initialise the Cog and attach our global error handler
 class Departures(commands.Cog):
     bot: Bot
     cxt_menu_close_command: app_commands.ContextMenu
+    departure_scheduler: DepartureScheduler
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.departure_scheduler = DepartureScheduler(self._notify_departure_passed)
         self.cxt_menu_close_command = app_commands.ContextMenu(
             name="Close Departure", callback=self.ctx_menu_close_departure
         )
@@ -83,6 +230,7 @@ class Departures(commands.Cog):
     @override
     async def cog_unload(self):
         self.bot.tree.remove_command(self.cxt_menu_close_command.name, type=self.cxt_menu_close_command.type)
+        self.departure_scheduler.cancel()
 
     @staticmethod
     def parse_system_index(system_id: str) -> int:
@@ -152,6 +300,7 @@ class Departures(commands.Cog):
         clean_carrier_id = carrier_id.replace("<", "").replace(">", "").replace("@", "").replace("|", "")
 
         departing_thoon = False
+        departure_timestamp: int | None = None
         if departure_time:
             departure_time = departure_time.replace(tzinfo=UTC)
             departure_timestamp = int(departure_time.timestamp())
@@ -169,6 +318,7 @@ class Departures(commands.Cog):
 
         if is_thoon_trip and departing_thoon:
             departure_time_text = f" {await bot.get_or_fetch.emoji(EMOJI_THOON)} |"
+            departure_timestamp = None
 
         hitchhiker_ping_text = ""
         if direction_arrow == "⬆️" and is_hitchhiking_trip:
@@ -185,10 +335,15 @@ class Departures(commands.Cog):
 
         try:
             departure_channel = await bot.get_or_fetch.channel(CHANNEL_BC_DEPARTURE_ANNOUNCEMENT)
-            departure_message = await departure_channel.send(departure_message_text)
+            departure_message = await send_queue.send(departure_channel, content=departure_message_text)
             await departure_message.add_reaction("🛬")
             await database.set_departure_message_for_carrier(carrier_id, departure_message.id)
             await database.set_departure_notification_sent(carrier_id, False)
+
+            if departure_timestamp is None:
+                departure_timestamp = int(departure_message.created_at.timestamp()) + THOON_DEPARTURE_DELAY
+            await database.set_departure_time(carrier_id, departure_timestamp)
+            self.departure_scheduler.schedule(carrier_id, departure_message.id, departure_timestamp)
         except Exception as e:
             logger.exception(f"Failed to post departure message for carrier {carrier_id}: {e}")
             raise DepartureOperationError(
@@ -245,13 +400,8 @@ class Departures(commands.Cog):
         Choice(name=f"{system_id} ({system_name})", value=system_id) for system_id, system_name in N_SYSTEMS.items()
     ]
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        logger.info("Starting the departure message checker")
-        if not self.check_departure_messages_loop.is_running():
-            self.check_departure_messages_loop.start()
-        else:
-            logger.debug("Departure message checker already running.")
+    async def cog_load(self):
+        startup.add_task("departure_scheduler", self.departure_scheduler)
 
     @check_roles(
         [
@@ -278,9 +428,11 @@ class Departures(commands.Cog):
                 await interaction.edit_original_response(content=error_msg)
                 return
 
-            logger.debug(f"Fetching carrier data for ID: {carrier_id}")
+            logger.debug("Fetching carrier data for ID: {}", carrier_id)
             carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
-            logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}")
+            logger.opt(lazy=True).debug(
+                "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+            )
 
             if not carrier_data:
                 error_msg = f"Carrier {carrier_id} was not found. Cannot close departure."
@@ -337,7 +489,9 @@ class Departures(commands.Cog):
             error = str(e)
 
         if action_id:
-            logger.debug(f"Sending action acknowledgment for action ID {action_id}: {success=}, {error=}")
+            logger.debug(
+                "Sending action acknowledgment for action ID {}: success={!r}, error={!r}", action_id, success, error
+            )
             await booze_sheets_api.send_action_ack(action_id, success=success, error=error)
 
     @commands.Cog.listener()
@@ -365,84 +519,64 @@ class Departures(commands.Cog):
         )
         await interaction.message.edit(view=None)
 
-    @tasks.loop(minutes=5)
-    @track_last_run()
-    async def check_departure_messages_loop(self):
+    async def _notify_departure_passed(self, carrier_id: str, message_id: int, departure_time: int) -> None:
+        """
+        Reminds the owner to close a departure notice once its departure time and grace period have passed.
+
+        :param carrier_id: The carrier ID string.
+        :param message_id: The discord message ID of the departure notice.
+        :param departure_time: The departure time as a unix timestamp.
+        """
+        if await database.get_departure_message_for_carrier(carrier_id) != message_id:
+            logger.debug("Departure message {} for {} is no longer current. Skipping reminder.", message_id, carrier_id)
+            return
+
+        if await database.get_departure_notification_sent(carrier_id):
+            logger.debug("Departure reminder for {} was already sent. Skipping.", carrier_id)
+            return
+
+        logger.info(f"Departure time for {carrier_id} has passed.")
+
         departure_channel = await bot.get_or_fetch.channel(CHANNEL_BC_DEPARTURE_ANNOUNCEMENT)
-        wine_carrier_chat = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER)
+        try:
+            message = await departure_channel.fetch_message(message_id)
+        except discord.NotFound:
+            logger.info(f"Departure message {message_id} for {carrier_id} was deleted. Removing from database.")
+            await database.delete_carrier_message(carrier_id, "departure")
+            return
 
-        logger.info("Checking for passed departure messages.")
-        async for message in departure_channel.history(limit=100):
-            try:
-                if message.pinned:
-                    continue
-
-                if message.author.id != bot.user.id:
-                    continue
-
-                if len(message.embeds) > 0:
-                    continue
-
-                logger.info("Departure message found.")
-
-                has_reacted = False
-                for reaction in message.reactions:
-                    if reaction.emoji == "⏲️":
-                        async for user in reaction.users():
-                            if user.id == bot.user.id:
-                                has_reacted = True
-                                break
-
-                if has_reacted:
-                    logger.info("Departure message has been responded to.")
-                    continue
-
-                content = message.content
-                departure_time = content.split("|")[1].replace(" ", "")
-
-                if departure_time.startswith("<t:"):
-                    departure_time = departure_time.split(":")[1]
-                elif departure_time == f"{await bot.get_or_fetch.emoji(EMOJI_THOON)}":
-                    departure_time = message.created_at.timestamp() + 25 * 60
-
-                try:
-                    departure_time = int(departure_time)
-                except ValueError:
-                    logger.exception(f"Departure time was not an integer: {departure_time}")
-                    continue
-
-                logger.info(f"Departure time: {departure_time}")
-
-                if int(time.time()) > departure_time + 10 * 60:  # Allow a 10-minute grace period
-                    logger.info("Departure time has passed.")
-                    author_id = self.get_departure_author_id(message)
-                    if author_id:
-                        logger.info(f"Notifying user with id: {author_id} in WCO chat.")
-                        await message.add_reaction("⏲️")
-
-                        carrier_id = await database.get_carrier_for_departure_message(message.id)
-
-                        view = ui.View()
-                        view.add_item(
-                            DynamicButton(
-                                label="Close Departure Notice",
-                                action="departure_close",
-                                user_id=author_id,
-                                payload=carrier_id,
-                            )
-                        )
-
-                        await wine_carrier_chat.send(
-                            f"<@{author_id}> your scheduled departure time of <t:{departure_time}:F> has passed. "
-                            + "If your carrier has entered lockdown or completed its jump, please close the departure "
-                            + "notice by clicking the button below.",
-                            view=view,
-                        )
+        if message.embeds:
+            logger.debug("Departure message {} for {} is an official departure. Skipping.", message_id, carrier_id)
+            return
 
-            except Exception as e:
-                logger.exception(
-                    f"Failed to process departure message while checking for time passed. {message.id=}. Error: {e}"
-                )
+        author_id = self.get_departure_author_id(message)
+        if not author_id:
+            logger.warning(f"Could not find the author of departure message {message_id} for {carrier_id}.")
+            return
+
+        logger.info(f"Notifying user with id: {author_id} in WCO chat.")
+        await message.add_reaction("⏲️")
+
+        view = ui.View()
+        view.add_item(
+            DynamicButton(
+                label="Close Departure Notice",
+                action="departure_close",
+                user_id=author_id,
+                payload=carrier_id,
+            )
+        )
+
+        wine_carrier_chat = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER)
+        await send_queue.send(
+            wine_carrier_chat,
+            SendPriority.HIGH,
+            content=f"<@{author_id}> your scheduled departure time of <t:{departure_time}:F> has passed. "
+            + "If your carrier has entered lockdown or completed its jump, please close the departure "
+            + "notice by clicking the button below.",
+            view=view,
+        )
+        await database.set_departure_notification_sent(carrier_id, True)
 
     @app_commands.command(name="wine_carrier_departure", description="Post a departure message for a wine carrier.")
     @describe(
@@ -514,7 +648,7 @@ class Departures(commands.Cog):
             await steve_says_channel.send(f"{base_error} {msg}")
             return
 
-        logger.debug(f"Fetching carrier data for carrier ID: {carrier_id}")
+        logger.debug("Fetching carrier data for carrier ID: {}", carrier_id)
 
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
 
@@ -627,7 +761,7 @@ class Departures(commands.Cog):
             await interaction.edit_original_response(content=msg)
             return
 
-        logger.debug(f"Fetching carrier data for carrier ID: {carrier_id}")
+        logger.debug("Fetching carrier data for carrier ID: {}", carrier_id)
 
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
 
@@ -753,9 +887,11 @@ class Departures(commands.Cog):
             await interaction.edit_original_response(content=msg)
             return
 
-        logger.debug(f"Fetching carrier data for carrier ID: {carrier_id}")
+        logger.debug("Fetching carrier data for carrier ID: {}", carrier_id)
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
-        logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}")
+        logger.opt(lazy=True).debug(
+            "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+        )
 
         # Check if carrier data was found
         if not carrier_data:
@@ -770,7 +906,7 @@ class Departures(commands.Cog):
         departure_location = f"{departure_location} ({N_SYSTEMS[departure_location]})"
         arrival_location = f"{arrival_location} ({N_SYSTEMS[arrival_location]})"
 
-        logger.debug(f"Departure location: {departure_location}, Arrival location: {arrival_location}")
+        logger.debug("Departure location: {}, Arrival location: {}", departure_location, arrival_location)
 
         async def validate_timestamp(user_input: str) -> int | None:
             if not user_input:
@@ -808,13 +944,13 @@ class Departures(commands.Cog):
             departure_time_text = "Departs when the public holiday ends at Rackham's Peak"
         elif departure_time_type == "Custom (requires timestamp)":
             timestamp = await validate_timestamp(departure_timestamp)
-            logger.debug(f"Validated timestamp: {timestamp}")
+            logger.debug("Validated timestamp: {}", timestamp)
             if timestamp is None:
                 return
             departure_time_text = f"Departs <t:{timestamp}:f> (<t:{timestamp}:R>)"
         elif departure_time_type == "Pre-PH (requires timestamp)":
             timestamp = await validate_timestamp(departure_timestamp)
-            logger.debug(f"Validated timestamp: {timestamp}")
+            logger.debug("Validated timestamp: {}", timestamp)
             if timestamp is None:
                 return
             departure_time_text = f"Departs any time after <t:{timestamp}:f> (<t:{timestamp}:R>) or immediately if the public holiday is announced at Rackham's Peak."
@@ -850,7 +986,7 @@ class Departures(commands.Cog):
             await interaction.edit_original_response(embed=check_embed, view=confirm)
             await confirm.wait()
 
-            logger.debug(f"Confirmation result: {confirm.value}")
+            logger.debug("Confirmation result: {}", confirm.value)
 
             if not confirm.value:
                 logger.info("Official departure edit cancelled by user.")
@@ -1,3 +1,4 @@
+import sqlite3
 import sys
 
 import discord
@@ -8,6 +9,8 @@ from ptn_utils.logger.logger import get_logger
 
 from ptn.boozebot._metadata import __version__
 from ptn.boozebot.constants import I_AM_STEVE_GIF, bot
+from ptn.boozebot.database.database import database
+from ptn.boozebot.modules.CommandSync import sync_command_tree
 
 """
 LISTENERS
@@ -26,6 +29,8 @@ b/update - admin
 b/exit - admin
 b/version - admin
 b/sync - admin
+b/backup - admin
+b/sql_profile - admin
 """
 
 logger = get_logger("boozebot.commands.discord")
@@ -84,7 +89,7 @@ class DiscordBotCommands(commands.Cog):
         )
         embed.set_image(url=I_AM_STEVE_GIF)
         await ctx.send(embed=embed)
-        logger.debug(f"Ping response sent to {ctx.author}.")
+        logger.debug("Ping response sent to {}.", ctx.author)
 
     # quit the bot
     @commands.command(name="exit", aliases=["sober_up"], help="Stops the bots process on the VM, ending all functions.")
@@ -112,4 +117,59 @@ class DiscordBotCommands(commands.Cog):
         """
         logger.info(f"Version command called by {ctx.author}. Version: {__version__}")
         await ctx.send(f"Avast Ye Landlubber! {self.bot.user.name} is on version: {__version__}.")
-        logger.debug(f"Version response sent to {ctx.author}.")
+        logger.debug("Version response sent to {}.", ctx.author)
+
+    @commands.command(name="sync", help="Syncs the slash commands with Discord, even if they are unchanged")
+    @commands.has_any_role(*any_council_role)
+    async def sync(self, ctx: Context[Bot]):
+        """
+        Forces a sync of the command tree, for when Discord's copy has drifted from the bot's.
+
+        :param discord.ext.commands.Context ctx: The Discord context object
+        :returns: None
+        """
+        logger.info(f"Sync command called by {ctx.author}.")
+        try:
+            await sync_command_tree(force=True)
+        except discord.DiscordException as e:
+            logger.exception(f"Forced command tree sync failed: {e}")
+            await ctx.send(f"Pirate Steve failed to sync the commands: {e}")
+            return
+        await ctx.send("Pirate Steve synced the commands with Discord.")
+        logger.debug("Sync response sent to {}.", ctx.author)
+
+    @commands.command(name="backup", help="Takes an online backup of the booze database")
+    @commands.has_any_role(*any_council_role)
+    async def backup(self, ctx: Context[Bot]):
+        """
+        Takes a compressed online backup of the booze database.
+
+        :param discord.ext.commands.Context ctx: The Discord context object
+        :returns: None
+        """
+        logger.info(f"Backup command called by {ctx.author}.")
+        try:
+            backup_path = await database.backup_database()
+        except (OSError, sqlite3.Error) as e:
+            logger.exception(f"Database backup failed: {e}")
+            await ctx.send(f"Pirate Steve failed to back up the database: {e}")
+            return
+        await ctx.send(f"Pirate Steve backed up the database to `{backup_path.name}`.")
+        logger.debug("Backup response sent to {}.", ctx.author)
+
+    @commands.command(name="sql_profile", help="Shows the per-statement SQL latency profile")
+    @commands.has_any_role(*any_council_role)
+    async def sql_profile(self, ctx: Context[Bot]):
+        """
+        Dumps the SQL latency profile, if profiling is enabled.
+
+        :param discord.ext.commands.Context ctx: The Discord context object
+        :returns: None
+        """
+        logger.info(f"SQL profile command called by {ctx.author}.")
+        profile = database.get_sql_profile()
+        if profile is None:
+            await ctx.send("SQL profiling is disabled. Set BOOZEBOT_SQL_PROFILE=true to enable it.")
+            return
+        logger.info(f"SQL profile:\n{profile}")
+        await ctx.send(f"```\n{profile[:1900]}\n```")
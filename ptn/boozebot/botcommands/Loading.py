@@ -5,6 +5,8 @@ Cog for wine loading related commands
 
 import asyncio
 import re
+import time
+from collections.abc import ItemsView
 from typing import Any, TypedDict, final, override
 
 import discord
@@ -24,8 +26,10 @@ from ptn_utils.global_constants import (
 from ptn_utils.logger.logger import get_logger
 
 from ptn.boozebot.constants import CARRIER_ID_RE, bot
+from ptn.boozebot.database.database import database
 from ptn.boozebot.modules.boozeSheetsApi import booze_sheets_api
-from ptn.boozebot.modules.helpers import check_command_channel, check_roles, is_staff
+from ptn.boozebot.modules.helpers import check_cache_ready, check_command_channel, check_roles, is_staff
+from ptn.boozebot.modules.Startup import CACHE_LOAD_MESSAGES, startup
 from ptn.boozebot.modules.Views import DynamicButton
 
 """
@@ -50,6 +54,76 @@ class LoadCacheEntry(TypedDict):
     carrier_name: str
 
 
+class LoadCache:
+    """
+    Active load messages, indexed by carrier ID, message ID and owner ID.
+
+    All three maps are updated together in each mutating method. The methods never await, so the indexes are
+    always consistent with each other from the event loop's point of view.
+    """
+
+    _by_carrier: dict[str, LoadCacheEntry]
+    _by_message: dict[int, str]
+    _by_owner: dict[int, set[str]]
+
+    def __init__(self) -> None:
+        self._by_carrier = {}
+        self._by_message = {}
+        self._by_owner = {}
+
+    def __len__(self) -> int:
+        return len(self._by_carrier)
+
+    def __contains__(self, carrier_id: str) -> bool:
+        return carrier_id in self._by_carrier
+
+    def get(self, carrier_id: str) -> LoadCacheEntry | None:
+        return self._by_carrier.get(carrier_id)
+
+    def items(self) -> ItemsView[str, LoadCacheEntry]:
+        return self._by_carrier.items()
+
+    def find_by_message(self, message_id: int) -> tuple[str, str, int] | None:
+        """
+        Return ``(carrier_id, carrier_name, owner_id)`` for the given *message_id*,
+        or None if not found.
+        """
+        carrier_id = self._by_message.get(message_id)
+        if carrier_id is None:
+            return None
+        entry = self._by_carrier[carrier_id]
+        return carrier_id, entry["carrier_name"], entry["owner_id"]
+
+    def for_owner(self, owner_id: int) -> list[tuple[str, LoadCacheEntry]]:
+        """Return the ``(carrier_id, entry)`` pairs of every load message owned by *owner_id*."""
+        return [(carrier_id, self._by_carrier[carrier_id]) for carrier_id in self._by_owner.get(owner_id, ())]
+
+    def add(self, carrier_id: str, message_id: int, owner_id: int, carrier_name: str) -> None:
+        self.remove(carrier_id)
+        self._by_carrier[carrier_id] = LoadCacheEntry(
+            message_id=message_id, owner_id=owner_id, carrier_name=carrier_name
+        )
+        self._by_message[message_id] = carrier_id
+        self._by_owner.setdefault(owner_id, set()).add(carrier_id)
+
+    def remove(self, carrier_id: str) -> LoadCacheEntry | None:
+        entry = self._by_carrier.pop(carrier_id, None)
+        if entry is None:
+            return None
+        self._by_message.pop(entry["message_id"], None)
+        owner_carriers = self._by_owner.get(entry["owner_id"])
+        if owner_carriers is not None:
+            owner_carriers.discard(carrier_id)
+            if not owner_carriers:
+                del self._by_owner[entry["owner_id"]]
+        return entry
+
+    def clear(self) -> None:
+        self._by_carrier.clear()
+        self._by_message.clear()
+        self._by_owner.clear()
+
+
 class LoadOperationError(Exception):
     """Raised when a load announcement cannot be posted or deleted."""
 
@@ -58,65 +132,113 @@ class LoadOperationError(Exception):
 
 
 # ---------------------------------------------------------------------------
-# In-memory cache
+# In-memory cache, persisted in the load_messages table
 #
 # Structure:
-#   _load_cache[carrier_id] = LoadCacheEntry(message_id=..., owner_id=..., carrier_name=...)
+#   _load_cache.get(carrier_id) -> LoadCacheEntry(message_id=..., owner_id=..., carrier_name=...)
+#
+# Keyed by carrier_id (upper-case XXX-XXX) for O(1) lookups on post/delete,
+# with reverse indexes by message_id (reactions, deletes) and owner_id
+# (autocomplete). owner_id and carrier_name are stored so the autocomplete
+# can filter and display results without hitting the API.
 #
-# Keyed by carrier_id (upper-case XXX-XXX) for O(1) lookups on post/delete.
-# owner_id and carrier_name are stored so the autocomplete can filter and
-# display results without hitting the API.
+# The cache is loaded from the database on startup and kept current by post
+# and delete events. Channel history is only read after the stored watermark,
+# so a refresh costs nothing unless messages arrived while the bot was away.
 # ---------------------------------------------------------------------------
-_load_cache: dict[str, LoadCacheEntry] = {}
+_load_cache = LoadCache()
+
+# Carriers recently confirmed to have no load message, with the monotonic time of the check
+_negative_cache: dict[str, float] = {}
+_NEGATIVE_CACHE_TTL = 300
 
+_refresh_lock = asyncio.Lock()
 
-def _cache_add(carrier_id: str, message_id: int, owner_id: int, carrier_name: str) -> None:
-    _load_cache[carrier_id] = LoadCacheEntry(message_id=message_id, owner_id=owner_id, carrier_name=carrier_name)
+
+async def _cache_add(carrier_id: str, message_id: int, owner_id: int, carrier_name: str) -> None:
+    _load_cache.add(carrier_id, message_id, owner_id, carrier_name)
+    _negative_cache.pop(carrier_id, None)
+    await database.set_load_message(carrier_id, message_id, owner_id, carrier_name)
     logger.debug(
-        f"Load cache ADD: {carrier_id} → message_id={message_id}, owner_id={owner_id}, carrier_name={carrier_name!r}"
+        "Load cache ADD: {} → message_id={}, owner_id={}, carrier_name={!r}",
+        carrier_id,
+        message_id,
+        owner_id,
+        carrier_name,
     )
 
 
-async def _build_cache_from_history() -> None:
-    """Rebuild _load_cache by reading the full loading channel history."""
-    logger.info("Building load message cache from channel history…")
+async def _cache_remove(carrier_id: str) -> None:
+    _load_cache.remove(carrier_id)
+    await database.delete_load_message(carrier_id)
+    logger.debug("Load cache REMOVE: {}", carrier_id)
+
+
+async def _load_cache_from_database() -> None:
+    """Populate _load_cache from the load messages persisted in the database."""
     _load_cache.clear()
-    try:
-        loading_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CELLAR_LOADING)
-        async for message in loading_channel.history(limit=None):
-            if message.author.id != bot.user.id:
-                continue
-            match = _LOAD_MESSAGE_RE.search(message.content)
-            if match:
-                _cache_add(
-                    match.group("carrier_id"), message.id, int(match.group("owner_id")), match.group("carrier_name")
-                )
-        logger.info(f"Load cache built: {len(_load_cache)} entries.")
-    except Exception as e:
-        logger.exception(f"Failed to build load cache from history: {e}")
+    for row in await database.get_load_messages():
+        _load_cache.add(row["carrier_id"], int(row["message_id"]), int(row["owner_id"]), row["carrier_name"])
+    logger.info(f"Load cache loaded from database: {len(_load_cache)} entries.")
+
+
+async def _refresh_cache_from_history() -> None:
+    """Add load messages posted after the stored history watermark to _load_cache."""
+    async with _refresh_lock:
+        try:
+            watermark = await database.get_history_watermark(CHANNEL_BC_WINE_CELLAR_LOADING)
+            logger.info(f"Refreshing load message cache from channel history after message {watermark}…")
+
+            loading_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CELLAR_LOADING)
+            after = discord.Object(id=watermark) if watermark else None
+            newest_message_id = watermark
+            scanned = 0
+            async for message in loading_channel.history(limit=None, after=after, oldest_first=True):
+                scanned += 1
+                newest_message_id = message.id
+                if message.author.id != bot.user.id:
+                    continue
+                match = _LOAD_MESSAGE_RE.search(message.content)
+                if match:
+                    await _cache_add(
+                        match.group("carrier_id"),
+                        message.id,
+                        int(match.group("owner_id")),
+                        match.group("carrier_name"),
+                    )
+
+            if newest_message_id and newest_message_id != watermark:
+                await database.set_history_watermark(CHANNEL_BC_WINE_CELLAR_LOADING, newest_message_id)
+            logger.info(f"Load cache refreshed: scanned {scanned} new message(s), {len(_load_cache)} entries.")
+        except Exception as e:
+            logger.exception(f"Failed to refresh load cache from history: {e}")
 
-def _find_carrier_in_cache(message_id: int) -> tuple[str, str, int] | None:
-    """
-    Return ``(carrier_id, carrier_name, owner_id)`` for the given *message_id*,
-    or None if not found.
-    """
-    for carrier_id, entry in _load_cache.items():
-        if entry["message_id"] == message_id:
-            return carrier_id, entry["carrier_name"], entry["owner_id"]
-    return None
+
+async def _warm_up_load_cache() -> None:
+    """Load the persisted load messages, then add any posted while the bot was offline."""
+    await _load_cache_from_database()
+    await _refresh_cache_from_history()
 
 
 async def _lookup_load_message(carrier_id: str) -> LoadCacheEntry | None:
     """
-    Return the cache entry for *carrier_id*, rebuilding from history on a miss.
+    Return the cache entry for *carrier_id*, refreshing from recent history on a miss.
     Returns None if the carrier has no active load message.
     """
-    if carrier_id in _load_cache:
-        return _load_cache[carrier_id]
+    if entry := _load_cache.get(carrier_id):
+        return entry
+
+    checked_at = _negative_cache.get(carrier_id)
+    if checked_at is not None and time.monotonic() - checked_at < _NEGATIVE_CACHE_TTL:
+        logger.debug("Cache miss for {} is a known absent carrier. Skipping refresh.", carrier_id)
+        return None
 
-    logger.info(f"Cache miss for {carrier_id}. Rebuilding from history…")
-    await _build_cache_from_history()
-    return _load_cache.get(carrier_id)
+    logger.info(f"Cache miss for {carrier_id}. Refreshing from recent history…")
+    await _refresh_cache_from_history()
+    entry = _load_cache.get(carrier_id)
+    if entry is None:
+        _negative_cache[carrier_id] = time.monotonic()
+    return entry
 
 
 @final
@@ -127,9 +249,19 @@ class Loading(commands.Cog):
         self.bot = bot
         self._reaction_lock = asyncio.Lock()
 
+    @override
+    async def cog_load(self) -> None:
+        startup.add_warm_up(CACHE_LOAD_MESSAGES, _warm_up_load_cache)
+
     @commands.Cog.listener()
-    async def on_ready(self) -> None:
-        await _build_cache_from_history()
+    async def on_raw_message_delete(self, payload: discord.RawMessageDeleteEvent) -> None:
+        """Evict load messages deleted outside of Steve from the cache."""
+        if payload.channel_id != CHANNEL_BC_WINE_CELLAR_LOADING:
+            return
+
+        if found := _load_cache.find_by_message(payload.message_id):
+            logger.info(f"Load message {payload.message_id} for {found[0]} was deleted. Evicting from cache.")
+            await _cache_remove(found[0])
 
     # ------------------------------------------------------------------
     # Internal helpers
@@ -166,7 +298,7 @@ class Loading(commands.Cog):
                 raise LoadOperationError(f"A load order for carrier **{clean_carrier_id}** already exists.")
             except discord.NotFound:
                 logger.warning(f"Load message for {clean_carrier_id} not found - evicting cache and continuing.")
-                _load_cache.pop(clean_carrier_id, None)
+                await _cache_remove(clean_carrier_id)
 
         wine_text = f"**{wine_total / 1000:.1f}k** :wine_glass:"
 
@@ -189,7 +321,7 @@ class Loading(commands.Cog):
             logger.exception(f"Failed to post load message for carrier {carrier_id}: {e}")
             raise LoadOperationError(f"Failed to post load message for carrier {carrier_id}: {e}") from e
 
-        _cache_add(clean_carrier_id, message.id, int(owner_discord_id), carrier_name)
+        await _cache_add(clean_carrier_id, message.id, int(owner_discord_id), carrier_name)
         return message
 
     async def _delete_load_message(self, carrier_id: str) -> None:
@@ -214,8 +346,7 @@ class Loading(commands.Cog):
             logger.exception(f"Failed to delete load message for carrier {carrier_id}: {e}")
             raise LoadOperationError(f"Failed to delete load message for carrier {carrier_id}: {e}") from e
         finally:
-            _load_cache.pop(carrier_id, None)
-            logger.debug(f"Load cache REMOVE: {carrier_id}")
+            await _cache_remove(carrier_id)
 
         try:
             await booze_sheets_api.update_carrier_info(carrier_id, {"wine_status": "Full"})
@@ -237,10 +368,10 @@ class Loading(commands.Cog):
         user_id = interaction.user.id
         staff = is_staff(interaction.user)
 
+        candidates = _load_cache.items() if staff else _load_cache.for_owner(user_id)
+
         choices: list[app_commands.Choice[str]] = []
-        for carrier_id, entry in _load_cache.items():
-            if not staff and entry["owner_id"] != user_id:
-                continue
+        for carrier_id, entry in candidates:
             display_name = f"{entry['carrier_name']} ({carrier_id})"
             if current.lower() not in display_name.lower():
                 continue
@@ -262,6 +393,7 @@ class Loading(commands.Cog):
     )
     @check_roles([*any_council_role, *any_moderation_role, ROLE_SOMM, ROLE_CONN, ROLE_WINE_CARRIER])
     @check_command_channel(CHANNEL_BC_WINE_CARRIER)
+    @check_cache_ready(CACHE_LOAD_MESSAGES)
     @app_commands.autocomplete(carrier_id=booze_sheets_api.carrier_autocomplete(state="empty"))
     async def wine_load(
         self, interaction: discord.Interaction, carrier_id: str, tritium: int | None = None, note: str | None = None
@@ -292,7 +424,7 @@ class Loading(commands.Cog):
             await interaction.edit_original_response(content="Only staff members can include a note.")
             return
 
-        logger.debug(f"Fetching carrier data for ID: {carrier_id}")
+        logger.debug("Fetching carrier data for ID: {}", carrier_id)
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
 
         if not carrier_data:
@@ -301,7 +433,7 @@ class Loading(commands.Cog):
             await interaction.followup.send(error_msg)
             return
 
-        logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary()}")
+        logger.opt(lazy=True).debug("Fetched carrier data: {}", carrier_data.to_dictionary)
         if not carrier_data.is_owned_by(interaction.user) and not is_staff(interaction.user):
             await interaction.edit_original_response(content=f"Carrier {carrier_id} is not owned by you.")
             return
@@ -332,6 +464,7 @@ class Loading(commands.Cog):
     @describe(carrier_id="The XXX-XXX ID string for the carrier whose load notice should be removed")
     @check_roles([*any_council_role, *any_moderation_role, ROLE_SOMM, ROLE_CONN, ROLE_WINE_CARRIER])
     @check_command_channel(CHANNEL_BC_WINE_CARRIER)
+    @check_cache_ready(CACHE_LOAD_MESSAGES)
     @app_commands.autocomplete(carrier_id=_load_delete_autocomplete)
     async def wine_load_complete(self, interaction: discord.Interaction, carrier_id: str):
         """
@@ -372,6 +505,7 @@ class Loading(commands.Cog):
     @describe(carrier_id="The XXX-XXX ID string for the carrier")
     @check_roles([*any_council_role, *any_moderation_role, ROLE_SOMM, ROLE_CONN])
     @check_command_channel(CHANNEL_BC_WINE_CARRIER)
+    @check_cache_ready(CACHE_LOAD_MESSAGES)
     async def wine_load_staff(self, interaction: discord.Interaction, carrier_id: str):
         """
         Staff-only wine load command that presents a modal for carrier name, wine, tritium, note.
@@ -457,7 +591,12 @@ class Loading(commands.Cog):
             error = str(e)
 
         if action_id:
-            logger.debug(f"Sending load_request ack for event: {action_id=}, {success=}, {error=}")
+            logger.debug(
+                "Sending load_request ack for event: action_id={!r}, success={!r}, error={!r}",
+                action_id,
+                success,
+                error,
+            )
             await booze_sheets_api.send_action_ack(action_id, success=success, error=error)
 
     # ------------------------------------------------------------------
@@ -503,20 +642,22 @@ class Loading(commands.Cog):
             emoji = existing_reaction.emoji
             emoji_id = emoji.id if isinstance(emoji, discord.PartialEmoji | discord.Emoji) else None
             if emoji_id == EMOJI_CARRIER_DONE and existing_reaction.me:
-                logger.debug(f"Bot has already reacted EMOJI_CARRIER_DONE on message {message_id}. Skipping duplicate.")
+                logger.debug(
+                    "Bot has already reacted EMOJI_CARRIER_DONE on message {}. Skipping duplicate.", message_id
+                )
                 return
 
         # Look up the carrier this message belongs to
-        found = _find_carrier_in_cache(message_id)
+        found = _load_cache.find_by_message(message_id)
 
         if found is None:
-            # Cache miss - rebuild and retry
-            logger.info(f"Reaction on unknown message {message_id}. Rebuilding load cache and retrying.")
-            await _build_cache_from_history()
-            found = _find_carrier_in_cache(message_id)
+            # Cache miss - pick up any messages newer than the watermark and retry
+            logger.info(f"Reaction on unknown message {message_id}. Refreshing load cache and retrying.")
+            await _refresh_cache_from_history()
+            found = _load_cache.find_by_message(message_id)
 
         if found is None:
-            logger.debug(f"Message {message_id} not found in load cache after rebuild. Ignoring reaction.")
+            logger.debug("Message {} not found in load cache after refresh. Ignoring reaction.", message_id)
             return
 
         carrier_id, carrier_name, owner_id = found
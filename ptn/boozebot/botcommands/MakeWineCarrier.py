@@ -10,9 +10,10 @@ from typing import TYPE_CHECKING, Any, cast
 import discord
 from discord import DiscordException, Embed, Interaction, Member, app_commands
 from discord.app_commands import ContextMenu, describe
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ext.commands import Bot
 from discord.ui import View
+from ptn_utils.enums.booze_enums import CruiseSystemState
 from ptn_utils.global_constants import (
     CHANNEL_BC_STEVE_SAYS,
     CHANNEL_BC_WINE_CARRIER,
@@ -38,8 +39,9 @@ from ptn.boozebot.modules.boozeSheetsApi import booze_sheets_api
 from ptn.boozebot.modules.helpers import (
     check_command_channel,
     check_roles,
-    track_last_run,
 )
+from ptn.boozebot.modules.Scheduler import ScheduledJob, TickSnapshot, scheduler
+from ptn.boozebot.modules.Startup import startup
 from ptn.boozebot.modules.Views import DynamicButton
 
 if TYPE_CHECKING:
@@ -55,24 +57,32 @@ Member context menu: make_wine_carrier - conn/somm/mod/admin
 
 logger = get_logger("boozebot.commands.makewinecarrier")
 
+# Seconds between signup checks, the websocket delivers signups live so the check only catches missed events
+SIGNUP_CHECK_INTERVAL = 300
+SIGNUP_CHECK_STATE_INTERVALS = {CruiseSystemState.ENDED: 900}
+
 
 # initialise the Cog
 class MakeWineCarrier(commands.Cog):
     ctx_menu: ContextMenu
     bot: Bot
     wine_carrier_toggle_lock: Lock
+    booze_tracker_signup_check: ScheduledJob
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.ctx_menu = app_commands.ContextMenu(name="Make Wine Carrier", callback=self.context_menu_make_wine_carrier)
         self.bot.tree.add_command(self.ctx_menu)
         self.wine_carrier_toggle_lock = Lock()
+        self.booze_tracker_signup_check = scheduler.add_job(
+            "booze_tracker_signup_check",
+            self._booze_tracker_signup_check,
+            SIGNUP_CHECK_INTERVAL,
+            SIGNUP_CHECK_STATE_INTERVALS,
+        )
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        logger.info("Starting periodic signup poll task loop")
-        if not self.booze_tracker_signup_check.is_running():
-            self.booze_tracker_signup_check.start()
+    async def cog_load(self):
+        startup.add_task("booze_tracker_signup_check", self.booze_tracker_signup_check)
 
     @commands.Cog.listener()
     async def on_member_update(self, before: Member, after: Member):
@@ -120,15 +130,13 @@ class MakeWineCarrier(commands.Cog):
             color=color,
         )
 
-    @tasks.loop(minutes=5)
-    @track_last_run()
-    async def booze_tracker_signup_check(self):
-        """Periodically check for new booze tracker signups."""
+    async def _booze_tracker_signup_check(self, _snapshot: TickSnapshot):
+        """Periodically check for new booze tracker signups, run by the scheduler."""
         logger.debug("Running booze_tracker_signup_check task")
 
         new_signups = await booze_sheets_api.get_unpinged_signups()
 
-        logger.debug(f"Found {len(new_signups)} new signups")
+        logger.debug("Found {} new signups", len(new_signups))
 
         unique_signups = {}
 
@@ -148,7 +156,7 @@ class MakeWineCarrier(commands.Cog):
                     first_time=signup.signup_info.first_time if signup.signup_info else True,
                     color=color,
                 )
-                logger.debug(f"Marked signup {signup.owner.discord_id} as pinged")
+                logger.debug("Marked signup {} as pinged", signup.owner.discord_id)
             except DiscordException as e:
                 logger.exception(f"Failed to alert new signup for user {signup.owner.discord_id}: {e}")
                 continue
@@ -158,7 +166,7 @@ class MakeWineCarrier(commands.Cog):
     ):
         """Alert about a new signup."""
 
-        logger.debug(f"Alerting new signup for user {owner_id} with status {status} and notes {notes}")
+        logger.debug("Alerting new signup for user {} with status {} and notes {}", owner_id, status, notes)
 
         steve_says = cast("GuildChannel", await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS))
 
@@ -230,7 +238,7 @@ class MakeWineCarrier(commands.Cog):
             logger.debug("wine_carrier_toggle_lock acquired")
             # set the target role
             wc_role = await bot.get_or_fetch.role(ROLE_WINE_CARRIER)
-            logger.debug(f"Wine Carrier role name is {wc_role.name}")
+            logger.debug("Wine Carrier role name is {}", wc_role.name)
 
             # Refetch the user from the interaction inside the lock
             refetched_user = await bot.get_or_fetch.member(user.id)
@@ -243,7 +251,7 @@ class MakeWineCarrier(commands.Cog):
 
             user = refetched_user
 
-            logger.debug(f"Refetched user: {user}")
+            logger.debug("Refetched user: {}", user)
 
             if wc_role in user.roles:
                 # remove role
@@ -282,7 +290,7 @@ class MakeWineCarrier(commands.Cog):
             channel = await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS)
             # set the target role
             wc_role = await bot.get_or_fetch.role(ROLE_WINE_CARRIER)
-            logger.debug(f"Wine Carrier role name is {wc_role.name}")
+            logger.debug("Wine Carrier role name is {}", wc_role.name)
 
             async def respond(content: str | None = None, embed: discord.Embed | None = None):
                 if interaction.message:
@@ -323,7 +331,7 @@ class MakeWineCarrier(commands.Cog):
                 logger.debug("Opening welcome message file")
                 wine_welcome_message = WELCOME_MESSAGE_FILE_PATH.read_text("utf-8")
 
-                logger.debug(f"Welcome message file read successfully. \n {wine_welcome_message}")
+                logger.debug("Welcome message file read successfully. \n {}", wine_welcome_message)
 
                 wine_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER)
                 embed = Embed(description=wine_welcome_message)
@@ -40,11 +40,11 @@ class MimicSteve(commands.Cog):
         class ReplyModal(discord.ui.Modal, title="Reply as PirateSteve"):
             message: TextInput[BaseView] = discord.ui.TextInput(label="Message", style=discord.TextStyle.long)
 
-            logger.debug(f"Modal for {interaction.user.name} to reply as PirateSteve opened.")
+            logger.debug("Modal for {} to reply as PirateSteve opened.", interaction.user.name)
 
             @override
             async def on_submit(self, interaction: discord.Interaction):
-                logger.debug(f"User {interaction.user.name} submitted a reply as PirateSteve: {self.message.value}.")
+                logger.debug("User {} submitted a reply as PirateSteve: {}.", interaction.user.name, self.message.value)
 
                 await interaction.response.send_message("Replying as PirateSteve...", ephemeral=True)
                 await MimicSteve._steve_speak(interaction, self.message.value, reply_message=reply_message)
@@ -83,7 +83,7 @@ class MimicSteve(commands.Cog):
             logger.debug("No send_channel provided, using the interaction channel.")
             send_channel = cast("discord.TextChannel", interaction.channel)
 
-        logger.debug(f"Sending message as PirateSteve in channel: {send_channel}.")
+        logger.debug("Sending message as PirateSteve in channel: {}.", send_channel)
 
         await interaction.response.send_message("Replying as PirateSteve...", ephemeral=True)
         await self._steve_speak(interaction, message, send_channel=send_channel)
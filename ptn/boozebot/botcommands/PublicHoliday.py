@@ -9,7 +9,7 @@ from datetime import UTC, datetime, timedelta
 import discord
 from discord import app_commands
 from discord.app_commands import describe
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ext.commands import Bot
 from ptn_utils.enums.booze_enums import CruiseSystemState
 from ptn_utils.global_constants import (
@@ -35,13 +35,15 @@ from ptn.boozebot.constants import (
     holiday_start_gif,
 )
 from ptn.boozebot.modules.boozeSheetsApi import booze_sheets_api
-from ptn.boozebot.modules.helpers import check_command_channel, check_roles, track_last_run
+from ptn.boozebot.modules.helpers import check_command_channel, check_roles
 from ptn.boozebot.modules.PHcheck import StaleDataException, api_ph_check
+from ptn.boozebot.modules.Scheduler import ScheduledJob, TickSnapshot, scheduler
+from ptn.boozebot.modules.Startup import startup
 
 """
 PUBLIC HOLIDAY TASK LOOP
 
-Checks every 15 minutes if the PH at rackhams peak is happening and pings somm and updates the db if it is.
+Checks every 10 minutes, every 5 during a cruise, if the PH at rackhams peak is happening and pings somm and updates the db if it is.
 
 
 PUBLIC HOLIDAY COMMANDS
@@ -53,12 +55,23 @@ PUBLIC HOLIDAY COMMANDS
 
 logger = get_logger("boozebot.commands.publicholiday")
 
+# Seconds between holiday checks, more often during a cruise so its end is caught quickly
+PUBLIC_HOLIDAY_CHECK_INTERVAL = 600
+PUBLIC_HOLIDAY_CHECK_STATE_INTERVALS = {CruiseSystemState.ACTIVE: 300}
+
 
 class PublicHoliday(commands.Cog):
     bot: Bot
+    public_holiday_loop: ScheduledJob
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.public_holiday_loop = scheduler.add_job(
+            "public_holiday_loop",
+            self._public_holiday_loop,
+            PUBLIC_HOLIDAY_CHECK_INTERVAL,
+            PUBLIC_HOLIDAY_CHECK_STATE_INTERVALS,
+        )
 
     """
     The public holiday state checker mechanism for booze bot.
@@ -66,13 +79,8 @@ class PublicHoliday(commands.Cog):
 
     rackhams_holiday_active: bool = False
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        logger.info("Starting the public holiday state checker")
-        if not self.public_holiday_loop.is_running():
-            self.public_holiday_loop.start()
-        else:
-            logger.debug("Public holiday state checker loop already running.")
+    async def cog_load(self):
+        startup.add_task("public_holiday_loop", self.public_holiday_loop)
 
     @staticmethod
     async def _set_holiday_start():
@@ -124,18 +132,23 @@ class PublicHoliday(commands.Cog):
 
         return False, "No state change needed for the holiday state"
 
-    @tasks.loop(minutes=10)
-    @track_last_run()
-    async def public_holiday_loop(self):
+    async def _public_holiday_loop(self, snapshot: TickSnapshot):
         """
-        Command triggers periodically to check the state at Rackhams Peak. Right now this triggers every 10 minutes.
+        Runs on the scheduler to check the state at Rackhams Peak, every 10 minutes or every 5 during a cruise.
 
+        :param snapshot: The scheduler tick's shared data.
         :return: None
         """
         logger.info("Rackham's holiday loop running.")
         try:
             state, updated_at = await api_ph_check()
             logger.info(f"Rackham's holiday API check returned: {state}, last updated: {updated_at}")
+            # The tick's cached cruise state is enough to see nothing has changed, the fresh state is only fetched
+            # when the API disagrees with it
+            holiday_ongoing = (await snapshot.cruise_state())["state"] == CruiseSystemState.ACTIVE
+            if state == holiday_ongoing:
+                logger.debug("Rackham's holiday state unchanged: {}", state)
+                return
             await self._set_public_holiday_state(state, updated_at)
         except StaleDataException as e:
             logger.warning(f"{e}. Not using it.")
@@ -167,7 +180,7 @@ class PublicHoliday(commands.Cog):
         gif = random.choice(gifs)
 
         await interaction.followup.send(gif)
-        logger.debug(f"Sent GIF: {gif}")
+        logger.debug("Sent GIF: {}", gif)
 
     @app_commands.command(
         name="booze_started_admin_override",
@@ -225,7 +238,7 @@ class PublicHoliday(commands.Cog):
                 "An error occurred while trying to fetch the current holiday state."
             )
             return
-        logger.debug(f"Holiday state from database: {holiday_ongoing}")
+        logger.debug("Holiday state from database: {}", holiday_ongoing)
 
         if not holiday_ongoing:
             logger.info("No holiday ongoing, cannot set timestamp.")
@@ -3,14 +3,18 @@ Cog for all the commands that interact with the database
 
 """
 
+import asyncio
+import hashlib
+import json
 import math
+import time
 from datetime import datetime, timedelta
 from typing import Any, Literal
 
 import discord
 from discord import CustomActivity, Embed, Status, app_commands
 from discord.app_commands import describe
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ext.commands import Bot
 from ptn_utils.enums.booze_enums import CruiseSystemState
 from ptn_utils.global_constants import (
@@ -36,8 +40,10 @@ from ptn.boozebot.modules.helpers import (
     bc_channel_status,
     check_command_channel,
     check_roles,
-    track_last_run,
 )
+from ptn.boozebot.modules.Scheduler import ScheduledJob, TickSnapshot, scheduler
+from ptn.boozebot.modules.SendQueue import SendPriority, send_queue
+from ptn.boozebot.modules.Startup import startup
 
 """
 Statistics COMMANDS
@@ -56,6 +62,12 @@ Statistics COMMANDS
 
 logger = get_logger("boozebot.commands.statistics")
 
+# Minimum time between live tally refreshes triggered by websocket events
+LIVE_TALLY_REFRESH_INTERVAL = 30.0
+# Seconds between periodic stat updates: often during a cruise, rarely once it has ended
+STAT_UPDATE_INTERVAL = 600
+STAT_UPDATE_STATE_INTERVALS = {CruiseSystemState.ACTIVE: 300, CruiseSystemState.ENDED: 3600}
+
 
 def format_large_number(number: int | float) -> str:
     """
@@ -126,11 +138,120 @@ StatChoices = Literal[
 ]
 
 
+class TallyPublisher:
+    """
+    Keeps the pinned tally embeds up to date.
+
+    Pins already showing the same tally are not edited, and message handles are kept between publishes so an update
+    does not start with a fetch per pin. Edits go through the send queue concurrently, which keeps them within each
+    channel's rate limit.
+    """
+
+    _messages: dict[int, discord.Message | discord.PartialMessage]
+    _fingerprints: dict[int, str]
+
+    def __init__(self):
+        self._messages = {}
+        self._fingerprints = {}
+
+    @staticmethod
+    def fingerprint(embed: discord.Embed) -> str:
+        """
+        :param embed: The embed to fingerprint, built without the last updated timestamp.
+        :returns: A hash of the rendered embed.
+        """
+        return hashlib.sha256(json.dumps(embed.to_dict(), sort_keys=True).encode()).hexdigest()
+
+    async def publish(self, embed: discord.Embed, fingerprint: str, priority: SendPriority = SendPriority.LOW) -> int:
+        """
+        Edits every pinned tally that is not already showing the given tally.
+
+        :param embed: The embed to publish.
+        :param fingerprint: The fingerprint of the tally shown by the embed.
+        :param priority: The send queue priority of the edits, LOW unless someone is waiting on them.
+        :returns: The number of pinned messages edited.
+        """
+        pins = await database.get_all_pinned_messages()
+        stale_pins = [
+            (int(message_id), int(channel_id))
+            for message_id, channel_id in pins
+            if self._fingerprints.get(int(message_id)) != fingerprint
+        ]
+        if not stale_pins:
+            logger.debug("All {} pinned tallies are up to date, skipping edits", len(pins))
+            return 0
+
+        logger.info(f"Updating {len(stale_pins)} of {len(pins)} pinned tallies")
+        results = await asyncio.gather(
+            *(
+                self._edit(message_id, channel_id, embed, fingerprint, priority)
+                for message_id, channel_id in stale_pins
+            ),
+            return_exceptions=True,
+        )
+        for (message_id, _), result in zip(stale_pins, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.error(f"Failed to update pinned tally {message_id}: {result}")
+        return sum(result is True for result in results)
+
+    async def _edit(
+        self, message_id: int, channel_id: int, embed: discord.Embed, fingerprint: str, priority: SendPriority
+    ) -> bool:
+        message = self._messages.get(message_id)
+        if message is None:
+            channel = await bot.get_or_fetch.channel(channel_id)
+            message = channel.get_partial_message(message_id)
+
+        try:
+            edited = await send_queue.edit(message, priority, embed=embed)
+        except discord.NotFound:
+            logger.warning(f"Pinned tally message {message_id} no longer exists in channel {channel_id}")
+            self.forget(message_id)
+            return False
+
+        if edited is None:
+            # Dropped by the send queue, it is retried on the next publish
+            return False
+
+        self._messages[message_id] = edited
+        self._fingerprints[message_id] = fingerprint
+        logger.debug("Pinned tally {} updated successfully", message_id)
+        return True
+
+    def forget(self, message_id: int) -> None:
+        """
+        Drops the cached handle and fingerprint of an unpinned message.
+
+        :param message_id: The ID of the unpinned message.
+        """
+        self._messages.pop(message_id, None)
+        self._fingerprints.pop(message_id, None)
+
+    def clear(self) -> None:
+        """
+        Drops every cached handle and fingerprint.
+        """
+        self._messages.clear()
+        self._fingerprints.clear()
+
+
 class Statistics(commands.Cog):
     bot: Bot
+    tally_publisher: TallyPublisher
+    _live_refresh_task: asyncio.Task[None] | None
+    _last_live_refresh: float
+    _presence_text: str | None
+    periodic_stat_update: ScheduledJob
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
+        self.tally_publisher = TallyPublisher()
+        self._live_refresh_task = None
+        self._last_live_refresh = 0.0
+        self._presence_text = None
+        self.periodic_stat_update = scheduler.add_job(
+            "periodic_stat_update", self._periodic_stat_update, STAT_UPDATE_INTERVAL, STAT_UPDATE_STATE_INTERVALS
+        )
 
     async def build_stat_embed(
         self,
@@ -154,8 +275,14 @@ class Statistics(commands.Cog):
         fleet_carrier_buy_count = total_profit / 5000000000
 
         logger.debug(
-            f"Calculated stats - Carrier Count: {unique_carrier_count}, Total Wine: {total_wine}, Total Profit: {total_profit}, "
-            + f"Wine/Carrier: {wine_per_carrier}, PythonLoads: {python_loads}, Wine/Capita: {wine_per_capita}, Carrier Buys: {fleet_carrier_buy_count}"
+            "Calculated stats - Carrier Count: {}, Total Wine: {}, Total Profit: {}, Wine/Carrier: {}, PythonLoads: {}, Wine/Capita: {}, Carrier Buys: {}",
+            unique_carrier_count,
+            total_wine,
+            total_profit,
+            wine_per_carrier,
+            python_loads,
+            wine_per_capita,
+            fleet_carrier_buy_count,
         )
 
         if total_wine > 4000000:
@@ -362,7 +489,7 @@ class Statistics(commands.Cog):
 
         description_text = f"{state_text}## Wine Tonnes: {total_wine:,}\n\n"
 
-        logger.debug(f"Assembling extended stat embed description based on selected stat: {stat}")
+        logger.debug("Assembling extended stat embed description based on selected stat: {}", stat)
 
         match stat:
             case "All":
@@ -399,22 +526,108 @@ class Statistics(commands.Cog):
         logger.info("Extended stat embed built successfully")
         return stat_embed
 
+    async def publish_pinned_tally(self, cruise: Cruise, priority: SendPriority = SendPriority.LOW) -> None:
+        """
+        Updates the pinned tally embeds for the current cruise, skipping pins that already show these numbers.
+
+        :param cruise: The current cruise with stats.
+        :param priority: The send queue priority of the edits, LOW for background refreshes.
+        """
+        # Fingerprint the embed without the last updated timestamp, which changes on every build
+        fingerprint = TallyPublisher.fingerprint(await self.build_stat_embed(cruise))
+        stat_embed = await self.build_stat_embed(cruise, None, True)
+        await self.tally_publisher.publish(stat_embed, fingerprint, priority)
+
+    async def update_presence(self, cruise: Cruise) -> None:
+        """
+        Updates the bot activity status with the cruise wine total, if it has changed.
+
+        :param cruise: The current cruise with stats.
+        """
+        logger.debug("Updating bot activity status")
+        if await bc_channel_status():
+            state_text = f"Total Wine Tracked: {cruise.stats.total_wine:,}"
+            status = Status.online
+        else:
+            state_text = "Arrr, the wine be drained!"
+            status = Status.idle
+
+        if state_text == self._presence_text:
+            logger.debug("Bot activity status unchanged, skipping update")
+            return
+
+        await self.bot.change_presence(
+            activity=CustomActivity(name=state_text),
+            status=status,
+        )
+        self._presence_text = state_text
+        logger.debug("Bot activity status updated successfully")
+
+    async def get_cruise(self, cruise_select: int, include_not_unloaded: bool | None = None) -> Cruise | None:
+        """
+        Gets a cruise with stats, rendering the current cruise from the local aggregate while it matches the backend.
+
+        :param cruise_select: The cruise to get, counting backwards from 0 for this cruise.
+        :param include_not_unloaded: Whether to include carriers that have not unloaded yet.
+        :returns: The cruise, or None if it could not be found.
+        """
+        if (
+            cruise_select == 0
+            and include_not_unloaded is None
+            and (cruise := booze_sheets_api.cruise_aggregator.to_cruise())
+        ):
+            logger.debug("Using local cruise aggregate for current cruise stats")
+            return cruise
+        return await booze_sheets_api.get_cruise_with_stats(-cruise_select, include_not_unloaded)
+
+    def _mark_tally_dirty(self) -> None:
+        """
+        Schedules a refresh of the pinned tally and presence from the live stats, at most once per
+        LIVE_TALLY_REFRESH_INTERVAL.
+        """
+        if self._live_refresh_task and not self._live_refresh_task.done():
+            return
+
+        delay = max(self._last_live_refresh + LIVE_TALLY_REFRESH_INTERVAL - time.monotonic(), 0)
+        logger.debug("Live tally refresh scheduled in {:.1f}s", delay)
+        self._live_refresh_task = asyncio.create_task(self._refresh_live_tally(delay), name="live_tally_refresh")
+
+    async def _refresh_live_tally(self, delay: float) -> None:
+        await asyncio.sleep(delay)
+        self._last_live_refresh = time.monotonic()
+        cruise = booze_sheets_api.cruise_aggregator.to_cruise()
+        if cruise is None:
+            logger.debug("Cruise aggregate is not trusted, skipping live tally refresh")
+            return
+
+        try:
+            await self.publish_pinned_tally(cruise)
+            await self.update_presence(cruise)
+        except Exception as e:
+            logger.exception(f"Error during live tally refresh: {e}")
+
     """
     Pinned Stats and Activity Update Task Loop
 
     """
 
+    async def cog_load(self):
+        startup.add_task("periodic_stat_update", self.periodic_stat_update)
+
     @commands.Cog.listener()
-    async def on_ready(self):
-        logger.info("Starting periodic stat update task loop")
-        if not self.periodic_stat_update.is_running():
-            self.periodic_stat_update.start()
+    async def on_boozesheets_carrier_update(self, _data: dict[str, Any]):
+        logger.debug("BoozeSheets carrier update event received")
+        # The cruise aggregate has already been updated from the event by the BoozeSheets client
+        if booze_sheets_api.cruise_aggregator.trusted:
+            self._mark_tally_dirty()
 
     @commands.Cog.listener()
     async def on_boozesheets_carrier_created(self, data: dict[str, Any]):
         logger.info("BoozeSheets carrier created event received")
 
         carrier = BoozeCarrier(data.get("carrier", {}))
+        if booze_sheets_api.cruise_aggregator.trusted:
+            self._mark_tally_dirty()
 
         embed = Embed(
             title="New WineCarrier signed up!",
@@ -428,15 +641,13 @@ class Statistics(commands.Cog):
 
         steve_says = await bot.get_or_fetch.channel(CHANNEL_BC_STEVE_SAYS)
 
-        await steve_says.send(embed=embed)
+        await send_queue.send(steve_says, embed=embed)
 
         logger.info("New WineCarrier announcement sent to Steve Says channel")
 
-    @tasks.loop(minutes=10)
-    @track_last_run()
-    async def periodic_stat_update(self):
+    async def _periodic_stat_update(self, _snapshot: TickSnapshot):
         """
-        Loops every hour and updates all pinned embeds and bot activity status.
+        Runs on the scheduler and updates all pinned embeds and bot activity status.
 
         :returns: None
         """
@@ -444,49 +655,17 @@ class Statistics(commands.Cog):
         try:
             # Periodic trigger that updates all the stat embeds that are pinned.
 
-            # Get everything
-            all_pins = await database.get_all_pinned_messages()
-
-            cruise = await booze_sheets_api.get_cruise_with_stats(0)
+            # Fetching the cruise also cross-checks the local cruise aggregate used for live updates
+            cruise = await booze_sheets_api.cross_check_cruise_aggregate()
 
             if not cruise:
                 logger.warning("No cruise data available, skipping periodic stat update")
                 return
 
-            stat_embed = await self.build_stat_embed(cruise, None, True)
-
             logger.debug("Updating pinned messages with new stat embed")
-            if all_pins:
-                logger.info(f"Found {len(all_pins)} pinned messages to update")
-                for pin in all_pins:
-                    logger.debug(f"Updating pinned message: {pin}")
-                    channel = await bot.get_or_fetch.channel(int(pin[1]))
-                    message = await channel.fetch_message(pin[0])
-                    await message.edit(embed=stat_embed)
-                    logger.debug(f"Pinned message updated successfully: {pin}")
-                logger.info("All pinned messages updated successfully")
-            else:
-                logger.debug("No pinned messages found to update")
-
-            logger.debug("Updating bot activity status")
-            total_wine = cruise.stats.total_wine
-
-            if await bc_channel_status():
-                state_text = f"Total Wine Tracked: {total_wine:,}"
-                status = Status.online
-            else:
-                state_text = "Arrr, the wine be drained!"
-                status = Status.idle
-
-            activity = CustomActivity(
-                name=state_text,
-            )
+            await self.publish_pinned_tally(cruise)
 
-            await self.bot.change_presence(
-                activity=activity,
-                status=status,
-            )
-            logger.debug("Bot activity status updated successfully")
+            await self.update_presence(cruise)
             logger.info("Periodic stat update task completed successfully")
         except Exception as e:
             logger.exception(f"Error during periodic stat update: {e}")
@@ -544,7 +723,7 @@ class Statistics(commands.Cog):
 
         logger.info(f"Found {len(carrier_data)} carriers with wine remaining")
         for carrier in carrier_data:
-            logger.debug(f"Carrier with wine remaining: {carrier}")
+            logger.debug("Carrier with wine remaining: {}", carrier)
 
         async def buttons_callback(_view: PaginationView, interaction: discord.Interaction, title: str, index: int):
             carrier = carrier_data[index]
@@ -667,7 +846,7 @@ class Statistics(commands.Cog):
         )
         target_date = None
 
-        cruise = await booze_sheets_api.get_cruise_with_stats(-cruise_select, include_not_unloaded_bool)
+        cruise = await self.get_cruise(cruise_select, include_not_unloaded_bool)
 
         if cruise is None:
             await interaction.edit_original_response(
@@ -677,29 +856,16 @@ class Statistics(commands.Cog):
 
         if cruise_select != 0:
             target_date = cruise.ph_start.strftime("%Y-%m-%d")
-            logger.debug(f"Target date for historical cruise determined as: {target_date}")
+            logger.debug("Target date for historical cruise determined as: {}", target_date)
 
         stat_embed = await self.build_stat_embed(cruise, target_date=target_date)
 
         await interaction.edit_original_response(embed=stat_embed)
 
         if cruise_select == 0:
-            pinned_stat_embed = await self.build_stat_embed(cruise, None, True)
-
-            # Go update all the pinned embeds also.
-            pins = await database.get_all_pinned_messages()
-            if pins:
-                logger.debug(f"Updating pinned messages: {pins}")
-                for pin in pins:
-                    logger.debug(pin)
-                    channel = await bot.get_or_fetch.channel(pin[1])
-                    logger.debug(f"Channel matched as: {channel} from {pin[1]}")
-                    # Now go loop over every pin and update it
-                    message = await channel.fetch_message(pin[0])
-                    logger.debug(f"Message matched as: {message} from {pin[0]}")
-                    await message.edit(embed=pinned_stat_embed)
-            else:
-                logger.debug("No pinned messages to update")
+            # Go update all the pinned embeds also. Someone ran the command, so the edits are not held back like the
+            # background refreshes.
+            await self.publish_pinned_tally(cruise, SendPriority.NORMAL)
 
     @app_commands.command(
         name="booze_pin_message",
@@ -755,7 +921,7 @@ class Statistics(commands.Cog):
             await message.pin(reason=f"Pirate Steve pinned on behalf of {interaction.user.name}")
             logger.info(f"Message {message_id} was pinned.")
         else:
-            logger.debug(f"Message {message_id} is already pinned, no action needed")
+            logger.debug("Message {} is already pinned, no action needed", message_id)
 
         await interaction.edit_original_response(
             content=f"Pirate steve recorded message {message_link} for pinned updating"
@@ -784,8 +950,9 @@ class Statistics(commands.Cog):
                 channel = await bot.get_or_fetch.channel(int(pin[1]))
                 message = await channel.fetch_message(pin[0])
                 await message.unpin(reason=f"Pirate Steve unpinned at the request of: {interaction.user.name}")
-                logger.debug(f"Removed pinned message: {pin[0]}.")
+                logger.debug("Removed pinned message: {}.", pin[0])
             await database.clear_all_pins()
+            self.tally_publisher.clear()
             logger.info("All pinned messages removed successfully")
             await interaction.edit_original_response(content="Pirate Steve removed all the pinned stat messages")
         else:
@@ -826,8 +993,9 @@ class Statistics(commands.Cog):
             return
 
         await message.unpin(reason=f"Pirate Steve unpinned at the request of: {interaction.user.name}")
-        logger.debug(f"Unpinned message: {message_id}.")
+        logger.debug("Unpinned message: {}.", message_id)
         await database.unpin_message(message.id)
+        self.tally_publisher.forget(message.id)
         logger.info(f"Removed pinned message {message_id} from the database.")
         await interaction.edit_original_response(content=f"Pirate Steve unpinned the message {message_link}.")
 
@@ -866,16 +1034,19 @@ class Statistics(commands.Cog):
 
         cruise = "this" if cruise_select == 0 else f"-{cruise_select}"
         logger.debug(
-            f"User {interaction.user.name} ({interaction.user.id}) requested the current tally of the cruise stats for {cruise} cruise (extended stats)."
+            "User {} ({}) requested the current tally of the cruise stats for {} cruise (extended stats).",
+            interaction.user.name,
+            interaction.user.id,
+            cruise,
         )
         target_date = None
 
         include_not_unloaded_bool = include_not_unloaded == "All Carriers" if include_not_unloaded else None
-        cruise = await booze_sheets_api.get_cruise_with_stats(-cruise_select, include_not_unloaded_bool)
+        cruise = await self.get_cruise(cruise_select, include_not_unloaded_bool)
 
         if cruise_select != 0:
             target_date = cruise.ph_start.strftime("%Y-%m-%d")
-            logger.debug(f"Target date for historical cruise determined as: {target_date}")
+            logger.debug("Target date for historical cruise determined as: {}", target_date)
 
         stat_embed = await self.build_extended_stat_embed(cruise, target_date, stat)
         await interaction.edit_original_response(embed=stat_embed)
@@ -914,7 +1085,7 @@ class Statistics(commands.Cog):
         unloaded_carriers = total_carriers - remaining_carriers
 
         logger.debug(
-            f"User {interaction.user.name} ({interaction.user.id}) wanted to know the remaining time of the holiday."
+            "User {} ({}) wanted to know the remaining time of the holiday.", interaction.user.name, interaction.user.id
         )
         try:
             holiday_ongoing = (await booze_sheets_api.get_current_cruise_state())["state"] == CruiseSystemState.ACTIVE
@@ -1043,15 +1214,17 @@ class Statistics(commands.Cog):
         )
 
         logger.debug(
-            f"Carrier stats for {carrier_id} - Name: {carrier_stats.name}, "
-            + f"Total Wine: {carrier_stats.total_wine}, "
-            + f"Total Trips: {carrier_stats.total_trips}, "
-            + f"Total Cruises: {carrier_stats.total_cruises}, "
-            + f"Owner: {carrier_stats.owner}, "
-            + f"Average Wine per Trip: {average_wine_per_trip:.2f}, "
-            + f"Average Credits per Trip: {average_credits_per_trip:.2f},"
-            + f"First Unload Date: {formatted_first_unload_date}, "
-            + f"Last Unload Date: {formatted_last_unload_date}."
+            "Carrier stats for {} - Name: {}, Total Wine: {}, Total Trips: {}, Total Cruises: {}, Owner: {}, Average Wine per Trip: {:.2f}, Average Credits per Trip: {:.2f},First Unload Date: {}, Last Unload Date: {}.",
+            carrier_id,
+            carrier_stats.name,
+            carrier_stats.total_wine,
+            carrier_stats.total_trips,
+            carrier_stats.total_cruises,
+            carrier_stats.owner,
+            average_wine_per_trip,
+            average_credits_per_trip,
+            formatted_first_unload_date,
+            formatted_last_unload_date,
         )
 
         stat_embed = discord.Embed(
@@ -3,16 +3,20 @@
 Cog for unloading related commands
 """
 
+import asyncio
 import random
+import time
 from asyncio import Lock
-from dataclasses import dataclass
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, Literal, override
 
 import discord
 from discord import Interaction, app_commands
 from discord.app_commands import describe
-from discord.ext import commands, tasks
+from discord.ext import commands
 from discord.ext.commands import Bot
 from ptn_utils.enums.booze_enums import CruiseSystemState
 from ptn_utils.global_constants import (
@@ -35,8 +39,16 @@ from ptn.boozebot.classes.BoozeCarrier import BoozeCarrier
 from ptn.boozebot.constants import CARRIER_ID_RE, bot, unload_opened_gifs
 from ptn.boozebot.database.database import database
 from ptn.boozebot.modules.boozeSheetsApi import booze_sheets_api
-from ptn.boozebot.modules.helpers import check_command_channel, check_roles, is_staff, track_last_run
+from ptn.boozebot.modules.helpers import check_command_channel, check_roles, is_staff
+from ptn.boozebot.modules.metrics import (
+    UNLOAD_LOCK_WAIT,
+    UNLOAD_REACTION_EVALUATIONS,
+    UNLOAD_REACTION_EVENTS,
+    UNLOAD_REACTION_REST_CALLS_SAVED,
+)
+from ptn.boozebot.modules.SendQueue import SendPriority, send_queue
 from ptn.boozebot.modules.Settings import settings
+from ptn.boozebot.modules.Startup import startup
 from ptn.boozebot.modules.Views import DynamicButton
 
 """
@@ -49,6 +61,15 @@ UNLOADING COMMANDS
 
 logger = get_logger("boozebot.commands.unloading")
 
+# Window over which reaction events on one message are coalesced into a single evaluation
+REACTION_DEBOUNCE_SECONDS = 2.0
+# Discord allows roughly four reaction removals per second per channel
+REACTION_REMOVAL_INTERVAL = 0.25
+# How long after the last unload closes before RSTC is reminded to open another
+LAST_UNLOAD_REMINDER_DELAY = timedelta(minutes=20)
+# How long to wait before checking again when the reminder is due but cannot be sent yet
+LAST_UNLOAD_REMINDER_RETRY = timedelta(seconds=60)
+
 
 class UnloadOperationError(Exception):
     """Raised when an unload operation cannot be started or completed."""
@@ -69,26 +90,163 @@ class UnloadCompleteResult:
     unload_duration: float | None
 
 
+@dataclass(slots=True)
+class UnloadReactionTally:
+    carrier_id: str
+    # None until seeded from the message, for unloads opened before tallies were tracked
+    done_count: int | None
+
+
+@dataclass(slots=True)
+class PendingReactionBatch:
+    events_received: int = 0
+    # (emoji, member) pairs to remove, keyed by user and emoji so repeat events are removed once
+    disallowed: dict[tuple[int, str], tuple[discord.PartialEmoji, discord.Member]] = field(default_factory=dict)
+    task: asyncio.Task[None] | None = None
+
+
+@asynccontextmanager
+async def _timed_lock(lock: Lock, scope: Literal["carrier", "global"]) -> AsyncIterator[None]:
+    """
+    Acquires a lock, recording how long the caller waited for it.
+
+    :param lock: The lock to acquire.
+    :param scope: The lock scope label for the wait metric.
+    """
+    started = time.perf_counter()
+    async with lock:
+        UNLOAD_LOCK_WAIT.labels(scope=scope).observe(time.perf_counter() - started)
+        yield
+
+
+class LastUnloadReminder:
+    """
+    Fires the "last unload" reminder once LAST_UNLOAD_REMINDER_DELAY has passed since the last unload closed.
+
+    A single timer is rescheduled whenever the last unload time changes, i.e. when an unload opens or closes, or
+    when the callback asks to be retried.
+    Exposes the same start/cancel/is_running/next_iteration surface as a tasks.loop so it can be managed by the
+    background task commands.
+    """
+
+    last_run_time: datetime | None
+    last_unload_time: datetime | None
+    _retry_at: datetime | None
+    _running: bool
+    _timer: asyncio.Task[None] | None
+    _callback: Callable[[], Awaitable[None]]
+
+    def __init__(self, callback: Callable[[], Awaitable[None]]):
+        """
+        :param callback: Coroutine called when the reminder is due.
+        """
+        self.last_run_time = None
+        self.last_unload_time = None
+        self._retry_at = None
+        self._running = False
+        self._timer = None
+        self._callback = callback
+
+    @property
+    def next_iteration(self) -> datetime | None:
+        if self.last_unload_time is None:
+            return None
+        due_at = self.last_unload_time + LAST_UNLOAD_REMINDER_DELAY
+        if self._retry_at is not None:
+            return max(due_at, self._retry_at)
+        return due_at
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self) -> None:
+        self._running = True
+        self._reschedule()
+
+    def cancel(self) -> None:
+        self._running = False
+        self._reschedule()
+
+    def set_last_unload_time(self, last_unload_time: datetime | None) -> None:
+        """
+        Sets the time the last unload closed and reschedules the reminder.
+
+        :param last_unload_time: The time the last unload closed, or None to clear the reminder.
+        """
+        self.last_unload_time = last_unload_time
+        self._retry_at = None
+        self._reschedule()
+
+    def retry_later(self) -> None:
+        """
+        Checks again after LAST_UNLOAD_REMINDER_RETRY, for a reminder which is due but could not be sent yet.
+        """
+        self._retry_at = datetime.now(UTC) + LAST_UNLOAD_REMINDER_RETRY
+        self._reschedule()
+
+    def _reschedule(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+
+        if self._running and self.last_unload_time is not None:
+            logger.debug("Scheduling last unload reminder for {}", self.next_iteration)
+            self._timer = asyncio.create_task(self._fire_when_due(), name="last_unload_reminder")
+
+    async def _fire_when_due(self) -> None:
+        await asyncio.sleep(max((self.next_iteration - datetime.now(UTC)).total_seconds(), 0))
+        # Detach before running so the callback can reschedule without cancelling itself
+        self._timer = None
+        self.last_run_time = datetime.now(UTC)
+        try:
+            await self._callback()
+        except Exception as e:
+            logger.exception(f"Failed to process last unload reminder: {e}")
+
+
 # initialise the Cog and attach our global error handler
 class Unloading(commands.Cog):
     bot: Bot
     reaction_lock: Lock
     unload_lock: Lock
+    carrier_locks: dict[str, Lock]
     REACTION_THRESHOLD: Literal[5, 1] = 5 if _production else 1
     ctx_menu_close_unload_command: app_commands.ContextMenu
+    unload_reaction_tallies: dict[int, UnloadReactionTally]
+    pending_reaction_batches: dict[int, PendingReactionBatch]
+    last_unload_reminder: LastUnloadReminder
 
     def __init__(self, bot: commands.Bot):
         self.bot = bot
         self.reaction_lock = Lock()
+        # Guards state shared between carriers, each carrier's unload is serialised by its own lock
         self.unload_lock = Lock()
+        self.carrier_locks = {}
+        self.unload_reaction_tallies = {}
+        self.pending_reaction_batches = {}
+        self.last_unload_reminder = LastUnloadReminder(self._send_last_unload_reminder)
         self.ctx_menu_close_unload_command = app_commands.ContextMenu(
             name="Close Unload", callback=self.ctx_menu_close_unload
         )
         logger.debug("Adding context menu command: Close Unload")
         self.bot.tree.add_command(self.ctx_menu_close_unload_command)
 
+    @override
+    async def cog_load(self):
+        startup.add_task("last_unload_reminder", self.last_unload_reminder)
+        for row in await database.get_unload_reaction_tallies():
+            self.unload_reaction_tallies[row["unload_id"]] = UnloadReactionTally(
+                carrier_id=row["carrier_id"], done_count=row["unload_done_reactions"]
+            )
+        logger.debug("Loaded {} unload reaction tallies from database.", len(self.unload_reaction_tallies))
+        self.last_unload_reminder.set_last_unload_time(await database.get_last_unload_time())
+
     @override
     async def cog_unload(self):
+        self.last_unload_reminder.cancel()
+        for batch in self.pending_reaction_batches.values():
+            if batch.task:
+                batch.task.cancel()
         self.bot.tree.remove_command(
             self.ctx_menu_close_unload_command.name, type=self.ctx_menu_close_unload_command.type
         )
@@ -109,7 +267,7 @@ class Unloading(commands.Cog):
         """
         Start a carrier unload operation.
         """
-        async with self.unload_lock:
+        async with _timed_lock(self._get_carrier_lock(carrier_id), "carrier"):
             try:
                 if (await booze_sheets_api.get_current_cruise_state())["state"] != CruiseSystemState.ACTIVE:
                     raise UnloadOperationError(
@@ -174,26 +332,33 @@ class Unloading(commands.Cog):
 
             try:
                 wine_alert_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CELLAR_UNLOADING)
-                wine_unload_alert = await wine_alert_channel.send(embed=wine_load_embed)
-                self.last_unload_time = None
+                wine_unload_alert = await send_queue.send(wine_alert_channel, embed=wine_load_embed)
+                await self._set_last_unload_time(None)
 
                 discord_alert_id = wine_unload_alert.id
                 delay = settings.get_setting("timed_unload_hold_duration") if is_timed else None
 
                 await database.set_unload_message_for_carrier(carrier_id, discord_alert_id)
                 await database.set_unload_notification_sent(carrier_id, False)
+                await database.set_unload_reaction_count(carrier_id, 0)
+                self.unload_reaction_tallies[discord_alert_id] = UnloadReactionTally(
+                    carrier_id=carrier_id, done_count=0
+                )
                 await booze_sheets_api.start_carrier_unload(carrier_db_id, delay=delay)
 
                 booze_cruise_chat = await bot.get_or_fetch.channel(CHANNEL_BC_BOOZE_CRUISE_CHAT)
                 if is_timed:
-                    await booze_cruise_chat.send(
-                        f"A new wine unload will be opening soon. See <#{wine_unload_alert.channel.id}>"
+                    await send_queue.send(
+                        booze_cruise_chat,
+                        content=f"A new wine unload will be opening soon. See <#{wine_unload_alert.channel.id}>",
                     )
                 else:
-                    await booze_cruise_chat.send(
-                        f"A new wine unload is in progress. See <#{wine_unload_alert.channel.id}>"
+                    await send_queue.send(
+                        booze_cruise_chat,
+                        content=f"A new wine unload is in progress. See <#{wine_unload_alert.channel.id}>",
                     )
-                await booze_cruise_chat.send(random.choice(unload_opened_gifs))
+                # Cosmetic, so not awaited and may be dropped if the channel is busy
+                send_queue.send(booze_cruise_chat, SendPriority.LOW, content=random.choice(unload_opened_gifs))
             except Exception as e:
                 logger.exception(f"Failed to start unload for carrier {carrier_id}: {e}")
                 raise UnloadOperationError(
@@ -214,13 +379,12 @@ class Unloading(commands.Cog):
         """
         Complete a carrier unload operation.
         """
+        if not carrier_data:
+            raise UnloadOperationError("Carrier data was not provided.")
 
-        async with self.unload_lock:
-            if not carrier_data:
-                raise UnloadOperationError("Carrier data was not provided.")
-
-            carrier_id = carrier_data.carrier_identifier
+        carrier_id = carrier_data.carrier_identifier
 
+        async with _timed_lock(self._get_carrier_lock(carrier_id), "carrier"):
             if requested_by and not carrier_data.is_owned_by(requested_by) and not is_staff(requested_by):
                 raise UnloadOperationError(f"Carrier {carrier_id} is not owned by you.")
 
@@ -247,10 +411,11 @@ class Unloading(commands.Cog):
                     )
 
                 await database.delete_carrier_message(carrier_id, "unload")
+                self.unload_reaction_tallies.pop(message_id, None)
                 logger.info(f"Removed unload notification from database for carrier: {carrier_id}.")
 
                 completed_trip = await booze_sheets_api.complete_carrier_unload(carrier_data.db_id)
-                self.last_unload_time = datetime.now(UTC)
+                await self._set_last_unload_time(datetime.now(UTC))
             except Exception as e:
                 logger.exception(f"Failed to complete unload for carrier {carrier_id}: {e}")
                 raise UnloadOperationError(
@@ -259,122 +424,220 @@ class Unloading(commands.Cog):
 
             return UnloadCompleteResult(unload_duration=completed_trip.unload_duration)
 
+    def _get_carrier_lock(self, carrier_id: str) -> Lock:
+        """
+        Returns the lock serialising unload operations for a carrier, creating it on first use.
+
+        :param carrier_id: The carrier ID string.
+        :returns: The carrier's lock.
+        """
+        return self.carrier_locks.setdefault(carrier_id.upper(), Lock())
+
     """
     This class is a collection functionality for tracking a booze cruise unload operations
     """
-    last_unload_time: datetime | None = None
 
     # On reaction check if it's in the unloading channel and if the reaction is fc complete,
-    # If it is and there are 5 reactions ping the poster
+    # If it is and there are 5 reactions ping the poster.
+    # Reactions are counted locally and coalesced per message, so a flood of reactions results in one
+    # evaluation per message per REACTION_DEBOUNCE_SECONDS.
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, reaction_event: discord.RawReactionActionEvent):
-        try:
-            user = reaction_event.member
+        user = reaction_event.member
 
-            if user.bot:
-                return
+        if user.bot:
+            return
 
-            if reaction_event.channel_id != CHANNEL_BC_WINE_CELLAR_UNLOADING:
-                return
+        if reaction_event.channel_id != CHANNEL_BC_WINE_CELLAR_UNLOADING:
+            return
 
-            channel = await bot.get_or_fetch.channel(reaction_event.channel_id)
-            message = await channel.fetch_message(reaction_event.message_id)
+        if reaction_event.message_author_id != bot.user.id:
+            return
 
-            if message.pinned:
-                return
+        logger.debug(
+            "Queueing unload reaction {} from user {} on message {}",
+            reaction_event.emoji,
+            user.name,
+            reaction_event.message_id,
+        )
 
-            if message.author.id != bot.user.id:
-                return
+        batch = self._get_reaction_batch(reaction_event.message_id)
+
+        reaction_allowed_roles = {*any_council_role, *any_moderation_role, ROLE_CONN}
+        if reaction_event.emoji.id != EMOJI_CARRIER_DONE:
+            if not {role.id for role in user.roles} & reaction_allowed_roles:
+                batch.disallowed[(user.id, str(reaction_event.emoji))] = (reaction_event.emoji, user)
+            return
 
+        tally = self.unload_reaction_tallies.get(reaction_event.message_id)
+        if tally and tally.done_count is not None:
+            tally.done_count += 1
+
+    @commands.Cog.listener()
+    async def on_raw_reaction_remove(self, reaction_event: discord.RawReactionActionEvent):
+        if reaction_event.channel_id != CHANNEL_BC_WINE_CELLAR_UNLOADING:
+            return
+
+        if reaction_event.emoji.id != EMOJI_CARRIER_DONE or reaction_event.user_id == bot.user.id:
+            return
+
+        tally = self.unload_reaction_tallies.get(reaction_event.message_id)
+        if tally is None or tally.done_count is None:
+            return
+
+        tally.done_count = max(tally.done_count - 1, 0)
+        # Evaluate with the adds so the persisted count is written once per window
+        self._get_reaction_batch(reaction_event.message_id)
+        logger.debug("FC complete reaction removed, count for {} is now {}.", tally.carrier_id, tally.done_count)
+
+    def _get_reaction_batch(self, message_id: int) -> PendingReactionBatch:
+        """
+        Returns the pending reaction batch for a message, scheduling its evaluation if one is not already pending.
+
+        :param message_id: The ID of the reacted message.
+        :returns: The pending batch.
+        """
+        UNLOAD_REACTION_EVENTS.inc()
+        batch = self.pending_reaction_batches.get(message_id)
+        if batch is None:
+            batch = PendingReactionBatch()
+            batch.task = asyncio.create_task(self._evaluate_reaction_batch(message_id))
+            self.pending_reaction_batches[message_id] = batch
+        batch.events_received += 1
+        return batch
+
+    async def _evaluate_reaction_batch(self, message_id: int) -> None:
+        """
+        Waits out the debounce window, then removes disallowed reactions and checks the FC complete threshold once
+        for every reaction event received on the message during the window.
+
+        :param message_id: The ID of the reacted message.
+        """
+        await asyncio.sleep(REACTION_DEBOUNCE_SECONDS)
+        batch = self.pending_reaction_batches.pop(message_id)
+        UNLOAD_REACTION_EVALUATIONS.inc()
+        rest_calls = 0
+
+        try:
+            tally = self.unload_reaction_tallies.get(message_id)
             logger.debug(
-                f"Processing unload reaction {reaction_event.emoji} from user {user.name} in channel {channel.name}"
+                "Evaluating {} reaction event(s) on message {} ({} disallowed).",
+                batch.events_received,
+                message_id,
+                len(batch.disallowed),
             )
 
-            reaction_allowed_roles = {*any_council_role, *any_moderation_role, ROLE_CONN}
-            if reaction_event.emoji.id != EMOJI_CARRIER_DONE:
-                logger.debug(f"Reaction {reaction_event.emoji} is not FC complete emoji.")
-                if not {role.id for role in user.roles} & reaction_allowed_roles:
-                    logger.debug(
-                        f"User {user.name} does not have permission to add reaction {reaction_event.emoji}. Removing reaction."
-                    )
-                    await message.remove_reaction(reaction_event.emoji, reaction_event.member)
-                    logger.info(f"Removed unload reaction {reaction_event.emoji} from user {user.name}")
+            channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CELLAR_UNLOADING)
+            # The message is only fetched to seed an untracked tally or to check if a non-alert message is pinned
+            needs_seed = tally is not None and tally.done_count is None
+            needs_pin_check = tally is None and bool(batch.disallowed)
+            message: discord.Message | discord.PartialMessage = channel.get_partial_message(message_id)
+            if needs_seed or needs_pin_check:
+                message = await channel.fetch_message(message_id)
+                rest_calls += 1
+
+            if needs_seed:
+                self._seed_unload_reaction_tally(message, tally)
+
+            # Other messages in the channel may be pinned info posts, which anyone can react to
+            if batch.disallowed and not (needs_pin_check and message.pinned):
+                rest_calls += await self._remove_disallowed_reactions(message, batch)
+
+            if tally is None:
                 return
 
-            logger.debug(f"Reaction {reaction_event.emoji} is FC complete emoji. Checking reaction count.")
-
-            # Check if the FC complete reaction count meets the threshold
-            for message_reaction in message.reactions:
-                logger.debug(f"Checking reaction: {message_reaction.emoji} with count {message_reaction.count}")
-                if (
-                    message_reaction.emoji.id == EMOJI_CARRIER_DONE
-                    and message_reaction.count >= self.REACTION_THRESHOLD
-                ):
-                    # Find carrier data for this message from the database
-                    logger.debug(
-                        f"FC complete reaction count for message {message.id} has reached threshold. Notifying poster."
-                    )
+            await database.set_unload_reaction_count(tally.carrier_id, tally.done_count)
+            logger.debug("FC complete reaction count for {} is now {}.", tally.carrier_id, tally.done_count)
 
-                    carrier_id = await database.get_carrier_for_unload_message(message.id)
-
-                    if not carrier_id:
-                        logger.warning(
-                            f"Could not find carrier ID for unload message {message.id}. Cannot notify poster."
-                        )
-                        return
-                    async with self.reaction_lock:
-                        if await database.get_unload_notification_sent(carrier_id):
-                            logger.info(
-                                f"Unload notification for carrier {carrier_id} has already been sent. Skipping notification."
-                            )
-                            return
-
-                        logger.debug(f"Fetching carrier data for ID: {carrier_id}")
-
-                        carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
-
-                        logger.debug(
-                            f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}"
-                        )
-
-                        close_button = DynamicButton(
-                            label="Close Unload",
-                            action="close_unload",
-                            user_id=carrier_data.owner.discord_id,
-                            payload=carrier_data.carrier_identifier,
-                        )
-
-                        view = discord.ui.View()
-                        view.add_item(close_button)
-
-                        wine_carrier_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER_COMMAND)
-                        await wine_carrier_channel.send(
-                            content=f"{carrier_data.owner.mention} "
-                            + f"Your unload for {carrier_data.carrier_name} ({carrier_data.carrier_identifier}) "
-                            + "has been marked completed. Please check, then click the button below to close it "
-                            + "if it is correct.",
-                            view=view,
-                        )
-
-                        logger.debug("Updating database to set to NULL to avoid multiple notifications.")
-                        await database.set_unload_notification_sent(carrier_data.carrier_identifier, True)
-
-                        logger.info(
-                            f"Notified poster {carrier_data.owner.username} for carrier {carrier_data.carrier_identifier}"
-                        )
-                break
+            if tally.done_count >= self.REACTION_THRESHOLD:
+                logger.debug(
+                    "FC complete reaction count for message {} has reached threshold. Notifying poster.", message_id
+                )
+                await self._notify_unload_complete(tally.carrier_id)
 
         except Exception as e:
-            logger.exception(f"Failed to process reaction: {reaction_event}. Error: {e}")
+            logger.exception(f"Failed to process reactions on message {message_id}. Error: {e}")
+        finally:
+            # Each event used to fetch the message on its own
+            UNLOAD_REACTION_REST_CALLS_SAVED.inc(max(batch.events_received - rest_calls, 0))
 
-    @commands.Cog.listener()
-    async def on_ready(self):
-        logger.info("Starting the last unload time loop")
-        if not self.last_unload_time_loop.is_running():
-            self.last_unload_time_loop.start()
-            logger.debug("Last unload time loop started")
-        else:
-            logger.debug("Last unload time loop is already running")
+    def _seed_unload_reaction_tally(self, message: discord.Message, tally: UnloadReactionTally) -> None:
+        """
+        Seeds a tally from the live message, for unload alerts posted before tallies were tracked.
+        """
+        logger.info(f"Seeding unload reaction tally for {tally.carrier_id} from message {message.id}.")
+        tally.done_count = 0
+        for message_reaction in message.reactions:
+            emoji = message_reaction.emoji
+            if isinstance(emoji, discord.PartialEmoji | discord.Emoji) and emoji.id == EMOJI_CARRIER_DONE:
+                tally.done_count = message_reaction.count - (1 if message_reaction.me else 0)
+
+    async def _remove_disallowed_reactions(
+        self, message: discord.Message | discord.PartialMessage, batch: PendingReactionBatch
+    ) -> int:
+        """
+        Removes reactions added by users who may not react to Steve's messages in the unloading channel.
+        Removals are paced to stay inside Discord's reaction rate limit rather than relying on 429 retries.
+
+        :returns: The number of REST calls made.
+        """
+        rest_calls = 0
+        for emoji, member in batch.disallowed.values():
+            if rest_calls:
+                await asyncio.sleep(REACTION_REMOVAL_INTERVAL)
+            logger.debug("User {} does not have permission to add reaction {}. Removing reaction.", member.name, emoji)
+            try:
+                await message.remove_reaction(emoji, member)
+                logger.info(f"Removed unload reaction {emoji} from user {member.name}")
+            except discord.HTTPException as e:
+                logger.warning(f"Failed to remove unload reaction {emoji} from user {member.name}: {e}")
+            rest_calls += 1
+        return rest_calls
+
+    async def _notify_unload_complete(self, carrier_id: str) -> None:
+        """
+        Pings the carrier owner with a close button once their unload has been marked complete.
+        """
+        async with self.reaction_lock:
+            if await database.get_unload_notification_sent(carrier_id):
+                logger.info(
+                    f"Unload notification for carrier {carrier_id} has already been sent. Skipping notification."
+                )
+                return
+
+            logger.debug("Fetching carrier data for ID: {}", carrier_id)
+
+            carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
+
+            logger.opt(lazy=True).debug(
+                "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+            )
+
+            close_button = DynamicButton(
+                label="Close Unload",
+                action="close_unload",
+                user_id=carrier_data.owner.discord_id,
+                payload=carrier_data.carrier_identifier,
+            )
+
+            view = discord.ui.View()
+            view.add_item(close_button)
+
+            wine_carrier_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER_COMMAND)
+            await send_queue.send(
+                wine_carrier_channel,
+                SendPriority.HIGH,
+                content=f"{carrier_data.owner.mention} "
+                + f"Your unload for {carrier_data.carrier_name} ({carrier_data.carrier_identifier}) "
+                + "has been marked completed. Please check, then click the button below to close it "
+                + "if it is correct.",
+                view=view,
+            )
+
+            logger.debug("Updating database to set to NULL to avoid multiple notifications.")
+            await database.set_unload_notification_sent(carrier_data.carrier_identifier, True)
+
+            logger.info(f"Notified poster {carrier_data.owner.username} for carrier {carrier_data.carrier_identifier}")
 
     @commands.Cog.listener()
     async def on_dynamic_button_close_unload(self, interaction: Interaction, button: DynamicButton):
@@ -386,11 +649,13 @@ class Unloading(commands.Cog):
 
         carrier_id = button.payload
 
-        logger.debug(f"Fetching carrier data for ID: {carrier_id}")
+        logger.debug("Fetching carrier data for ID: {}", carrier_id)
 
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
 
-        logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}")
+        logger.opt(lazy=True).debug(
+            "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+        )
 
         if not carrier_data:
             error_msg = f"Carrier {carrier_id} was not found."
@@ -409,7 +674,7 @@ class Unloading(commands.Cog):
 
         unload_duration = result.unload_duration
 
-        logger.debug(f"Calculated unload duration: {unload_duration} seconds")
+        logger.debug("Calculated unload duration: {} seconds", unload_duration)
 
         minutes, seconds = divmod(int(unload_duration), 60)
         time_str = f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
@@ -429,10 +694,11 @@ class Unloading(commands.Cog):
 
         logger.info(f"Wine unload for carrier {carrier_id} completed by {interaction.user.name}.")
         # channel is rstc
-        message = await interaction.channel.send(
-            content=f"{interaction.user.mention} {response}", allowed_mentions=allowed_mentions
+        message = await send_queue.send(
+            interaction.channel, content=f"{interaction.user.mention} {response}", allowed_mentions=allowed_mentions
         )
-        await message.edit(
+        await send_queue.edit(
+            message,
             content=f"<@&{ROLE_CONN}> {interaction.user.mention} {response}",
             allowed_mentions=allowed_mentions,
             view=None,
@@ -477,14 +743,16 @@ class Unloading(commands.Cog):
             success = True
             if rstc_channel := await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER_COMMAND):
                 if delay:
-                    await rstc_channel.send(
-                        f"Timed wine unload requested via boozesheets for **{carrier_name} ({carrier_id})**\n"
-                        + f"Open the market at {result.open_time_str} (In game time)."
+                    await send_queue.send(
+                        rstc_channel,
+                        content=f"Timed wine unload requested via boozesheets for **{carrier_name} ({carrier_id})**\n"
+                        + f"Open the market at {result.open_time_str} (In game time).",
                     )
                 else:
-                    await rstc_channel.send(
+                    await send_queue.send(
+                        rstc_channel,
                         content=f"Wine unload requested via boozesheets for **{carrier_name} ({carrier_id})** "
-                        + "processed successfully."
+                        + "processed successfully.",
                     )
         except UnloadOperationError as e:
             logger.warning(f"Failed to start unload for carrier {carrier_id} from unload_request event: {e}")
@@ -492,59 +760,61 @@ class Unloading(commands.Cog):
 
         if action_id:
             logger.debug(
-                f"Sending action ack for unload_request event with action_id {action_id}, success={success}, error={error}"
+                "Sending action ack for unload_request event with action_id {}, success={}, error={}",
+                action_id,
+                success,
+                error,
             )
             await booze_sheets_api.send_action_ack(action_id, success=success, error=error)
 
-    @tasks.loop(seconds=60.0)
-    @track_last_run()
-    async def last_unload_time_loop(self):
-        """
-        Checks if the last unload time was more than 20 minutes ago and sends a reminder message to the RSTC channel.
+    async def _set_last_unload_time(self, last_unload_time: datetime | None) -> None:
         """
+        Records when the last unload closed, rescheduling the reminder and persisting it across restarts.
 
-        logger.info("Running last unload time loop.")
+        :param last_unload_time: The time the last unload closed, or None once an unload opens.
+        """
+        async with _timed_lock(self.unload_lock, "global"):
+            self.last_unload_reminder.set_last_unload_time(last_unload_time)
+            await database.set_last_unload_time(last_unload_time)
 
-        try:
-            carriers = await booze_sheets_api.get_unloading_carriers()
-            if carriers:
-                logger.info("An unload is currently open, skipping reminder check.")
-                return
-        except Exception as e:
-            logger.error(e)
-            logger.exception(e)
+    async def _send_last_unload_reminder(self) -> None:
+        """
+        Sends a reminder message to the RSTC channel when no unload has been opened since the last one closed.
+        """
+        logger.info("Last unload reminder is due.")
 
-        if self.last_unload_time is None:
-            logger.info("Last unload time is not set, skipping reminder check.")
+        if booze_sheets_api.has_open_unloads():
+            logger.info("An unload is currently open, checking again later.")
+            self.last_unload_reminder.retry_later()
             return
 
         try:
-            holiday_ongoing = (await booze_sheets_api.get_current_cruise_state())["state"] == CruiseSystemState.ACTIVE
+            holiday_ongoing = (await booze_sheets_api.get_cached_cruise_state())["state"] == CruiseSystemState.ACTIVE
         except Exception as e:
-            logger.error(f"Error while fetching current cruise state for last unload time loop: {e}")
+            logger.error(f"Error while fetching current cruise state for last unload reminder: {e}")
+            self.last_unload_reminder.retry_later()
             return
 
         if not holiday_ongoing:
-            logger.info("No active ph, skipping last unload time reminder check.")
+            logger.info("No active ph, checking again later.")
+            self.last_unload_reminder.retry_later()
             return
 
-        if datetime.now(tz=UTC) - self.last_unload_time >= timedelta(minutes=20):
-            logger.info("Last unload time was more than 20 minutes ago, sending reminder message.")
-            try:
-                rstc_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER_COMMAND)
-                timestamp = int(self.last_unload_time.timestamp())
-                content = f"Arrr, ye scurvy dogs! Our last booze unload was <t:{timestamp}:R>. Might be time to open another vessel to the people, ye think?"
-                message = await rstc_channel.send(content)
-                await message.edit(content=f"<@&{ROLE_CONN}> {content}")
-                await message.add_reaction("🏴‍☠️")
-                logger.info("Reminder message sent to RSTC channel.")
-                # Set the flag back to None so we don't keep sending messages
-                self.last_unload_time = None
-                logger.debug("Last unload time reset to None after sending reminder.")
-            except discord.DiscordException as e:
-                logger.exception(f"Failed to notify RSTC channel about the last unload time: {e}")
-        else:
-            logger.info("Last unload time loop completed without sending reminder.")
+        last_unload_time = self.last_unload_reminder.last_unload_time
+        logger.info("Last unload time was more than 20 minutes ago, sending reminder message.")
+        try:
+            rstc_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER_COMMAND)
+            timestamp = int(last_unload_time.timestamp())
+            content = f"Arrr, ye scurvy dogs! Our last booze unload was <t:{timestamp}:R>. Might be time to open another vessel to the people, ye think?"
+            message = await send_queue.send(rstc_channel, content=content)
+            await send_queue.edit(message, content=f"<@&{ROLE_CONN}> {content}")
+            await message.add_reaction("🏴‍☠️")
+            logger.info("Reminder message sent to RSTC channel.")
+            # Set the time back to None so we don't keep sending messages
+            await self._set_last_unload_time(None)
+            logger.debug("Last unload time reset to None after sending reminder.")
+        except discord.DiscordException as e:
+            logger.exception(f"Failed to notify RSTC channel about the last unload time: {e}")
 
     @check_roles(
         [
@@ -571,11 +841,13 @@ class Unloading(commands.Cog):
                 await interaction.edit_original_response(content=error_msg)
                 return
 
-            logger.debug(f"Fetching carrier data for ID: {carrier_id}")
+            logger.debug("Fetching carrier data for ID: {}", carrier_id)
 
             carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
 
-            logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}")
+            logger.opt(lazy=True).debug(
+                "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+            )
 
             if not carrier_data:
                 error_msg = f"Carrier {carrier_id} was not found. Cannot close unload."
@@ -601,11 +873,13 @@ class Unloading(commands.Cog):
 
             logger.info(f"Unload for carrier {carrier_id} closed by {interaction.user.name}.")
             rstc_channel = await bot.get_or_fetch.channel(CHANNEL_BC_WINE_CARRIER_COMMAND)
-            message = await rstc_channel.send(
-                content=f"{interaction.user.mention} {response}", allowed_mentions=allowed_mentions
+            message = await send_queue.send(
+                rstc_channel, content=f"{interaction.user.mention} {response}", allowed_mentions=allowed_mentions
             )
-            await message.edit(
-                content=f"<@&{ROLE_CONN}> {interaction.user.mention} {response}", allowed_mentions=allowed_mentions
+            await send_queue.edit(
+                message,
+                content=f"<@&{ROLE_CONN}> {interaction.user.mention} {response}",
+                allowed_mentions=allowed_mentions,
             )
 
             await interaction.edit_original_response(content=response)
@@ -729,10 +1003,12 @@ class Unloading(commands.Cog):
             await interaction.edit_original_response(content=msg)
             return
 
-        logger.debug(f"Fetching carrier data for ID: {carrier_id}")
+        logger.debug("Fetching carrier data for ID: {}", carrier_id)
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
 
-        logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}")
+        logger.opt(lazy=True).debug(
+            "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+        )
 
         if not carrier_data:
             error_msg = f"Carrier {carrier_id} was not found."
@@ -740,7 +1016,9 @@ class Unloading(commands.Cog):
             await interaction.followup.send(error_msg)
             return
 
-        logger.debug(f"Preparing to send unload notification to Discord for carrier {carrier_data.carrier_identifier}.")
+        logger.debug(
+            "Preparing to send unload notification to Discord for carrier {}.", carrier_data.carrier_identifier
+        )
         await interaction.edit_original_response(content="**Sending to Discord...**")
         if not carrier_data.is_owned_by(interaction.user) and not is_staff(interaction.user):
             await interaction.edit_original_response(content=f"Carrier {carrier_id} is not owned by you.")
@@ -819,11 +1097,13 @@ class Unloading(commands.Cog):
             await interaction.followup.send(msg)
             return
 
-        logger.debug(f"Fetching carrier data for ID: {carrier_id}")
+        logger.debug("Fetching carrier data for ID: {}", carrier_id)
 
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
 
-        logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}")
+        logger.opt(lazy=True).debug(
+            "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+        )
 
         if not carrier_data:
             error_msg = f"Carrier {carrier_id} was not found."
@@ -832,7 +1112,7 @@ class Unloading(commands.Cog):
             return
 
         logger.debug(
-            f"Preparing to send timed unload notification to Discord for carrier {carrier_data.carrier_identifier}."
+            "Preparing to send timed unload notification to Discord for carrier {}.", carrier_data.carrier_identifier
         )
         await interaction.edit_original_response(content="**Sending to Discord...**")
         if not carrier_data.is_owned_by(interaction.user) and not is_staff(interaction.user):
@@ -899,9 +1179,11 @@ class Unloading(commands.Cog):
             await interaction.edit_original_response(content=msg)
             return
 
-        logger.debug(f"Fetching carrier data for ID: {carrier_id}")
+        logger.debug("Fetching carrier data for ID: {}", carrier_id)
         carrier_data = await booze_sheets_api.get_carrier_info(carrier_id)
-        logger.debug(f"Fetched carrier data: {carrier_data.to_dictionary() if carrier_data else 'None'}")
+        logger.opt(lazy=True).debug(
+            "Fetched carrier data: {}", lambda: carrier_data.to_dictionary() if carrier_data else "None"
+        )
 
         if not carrier_data:
             error_msg = f"Carrier {carrier_id} not found in the database."
@@ -918,7 +1200,7 @@ class Unloading(commands.Cog):
 
         unload_duration = result.unload_duration
 
-        logger.debug(f"Calculated unload duration: {unload_duration} seconds")
+        logger.debug("Calculated unload duration: {} seconds", unload_duration)
 
         minutes, seconds = divmod(int(unload_duration), 60)
         time_str = f"{minutes}m {seconds}s" if minutes else f"{seconds}s"
@@ -2,8 +2,6 @@ import re
 from datetime import datetime, timedelta
 from typing import TypedDict
 
-from discord import Member, Message
-from ptn_utils.global_constants import ROLE_CONN, ROLE_SOMM, any_council_role, any_moderation_role
 from ptn_utils.logger.logger import get_logger
 
 logger = get_logger("boozebot.classes.autoresponse")
@@ -14,6 +12,7 @@ class _InfoDict(TypedDict):
     trigger: str
     response: str
     is_regex: bool
+    disabled: bool
 
 
 class AutoResponse:
@@ -25,15 +24,19 @@ class AutoResponse:
         trigger (str | re.Pattern): The trigger phrase for the auto response.
         is_regex (bool): Whether the trigger is a regex pattern.
         response (str): The response message to send when the trigger is matched.
+        disabled (bool): Whether the regex trigger was disabled for overrunning its time budget.
+        regex_timeouts (int): How many times the regex trigger has overrun its time budget since it was loaded.
     """
 
     trigger: str | re.Pattern[str]
     response: str
     is_regex: bool
     name: str
+    disabled: bool
+    regex_timeouts: int
 
     def __init__(self, info_dict: _InfoDict):
-        logger.debug(f"Initializing AutoResponse with info_dict: {info_dict}")
+        logger.debug("Initializing AutoResponse with info_dict: {}", info_dict)
 
         self.channel_cooldowns: dict[int, datetime] = {}
 
@@ -41,12 +44,14 @@ class AutoResponse:
         self.is_regex = info_dict["is_regex"]
         self.response = info_dict["response"]
         self.trigger = info_dict["trigger"].lower()
+        self.disabled = bool(info_dict["disabled"])
+        self.regex_timeouts = 0
 
         if self.is_regex:
-            logger.debug(f"Compiling regex trigger for auto response '{self.name}': {self.trigger}")
+            logger.debug("Compiling regex trigger for auto response '{}': {}", self.name, self.trigger)
             try:
                 self.trigger = re.compile(info_dict["trigger"])
-                logger.debug(f"Compiled regex trigger for auto response '{self.name}': {self.trigger.pattern}")
+                logger.debug("Compiled regex trigger for auto response '{}': {}", self.name, self.trigger.pattern)
             except re.error:
                 logger.error(
                     f"Invalid regex pattern for auto response '{self.name}': {info_dict['trigger']}. Falling back to simple trigger."
@@ -54,7 +59,11 @@ class AutoResponse:
                 self.is_regex = False
 
         logger.debug(
-            f"AutoResponse initialized: name={self.name}, is_regex={self.is_regex}, trigger={self.trigger}, response={self.response}"
+            "AutoResponse initialized: name={}, is_regex={}, trigger={}, response={}",
+            self.name,
+            self.is_regex,
+            self.trigger,
+            self.response,
         )
 
     def to_tuple(self):
@@ -66,96 +75,27 @@ class AutoResponse:
 
         trigger = self.trigger if isinstance(self.trigger, str) else self.trigger.pattern
         logger.debug(
-            f"Converting AutoResponse '{self.name}' to tuple with trigger: {trigger} and response: {self.response}"
+            "Converting AutoResponse '{}' to tuple with trigger: {} and response: {}", self.name, trigger, self.response
         )
         return self.name, f"{trigger}\n{self.response}"
 
-    def _on_cooldown(self, message: Message) -> bool:
+    def on_cooldown(self, channel_id: int) -> bool:
         """
-        Check if the auto response is on cooldown for the given message channel.
+        Check if the auto response is on cooldown in a channel.
 
-        :param Message message: The message to check.
+        :param int channel_id: The channel to check.
         :returns: True if the auto response is on cooldown, False otherwise.
         """
-        logger.debug(f"Checking cooldown for AutoResponse '{self.name}' in channel ID: {message.channel.id}")
-        is_on_cooldown = datetime.now() < self.channel_cooldowns.get(message.channel.id, datetime.min)
-        expires_at = self.channel_cooldowns.get(message.channel.id, "N/A")
-        logger.debug(f"AutoResponse '{self.name}' on cooldown: {is_on_cooldown}. Cooldown expires at: {expires_at}")
-        return is_on_cooldown
+        return datetime.now() < self.channel_cooldowns.get(channel_id, datetime.min)
 
-    def _matches_name(self, message: Message) -> bool:
+    def start_cooldown(self, channel_id: int) -> None:
         """
-        Check if the message content matches the auto response name.
+        Put the auto response on cooldown in a channel after it has been triggered.
 
-        :param Message message: The message to check.
-        :returns: True if the message matches the auto response name, False otherwise.
+        :param int channel_id: The channel the auto response was triggered in.
         """
-        logger.debug(f"Checking name match for AutoResponse '{self.name}' in message content.")
-        matches_name = f"!{self.name}" in message.content.lower()
-        logger.debug(f"AutoResponse '{self.name}' name match: {matches_name}")
-        return matches_name
-
-    def _matches_trigger(self, message: Message) -> bool:
-        """
-        Check if the message content matches the auto response trigger and user is not wine staff.
-
-        :param Message message: The message to check.
-        :returns: True if the message matches the auto response trigger, False otherwise.
-        """
-
-        logger.debug(f"Checking trigger match for AutoResponse '{self.name}' in message content.")
-        if not isinstance(message.author, Member):
-            logger.debug(
-                f"Message author {message.author.name} ({message.author.id}) is not a member; "
-                + f"skipping AutoResponse '{self.name}' trigger match."
-            )
-            return False
-
-        is_staff = {role.id for role in message.author.roles} & {
-            *any_council_role,
-            *any_moderation_role,
-            ROLE_SOMM,
-            ROLE_CONN,
-        }
-
-        if is_staff:
-            logger.debug(f"User {message.author.id} is wine staff; skipping AutoResponse '{self.name}' trigger match.")
-            return False
-
-        if isinstance(self.trigger, re.Pattern):
-            matches_content = re.search(self.trigger, message.content.lower()) is not None
-        else:
-            matches_content = self.trigger in message.content.lower()
-
-        logger.debug(f"AutoResponse '{self.name}' trigger match: {matches_content}")
-        return matches_content
-
-    def matches(self, message: Message) -> bool:
-        """
-        Check if the message content matches the trigger.
-
-        :param Message message: The content of the message to check.
-        :returns: True if the message matches the trigger, False otherwise.
-        """
-
-        logger.debug(f"Checking if AutoResponse '{self.name}' matches message.")
-
-        if not message.content:
-            logger.debug(f"Message content is empty; AutoResponse '{self.name}' cannot match.")
-            return False
-
-        if self._on_cooldown(message):
-            logger.debug(f"AutoResponse '{self.name}' is on cooldown for channel ID: {message.channel.id}.")
-            return False
-
-        if self._matches_name(message) or self._matches_trigger(message):
-            logger.debug(f"AutoResponse '{self.name}' matches message.")
-            cooldown_expires_at = datetime.now() + timedelta(seconds=60)
-            self.channel_cooldowns[message.channel.id] = cooldown_expires_at
-            logger.debug(
-                f"Set cooldown for AutoResponse '{self.name}' in channel ID: {message.channel.id} until {cooldown_expires_at}."
-            )
-            return True
-
-        logger.debug(f"AutoResponse '{self.name}' does not match message.")
-        return False
+        cooldown_expires_at = datetime.now() + timedelta(seconds=60)
+        self.channel_cooldowns[channel_id] = cooldown_expires_at
+        logger.debug(
+            "Set cooldown for AutoResponse '{}' in channel ID: {} until {}.", self.name, channel_id, cooldown_expires_at
+        )
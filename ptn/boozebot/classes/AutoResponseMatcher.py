@@ -0,0 +1,226 @@
+import re
+from collections import deque
+from dataclasses import dataclass, field
+
+from discord import Member, Message
+from ptn_utils.global_constants import ROLE_CONN, ROLE_SOMM, any_council_role, any_moderation_role
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.classes.AutoResponse import AutoResponse
+from ptn.boozebot.modules.RegexSandbox import regex_sandbox
+
+logger = get_logger("boozebot.classes.autoresponsematcher")
+
+# Messages from these roles can still use !name commands, but never set off a trigger
+WINE_STAFF_ROLES = frozenset({*any_council_role, *any_moderation_role, ROLE_SOMM, ROLE_CONN})
+
+
+class LiteralAutomaton:
+    """
+    Aho-Corasick automaton, finding every occurrence of a set of literal strings in a single pass over the text.
+    """
+
+    _goto: list[dict[str, int]]
+    _fail: list[int]
+    _output: list[frozenset[int]]
+
+    def __init__(self, patterns: list[str]):
+        """
+        :param patterns: The literals to search for, identified by their index in the list.
+        """
+        self._goto = [{}]
+        outputs: list[set[int]] = [set()]
+        for pattern_id, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    outputs.append(set())
+                state = next_state
+            outputs[state].add(pattern_id)
+
+        # Breadth first, so every state's failure link points at an already finished, shallower state
+        self._fail = [0] * len(self._goto)
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                outputs[next_state] |= outputs[self._fail[next_state]]
+
+        self._output = [frozenset(output) for output in outputs]
+
+    def find(self, text: str) -> set[int]:
+        """
+        :param text: The text to search.
+        :returns: The IDs of every pattern found in the text.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        # Empty patterns sit on the root state and are found in any text
+        found = set(output[0])
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                found |= output[state]
+        return found
+
+
+@dataclass(slots=True)
+class MatchResult:
+    auto_response: AutoResponse | None
+    # Auto responses whose regex trigger overran its time budget on this message
+    timed_out: list[AutoResponse] = field(default_factory=list)
+
+
+class AutoResponseMatcher:
+    """
+    Matches a message against every auto response at once.
+
+    Literal triggers and !name commands are found with one automaton pass over the lowercased message. Regex
+    triggers run in the regex sandbox, and only those that could beat the best literal match are searched. Triggers
+    without groups or flags are merged into a single alternation that rules them all out in one search, and are only
+    searched individually when the alternation matches or overruns. The matcher is immutable, and is rebuilt whenever
+    the auto responses change.
+    """
+
+    auto_responses: list[AutoResponse]
+    _automaton: LiteralAutomaton
+    # For each automaton pattern, the auto responses using it and whether it is a trigger rather than a !name
+    _literal_owners: list[list[tuple[int, bool]]]
+    _merged_regex: str | None
+    _mergeable_regexes: list[tuple[int, str]]
+    _separate_regexes: list[tuple[int, str]]
+
+    def __init__(self, auto_responses: list[AutoResponse]):
+        """
+        :param auto_responses: The auto responses to match, in priority order.
+        """
+        self.auto_responses = list(auto_responses)
+        pattern_ids: dict[str, int] = {}
+        self._literal_owners = []
+        self._mergeable_regexes = []
+        self._separate_regexes = []
+
+        def add_literal(literal: str, index: int, is_trigger: bool) -> None:
+            pattern_id = pattern_ids.setdefault(literal, len(pattern_ids))
+            if pattern_id == len(self._literal_owners):
+                self._literal_owners.append([])
+            self._literal_owners[pattern_id].append((index, is_trigger))
+
+        for index, auto_response in enumerate(self.auto_responses):
+            add_literal(f"!{auto_response.name}", index, False)
+            if isinstance(auto_response.trigger, re.Pattern):
+                if auto_response.disabled:
+                    continue
+                # Groups would be renumbered by merging, and inline flags must lead the whole pattern
+                if auto_response.trigger.groups or auto_response.trigger.flags & ~re.UNICODE:
+                    self._separate_regexes.append((index, auto_response.trigger.pattern))
+                else:
+                    self._mergeable_regexes.append((index, auto_response.trigger.pattern))
+            else:
+                add_literal(auto_response.trigger.lower(), index, True)
+
+        self._automaton = LiteralAutomaton(list(pattern_ids))
+        self._merged_regex = None
+        if len(self._mergeable_regexes) > 1:
+            self._merged_regex = "|".join(f"(?:{pattern})" for _, pattern in self._mergeable_regexes)
+
+        logger.debug(
+            "Built auto response matcher: {} literal(s), {} mergeable and {} separate regex trigger(s).",
+            len(pattern_ids),
+            len(self._mergeable_regexes),
+            len(self._separate_regexes),
+        )
+
+    async def match(self, message: Message) -> MatchResult:
+        """
+        Finds the first auto response matching a message that is not on cooldown in its channel, and starts its
+        cooldown.
+
+        :param message: The message to check.
+        :returns: The matching auto response, if any, and any regex triggers that overran their time budget.
+        """
+        if not message.content:
+            return MatchResult(None)
+
+        content = message.content.lower()
+        channel_id = message.channel.id
+        check_triggers = isinstance(message.author, Member) and not any(
+            role.id in WINE_STAFF_ROLES for role in message.author.roles
+        )
+
+        matched: set[int] = set()
+        for pattern_id in self._automaton.find(content):
+            matched.update(
+                index for index, is_trigger in self._literal_owners[pattern_id] if check_triggers or not is_trigger
+            )
+        available = [index for index in sorted(matched) if not self.auto_responses[index].on_cooldown(channel_id)]
+        best = available[0] if available else len(self.auto_responses)
+
+        timed_out: list[int] = []
+        if check_triggers:
+            regex_matched, timed_out = await self._match_regexes(content, channel_id, best)
+            best = min(regex_matched, default=best)
+
+        result = MatchResult(None, [self.auto_responses[index] for index in timed_out])
+        if best < len(self.auto_responses):
+            result.auto_response = self.auto_responses[best]
+            result.auto_response.start_cooldown(channel_id)
+        return result
+
+    async def _match_regexes(self, content: str, channel_id: int, before: int) -> tuple[list[int], list[int]]:
+        """
+        Searches the regex triggers that could still win, those ahead of the best match so far and not on cooldown.
+
+        :returns: The indexes of the auto responses that matched, and of those that overran their time budget.
+        """
+
+        def candidates(regexes: list[tuple[int, str]]) -> list[tuple[int, str]]:
+            return [
+                (index, pattern)
+                for index, pattern in regexes
+                if index < before and not self.auto_responses[index].on_cooldown(channel_id)
+            ]
+
+        mergeable = candidates(self._mergeable_regexes)
+        jobs: list[tuple[int | None, str]] = candidates(self._separate_regexes)
+        if self._merged_regex is not None and len(mergeable) > 1:
+            # None stands for the merged alternation, which only rules the mergeable triggers out
+            jobs.append((None, self._merged_regex))
+        else:
+            jobs.extend(mergeable)
+            mergeable = []
+
+        matched, timed_out = await self._run_jobs(jobs, content)
+        if None in matched or None in timed_out:
+            more_matched, more_timed_out = await self._run_jobs(mergeable, content)
+            matched += more_matched
+            timed_out += more_timed_out
+        return (
+            [index for index in matched if index is not None],
+            [index for index in timed_out if index is not None],
+        )
+
+    @staticmethod
+    async def _run_jobs(jobs: list[tuple[int | None, str]], content: str) -> tuple[list[int | None], list[int | None]]:
+        matched: list[int | None] = []
+        timed_out: list[int | None] = []
+        while jobs:
+            result = await regex_sandbox.run([(pattern, content) for _, pattern in jobs])
+            matched.extend(key for (key, _), is_match in zip(jobs, result.matches, strict=False) if is_match)
+            if result.timed_out is None:
+                break
+            # Carry on with the searches after the one that overran
+            timed_out.append(jobs[result.timed_out][0])
+            jobs = jobs[result.timed_out + 1 :]
+        return matched, timed_out
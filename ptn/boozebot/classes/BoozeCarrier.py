@@ -24,7 +24,7 @@ class CarrierOwner:
         :param info_dict: The dictionary containing the carrier owner information.
         """
 
-        logger.debug(f"Initializing CarrierOwner with info_json: {info_dict}")
+        logger.debug("Initializing CarrierOwner with info_json: {}", info_dict)
 
         self.username = info_dict.get("username")
         self.display_name = info_dict.get("displayName")
@@ -47,8 +47,10 @@ class CarrierOwner:
         self.scopes = info_dict.get("scopes", [])
 
         logger.debug(
-            f"CarrierOwner initialized: username={self.username}, discord_id={self.discord_id}, "
-            + f"display_name={self.display_name}"
+            "CarrierOwner initialized: username={}, discord_id={}, display_name={}",
+            self.username,
+            self.discord_id,
+            self.display_name,
         )
 
     @override
@@ -112,7 +114,7 @@ class BoozeCarrier:
         :param info_dict: The dictionary containing the carrier information.
         """
 
-        logger.debug(f"Initializing BoozeCarrier with info_json: {info_dict}")
+        logger.debug("Initializing BoozeCarrier with info_json: {}", info_dict)
 
         fc_data = info_dict.get("fcData", {})
 
@@ -166,15 +168,18 @@ class BoozeCarrier:
         self.unload_closed = sane_default_datetime(info_dict.get("unloadClosed"))
         self.unload_duration = sane_default_duration(info_dict.get("unloadDur"))
 
-        logger.debug(
-            f"BoozeCarrier initialized: carrier_name={self.carrier_name}, carrier_identifier={self.carrier_identifier}, "
-            + f"system={self.system}, body={self.body}, in_queue={self.in_queue}, plotted_system={self.plotted_system}, "
-            + f"plotted_body={self.plotted_body}, swap_with={self.swap_with}, queue_timestamp={self.queue_timestamp}, "
-            + f"staff_comment={self.staff_comment}, owner_username={self.owner.username}, owner_discord_id={self.owner.discord_id}, "
-            + f"owner_display_name={self.owner.display_name}, cruise_id={self.cruise_id}, trip_id={self.trip_id}, "
-            + f"wine_total={self.wine_total}, wine_status={self.wine_status}, status={self.status}, "
-            + f"availability_start={self.availability_start}, availability_end={self.availability_end}, "
-            + f"unload_opened={self.unload_opened}, unload_closed={self.unload_closed}, unload_duration={self.unload_duration}"
+        logger.opt(lazy=True).debug(
+            "BoozeCarrier initialized: {}",
+            lambda: (
+                f"carrier_name={self.carrier_name}, carrier_identifier={self.carrier_identifier}, "
+                + f"system={self.system}, body={self.body}, in_queue={self.in_queue}, plotted_system={self.plotted_system}, "
+                + f"plotted_body={self.plotted_body}, swap_with={self.swap_with}, queue_timestamp={self.queue_timestamp}, "
+                + f"staff_comment={self.staff_comment}, owner_username={self.owner.username}, owner_discord_id={self.owner.discord_id}, "
+                + f"owner_display_name={self.owner.display_name}, cruise_id={self.cruise_id}, trip_id={self.trip_id}, "
+                + f"wine_total={self.wine_total}, wine_status={self.wine_status}, status={self.status}, "
+                + f"availability_start={self.availability_start}, availability_end={self.availability_end}, "
+                + f"unload_opened={self.unload_opened}, unload_closed={self.unload_closed}, unload_duration={self.unload_duration}"
+            ),
         )
 
     @property
@@ -211,10 +216,10 @@ class BoozeCarrier:
         :rtype: dict
         """
 
-        logger.debug(f"Converting BoozeCarrier '{self.carrier_name}' to dictionary.")
+        logger.debug("Converting BoozeCarrier '{}' to dictionary.", self.carrier_name)
 
         response = {key: value for key, value in vars(self).items() if value is not None}
-        logger.debug(f"BoozeCarrier dictionary representation: {response}")
+        logger.debug("BoozeCarrier dictionary representation: {}", response)
 
         return response
 
@@ -235,11 +240,11 @@ class BoozeCarrier:
         :rtype: bool
         """
 
-        logger.debug(f"Checking boolean state of BoozeCarrier '{self.carrier_name}'.")
+        logger.debug("Checking boolean state of BoozeCarrier '{}'.", self.carrier_name)
 
         state = any(value for _key, value in vars(self).items())
 
-        logger.debug(f"BoozeCarrier '{self.carrier_name}' boolean state: {state}")
+        logger.debug("BoozeCarrier '{}' boolean state: {}", self.carrier_name, state)
 
         return state
 
@@ -251,14 +256,14 @@ class BoozeCarrier:
         :return: True if the carrier is owned by the given Discord ID, False otherwise.
         """
 
-        logger.debug(f"Checking ownership of BoozeCarrier '{self.carrier_name}' by user: {user}.")
+        logger.debug("Checking ownership of BoozeCarrier '{}' by user: {}.", self.carrier_name, user)
 
         if self.owner.is_role:
             is_owner = any(role.id == self.owner.discord_id for role in user.roles)
         else:
             is_owner = user.id == self.owner.discord_id
 
-        logger.debug(f"BoozeCarrier '{self.carrier_name}' owned by user {user}: {is_owner}")
+        logger.debug("BoozeCarrier '{}' owned by user {}: {}", self.carrier_name, user, is_owner)
         return is_owner
 
 
@@ -280,7 +285,7 @@ class CarrierStats:
         :param info_dict: The dictionary containing the carrier statistics information.
         """
 
-        logger.debug(f"Initializing CarrierStats with info_json: {info_dict}")
+        logger.debug("Initializing CarrierStats with info_json: {}", info_dict)
 
         self.db_id = int(info_dict.get("fcId", 0))
         self.name = info_dict.get("fcName")
@@ -292,9 +297,15 @@ class CarrierStats:
         self.first_unload_date = sane_default_datetime(info_dict.get("firstUnloadDate"))
         self.last_unload_date = sane_default_datetime(info_dict.get("lastUnloadDate"))
         logger.debug(
-            f"CarrierStats initialized: carrier_name={self.name}, owner_username={self.owner.username}, owner_discord_id={self.owner.discord_id}, "
-            + f"total_wine={self.total_wine}, total_cruises={self.total_cruises}, total_trips={self.total_trips}, "
-            + f"first_unload_date={self.first_unload_date}, last_unload_date={self.last_unload_date}"
+            "CarrierStats initialized: carrier_name={}, owner_username={}, owner_discord_id={}, total_wine={}, total_cruises={}, total_trips={}, first_unload_date={}, last_unload_date={}",
+            self.name,
+            self.owner.username,
+            self.owner.discord_id,
+            self.total_wine,
+            self.total_cruises,
+            self.total_trips,
+            self.first_unload_date,
+            self.last_unload_date,
         )
 
     @override
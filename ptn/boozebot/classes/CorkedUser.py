@@ -24,12 +24,12 @@ class CorkedUser:
 
         :param sqlite3.Row info_dict: A single row from the sqlite query.
         """
-        logger.debug(f"Initializing CorkedUser with info_dict: {info_dict}")
+        logger.debug("Initializing CorkedUser with info_dict: {}", info_dict)
 
         self.user_id = info_dict["user_id"]
         self.timestamp = info_dict["timestamp"]
 
-        logger.debug(f"CorkedUser initialized: user_id={self.user_id}, timestamp={self.timestamp}")
+        logger.debug("CorkedUser initialized: user_id={}, timestamp={}", self.user_id, self.timestamp)
 
     async def get_member(self) -> Member | None:
         """
@@ -37,7 +37,7 @@ class CorkedUser:
 
         :rtype: discord.Member | None
         """
-        logger.debug(f"Fetching member for corked user ID: {self.user_id}. Database timestamp: {self.timestamp}")
+        logger.debug("Fetching member for corked user ID: {}. Database timestamp: {}", self.user_id, self.timestamp)
         return await bot.get_or_fetch.member(self.user_id)
 
     @override
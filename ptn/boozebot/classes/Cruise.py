@@ -28,7 +28,7 @@ class CruiseStats:
         :param info_dict: The dictionary containing the cruise statistics information.
         """
 
-        logger.debug(f"Initializing CruiseStats with info_json: {info_dict}")
+        logger.debug("Initializing CruiseStats with info_json: {}", info_dict)
 
         self.total_wine = int(info_dict.get("totalWine", 0))
         self.total_trips = int(info_dict.get("totalTrips", 0))
@@ -42,10 +42,15 @@ class CruiseStats:
         self.max_unload_dur = sane_default_float(info_dict.get("maxUnloadDur"))
 
         logger.debug(
-            f"CruiseStats initialized: total_wine={self.total_wine}, total_trips={self.total_trips}, "
-            + f"total_carriers={self.total_carriers}, carriers_remaining={self.carriers_remaining}, "
-            + f"wine_remaining={self.wine_remaining}, avg_unload_dur={self.avg_unload_dur}, "
-            + f"min_unload_dur={self.min_unload_dur}, max_unload_dur={self.max_unload_dur}"
+            "CruiseStats initialized: total_wine={}, total_trips={}, total_carriers={}, carriers_remaining={}, wine_remaining={}, avg_unload_dur={}, min_unload_dur={}, max_unload_dur={}",
+            self.total_wine,
+            self.total_trips,
+            self.total_carriers,
+            self.carriers_remaining,
+            self.wine_remaining,
+            self.avg_unload_dur,
+            self.min_unload_dur,
+            self.max_unload_dur,
         )
 
 
@@ -64,7 +69,7 @@ class Cruise:
         Class represents cruise as returned from the api.
         :param info_dict: The dictionary containing the cruise information.
         """
-        logger.debug(f"Initializing Cruise with info_json: {info_dict}")
+        logger.debug("Initializing Cruise with info_json: {}", info_dict)
 
         self.id = int(info_dict.get("cruiseId", 0))
         self.start = sane_default_datetime(info_dict.get("cruiseStart")) or datetime.min.replace(tzinfo=UTC)
@@ -76,7 +81,7 @@ class Cruise:
         self.carrier_limit = int(info_dict.get("carrierLimit", 0))
         self.stats = CruiseStats(info_dict.get("stats", {}))
 
-        logger.debug(f"Cruise initialized with stats: {self.stats}")
+        logger.debug("Cruise initialized with stats: {}", self.stats)
 
 
 class CruiseState(TypedDict):
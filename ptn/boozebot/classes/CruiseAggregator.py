@@ -0,0 +1,232 @@
+import copy
+from dataclasses import dataclass
+
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.classes.BoozeCarrier import BoozeCarrier
+from ptn.boozebot.classes.Cruise import Cruise, CruiseStats
+
+logger = get_logger("boozebot.classes.cruiseaggregator")
+
+TripKey = tuple[str, int]
+
+
+class StreamingStats:
+    """
+    Running count, mean, min and max over a keyed set of values.
+
+    Adding or replacing a value is O(1). Removing the current min or max marks it stale, and it is recomputed from the
+    remaining values the next time it is read.
+    """
+
+    values: dict[TripKey, float]
+    total: float
+    _min: float | None
+    _max: float | None
+    _bounds_stale: bool
+
+    def __init__(self):
+        self.values = {}
+        self.total = 0.0
+        self._min = None
+        self._max = None
+        self._bounds_stale = False
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def set(self, key: TripKey, value: float | None) -> None:
+        """
+        Sets or clears the value for a key.
+
+        :param key: The key of the value.
+        :param value: The new value, or None to remove it.
+        """
+        self.remove(key)
+        if value is None:
+            return
+
+        self.values[key] = value
+        self.total += value
+        if not self._bounds_stale:
+            self._min = value if self._min is None else min(self._min, value)
+            self._max = value if self._max is None else max(self._max, value)
+
+    def remove(self, key: TripKey) -> None:
+        """
+        Removes the value for a key, if there is one.
+
+        :param key: The key of the value.
+        """
+        old = self.values.pop(key, None)
+        if old is None:
+            return
+
+        self.total -= old
+        if old in (self._min, self._max):
+            self._bounds_stale = True
+
+    @property
+    def mean(self) -> float | None:
+        return self.total / len(self.values) if self.values else None
+
+    @property
+    def min(self) -> float | None:
+        self._refresh_bounds()
+        return self._min
+
+    @property
+    def max(self) -> float | None:
+        self._refresh_bounds()
+        return self._max
+
+    def _refresh_bounds(self) -> None:
+        if not self._bounds_stale:
+            return
+        self._min = min(self.values.values(), default=None)
+        self._max = max(self.values.values(), default=None)
+        self._bounds_stale = False
+
+
+@dataclass(slots=True)
+class CrossCheckResult:
+    matches: bool
+    mismatches: dict[str, tuple[int, int]]
+
+
+class CruiseAggregator:
+    """
+    Keeps the current cruise's stats from the carrier cache, updated incrementally as carriers are added, updated
+    or unloaded.
+
+    Trips are keyed by carrier callsign and trip number. Profit is not known locally and is estimated from the
+    backend's profit per tonne, taken at the last cross-check. The aggregate is only trusted once a cross-check
+    against the backend's stats has matched.
+    """
+
+    cruise_id: int | None
+    baseline: Cruise | None
+    trusted: bool
+    trips: dict[TripKey, BoozeCarrier]
+    total_wine: int
+    wine_remaining: int
+    trips_remaining: int
+    carrier_trip_counts: dict[str, int]
+    owner_trip_counts: dict[int, int]
+    unload_durations: StreamingStats
+
+    def __init__(self):
+        self.cruise_id = None
+        self.baseline = None
+        self.trusted = False
+        self._reset()
+
+    def _reset(self) -> None:
+        self.trips = {}
+        self.total_wine = 0
+        self.wine_remaining = 0
+        self.trips_remaining = 0
+        self.carrier_trip_counts = {}
+        self.owner_trip_counts = {}
+        self.unload_durations = StreamingStats()
+
+    def rebuild(self, carriers: list[BoozeCarrier]) -> None:
+        """
+        Rebuilds the aggregate from a full list of carriers.
+
+        :param carriers: Every carrier known to the cache.
+        """
+        self._reset()
+        for carrier in carriers:
+            self.update(carrier)
+        logger.debug("Cruise aggregate rebuilt from {} carriers: {} trips", len(carriers), len(self.trips))
+
+    def update(self, carrier: BoozeCarrier) -> None:
+        """
+        Adds or replaces a carrier trip in the aggregate. Trips from other cruises are ignored.
+
+        :param carrier: The carrier as received from the backend.
+        """
+        if self.cruise_id is None or carrier.cruise_id != self.cruise_id:
+            return
+
+        key = (carrier.carrier_identifier, carrier.trip_id)
+        if previous := self.trips.get(key):
+            self._apply(previous, -1)
+        self.trips[key] = carrier
+        self._apply(carrier, 1)
+        self.unload_durations.set(key, carrier.unload_duration)
+
+    def _apply(self, carrier: BoozeCarrier, sign: int) -> None:
+        self.total_wine += sign * carrier.wine_total
+        if carrier.unload_closed is None:
+            self.wine_remaining += sign * carrier.wine_total
+            self.trips_remaining += sign
+        for counts, key in (
+            (self.carrier_trip_counts, carrier.carrier_identifier),
+            (self.owner_trip_counts, carrier.owner.discord_id),
+        ):
+            counts[key] = counts.get(key, 0) + sign
+            if not counts[key]:
+                del counts[key]
+
+    def to_stats(self) -> CruiseStats:
+        """
+        :returns: The aggregate as cruise stats.
+        """
+        profit_per_tonne = 0.0
+        if self.baseline and self.baseline.stats.total_wine:
+            profit_per_tonne = self.baseline.stats.total_profit / self.baseline.stats.total_wine
+
+        return CruiseStats(
+            {
+                "totalWine": self.total_wine,
+                "totalTrips": len(self.trips),
+                "totalCarriers": len(self.carrier_trip_counts),
+                "carriersRemaining": self.trips_remaining,
+                "totalCarrierOwners": len(self.owner_trip_counts),
+                "wineRemaining": self.wine_remaining,
+                "totalProfit": round(self.total_wine * profit_per_tonne),
+                "avgUnloadDur": self.unload_durations.mean,
+                "minUnloadDur": self.unload_durations.min,
+                "maxUnloadDur": self.unload_durations.max,
+            }
+        )
+
+    def to_cruise(self) -> Cruise | None:
+        """
+        :returns: The last fetched cruise with its stats replaced by the aggregate, or None if not trusted.
+        """
+        if not self.trusted or self.baseline is None:
+            return None
+        cruise = copy.copy(self.baseline)
+        cruise.stats = self.to_stats()
+        return cruise
+
+    def cross_check(self, cruise: Cruise, carriers: list[BoozeCarrier]) -> CrossCheckResult:
+        """
+        Compares the aggregate against stats fetched from the backend, adopting the backend's cruise as the new
+        baseline. The aggregate is trusted while the counted totals match.
+
+        :param cruise: The current cruise with stats, as returned by the backend.
+        :param carriers: Every carrier known to the cache, used to rebuild the aggregate if the cruise has changed.
+        :returns: The result of the comparison.
+        """
+        if cruise.id != self.cruise_id:
+            logger.info(f"Cruise aggregate switching from cruise {self.cruise_id} to {cruise.id}")
+            self.cruise_id = cruise.id
+            self.rebuild(carriers)
+
+        self.baseline = cruise
+        local = self.to_stats()
+        mismatches = {
+            name: (getattr(local, name), getattr(cruise.stats, name))
+            for name in ("total_wine", "total_trips", "total_carriers", "carriers_remaining", "wine_remaining")
+            if getattr(local, name) != getattr(cruise.stats, name)
+        }
+        self.trusted = not mismatches
+        if mismatches:
+            logger.warning(f"Cruise aggregate differs from backend (local, backend): {mismatches}")
+        else:
+            logger.debug("Cruise aggregate matches backend stats")
+        return CrossCheckResult(matches=self.trusted, mismatches=mismatches)
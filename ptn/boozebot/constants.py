@@ -40,12 +40,15 @@ DB_PATH = DATA_DIR_PATH / "database"
 DB_DUMPS_PATH = DATA_DIR_PATH / "database"
 CARRIERS_DB_PATH = DATA_DIR_PATH / "database" / "booze.db"
 CARRIERS_DB_DUMPS_PATH = DATA_DIR_PATH / "sql" / "booze.sql"
+CARRIERS_DB_BACKUPS_PATH = DATA_DIR_PATH / "backups"
 SETTINGS_PATH = DATA_DIR_PATH / "settings"
 SETTINGS_FILE_PATH = SETTINGS_PATH / "settings.json"
 WELCOME_MESSAGE_FILE_PATH = SETTINGS_PATH / "welcome_message.txt"
 BC_PREP_MESSAGE_FILE_PATH = SETTINGS_PATH / "bc_prep_message.txt"
 BC_START_MESSAGE_FILE_PATH = SETTINGS_PATH / "bc_start_message.txt"
 BC_END_MESSAGE_FILE_PATH = SETTINGS_PATH / "bc_end_message.txt"
+# Hash of the command tree at the last sync
+COMMAND_TREE_HASH_PATH = DATA_DIR_PATH / "command_tree.sha256"
 
 load_dotenv(DATA_DIR_PATH / ".env")
 BOOZESHEETS_API_BASE_URL = os.getenv("BOOZESHEETS_API_BASE_URL", None)
@@ -59,6 +62,13 @@ if not BOOZESHEETS_API_KEY:
     logger.critical("BOOZESHEETS_API_KEY is not set")
     sys.exit(1)
 
+# Per-statement SQL latency profiling, off by default as it times every query
+SQL_PROFILING_ENABLED = os.getenv("BOOZEBOT_SQL_PROFILE", "false").lower() in ("1", "true", "yes")
+
+# Online database backups: pages copied per backup step, and how many snapshots to keep
+DB_BACKUP_PAGES_PER_STEP = 64
+DB_BACKUP_RETENTION = 14
+
 # Stale Data checking from EDSM/EBGS
 STALE_DATA_THRESHOLD = datetime.timedelta(days=2)
 
@@ -275,6 +285,11 @@ if not CARRIERS_DB_DUMPS_PATH.parent.is_dir():
     logger.info(f"Folder {CARRIERS_DB_DUMPS_PATH.parent} does not exist, making it now.")
     CARRIERS_DB_DUMPS_PATH.parent.mkdir(parents=True)
 
+# check the backups folder exists
+if not CARRIERS_DB_BACKUPS_PATH.is_dir():
+    logger.info(f"Folder {CARRIERS_DB_BACKUPS_PATH} does not exist, making it now.")
+    CARRIERS_DB_BACKUPS_PATH.mkdir(parents=True)
+
 # check the settings folder exists
 if not SETTINGS_PATH.is_dir():
     logger.info(f"Folder {SETTINGS_PATH} does not exist, making it now.")
@@ -1,43 +1,117 @@
 import asyncio
+import gzip
+import re
 import sqlite3
+import sys
+import time
 from asyncio import Lock
-from datetime import datetime
+from datetime import UTC, datetime
+from pathlib import Path
 from sqlite3 import Connection, Cursor
-from typing import Literal
+from typing import Literal, cast
 
 from ptn_utils.logger.logger import get_logger
 
 from ptn.boozebot.classes.AutoResponse import AutoResponse
 from ptn.boozebot.classes.CorkedUser import CorkedUser
-from ptn.boozebot.constants import CARRIERS_DB_DUMPS_PATH, CARRIERS_DB_PATH
+from ptn.boozebot.constants import (
+    CARRIERS_DB_BACKUPS_PATH,
+    CARRIERS_DB_DUMPS_PATH,
+    CARRIERS_DB_PATH,
+    DB_BACKUP_PAGES_PER_STEP,
+    DB_BACKUP_RETENTION,
+    SQL_PROFILING_ENABLED,
+)
+from ptn.boozebot.database.profiler import ProfilingCursor
+from ptn.boozebot.modules.metrics import DB_BACKUP_DURATION, DB_BACKUP_LAST_SUCCESS, DB_BACKUP_SIZE
 
 logger = get_logger("boozebot.database")
-sql_logger = get_logger("boozebot.database.sql")
 
 
 class Database:
-    db: Cursor
-    conn: Connection
     lock: Lock
+    _conn: Connection | None
+    _db: Cursor | None
+    _corked_users: dict[str, CorkedUser]
+    _pinned_messages: dict[str, str]
+    _auto_responses: dict[str, AutoResponse]
+    _opened: bool
 
     def __init__(self):
-        logger.info(f"Starting database connection at: {CARRIERS_DB_PATH}")
         self.lock = asyncio.Lock()
-        self.conn = sqlite3.connect(CARRIERS_DB_PATH)
-        self.conn.row_factory = sqlite3.Row
-        self.conn.set_trace_callback(self._sql_trace_callback)
-        self.db = self.conn.cursor()
-        logger.info(f"Database initialized. SQL dumps will be stored at: {CARRIERS_DB_DUMPS_PATH}")
+        self._conn = None
+        self._db = None
+        self._corked_users = {}
+        self._pinned_messages = {}
+        self._auto_responses = {}
+        self._opened = False
+
+    @property
+    def conn(self) -> Connection:
+        """
+        The database connection, opening the database on first use.
+        """
+        self._ensure_open()
+        return cast("Connection", self._conn)
+
+    @property
+    def db(self) -> Cursor:
+        """
+        The database cursor, opening the database on first use.
+        """
+        self._ensure_open()
+        return cast("Cursor", self._db)
 
-        self._build_database_on_startup()
+    def _ensure_open(self) -> None:
+        if not self._opened:
+            self.open()
 
-    def _sql_trace_callback(self, statement: str) -> None:
+    def open(self) -> None:
         """
-        SQL trace callback - logs all SQL statements at TRACE level via boozebot.database.sql logger
+        Connects to the database, builds or updates its schema and loads the in-memory state. Called by the startup
+        orchestrator, or on first use. If opening fails, the partly opened state is discarded and the next use tries
+        again.
 
-        :param str statement: The SQL statement being executed.
+        :returns: None
+        """
+        if self._opened:
+            return
+        # Set first, so the reads made while opening do not open the database again
+        self._opened = True
+        try:
+            logger.info(f"Starting database connection at: {CARRIERS_DB_PATH}")
+            self._conn = sqlite3.connect(CARRIERS_DB_PATH)
+            self._conn.row_factory = sqlite3.Row
+            if SQL_PROFILING_ENABLED:
+                logger.info("SQL profiling enabled, timing every statement.")
+                self._db = self._conn.cursor(factory=ProfilingCursor)
+            else:
+                self._db = self._conn.cursor()
+            logger.info(f"Database initialized. SQL dumps will be stored at: {CARRIERS_DB_DUMPS_PATH}")
+
+            self._build_database_on_startup()
+            self._load_state_cache()
+        except Exception:
+            if self._conn is not None:
+                self._conn.close()
+            self._conn = None
+            self._db = None
+            self._corked_users = {}
+            self._pinned_messages = {}
+            self._auto_responses = {}
+            self._opened = False
+            raise
+
+    @staticmethod
+    def get_sql_profile() -> str | None:
         """
-        sql_logger.trace(f"SQL: {statement}")
+        Returns the per-statement SQL latency profile.
+
+        :returns: The formatted profile, or None if profiling is disabled.
+        """
+        if not SQL_PROFILING_ENABLED:
+            return None
+        return ProfilingCursor.profiler.format_stats()
 
     def dump_database(self):
         """
@@ -56,6 +130,62 @@ class Database:
 
         logger.info(f"Database dump completed. Wrote {line_count} lines to {CARRIERS_DB_DUMPS_PATH}")
 
+    def backup_database_to_file(self) -> Path:
+        """
+        Takes an online backup of the booze database into a compressed, timestamped snapshot.
+
+        The backup is copied a few pages at a time from a separate connection, so writers on the main connection
+        are never blocked for the whole copy. Snapshots beyond DB_BACKUP_RETENTION are removed, oldest first.
+
+        :returns: The path of the new snapshot.
+        """
+        started = time.perf_counter()
+        timestamp = datetime.now(tz=UTC).strftime("%Y%m%d-%H%M%S")
+        backup_path = CARRIERS_DB_BACKUPS_PATH / f"booze-{timestamp}.db.gz"
+        temp_path = backup_path.with_suffix(".tmp")
+
+        logger.info(f"Starting online database backup to: {backup_path}")
+
+        def _progress(_status: int, remaining: int, total: int) -> None:
+            logger.trace("Database backup progress: {}/{} pages copied", total - remaining, total)
+
+        source = sqlite3.connect(CARRIERS_DB_PATH)
+        snapshot = sqlite3.connect(":memory:")
+        try:
+            source.backup(snapshot, pages=DB_BACKUP_PAGES_PER_STEP, progress=_progress)
+            data = snapshot.serialize()
+        finally:
+            snapshot.close()
+            source.close()
+
+        with gzip.open(temp_path, "wb") as f:
+            f.write(data)
+        temp_path.replace(backup_path)
+
+        duration = time.perf_counter() - started
+        size = backup_path.stat().st_size
+        DB_BACKUP_DURATION.observe(duration)
+        DB_BACKUP_SIZE.set(size)
+        DB_BACKUP_LAST_SUCCESS.set(time.time())
+        logger.info(
+            f"Database backup completed in {duration:.2f}s. Wrote {size} bytes ({len(data)} uncompressed) to {backup_path}"
+        )
+
+        expired_backups = sorted(CARRIERS_DB_BACKUPS_PATH.glob("booze-*.db.gz"))[:-DB_BACKUP_RETENTION]
+        for expired_backup in expired_backups:
+            logger.debug("Removing expired database backup: {}", expired_backup)
+            expired_backup.unlink(missing_ok=True)
+
+        return backup_path
+
+    async def backup_database(self) -> Path:
+        """
+        Takes an online backup of the booze database without blocking the event loop.
+
+        :returns: The path of the new snapshot.
+        """
+        return await asyncio.to_thread(self.backup_database_to_file)
+
     def _build_database_on_startup(self):
         """
         Builds or updates the database schema on startup.
@@ -77,6 +207,7 @@ class Database:
                 "trigger": "TEXT NOT NULL",
                 "is_regex": "BOOLEAN NOT NULL DEFAULT 0",
                 "response": "TEXT NOT NULL",
+                "disabled": "BOOLEAN NOT NULL DEFAULT 0",
             },
             "corked_users": {
                 "entry": "INTEGER PRIMARY KEY AUTOINCREMENT",
@@ -88,36 +219,58 @@ class Database:
                 "carrier_id": "TEXT UNIQUE",
                 "unload_id": "INT",
                 "unload_notification_sent": "BOOL",
+                "unload_done_reactions": "INT",
                 "departure_id": "INT",
                 "departure_notification_sent": "BOOL",
+                "departure_time": "INT",
+            },
+            "load_messages": {
+                "carrier_id": "TEXT PRIMARY KEY",
+                "message_id": "TEXT UNIQUE",
+                "owner_id": "TEXT",
+                "carrier_name": "TEXT",
+            },
+            "history_watermarks": {
+                "channel_id": "TEXT PRIMARY KEY",
+                "message_id": "TEXT",
+            },
+            "bot_state": {
+                "key": "TEXT PRIMARY KEY",
+                "value": "TEXT",
+            },
+            "bulk_role_operations": {
+                "message_id": "TEXT PRIMARY KEY",
+                "channel_id": "TEXT",
+                "role_ids": "TEXT",
+                "removed_counts": "TEXT",
             },
         }
 
         # Iterate through each table schema and create or update the table
         for table_name, schema in table_schemas.items():
-            logger.debug(f"Checking table: {table_name}")
-            logger.trace(f"Expected schema for {table_name}: {schema}")
+            logger.debug("Checking table: {}", table_name)
+            logger.trace("Expected schema for {}: {}", table_name, schema)
 
             # Create the table if it does not exist
 
             self.db.execute(f"""SELECT count(name) FROM sqlite_master WHERE TYPE = 'table' AND name = '{table_name}'""")  # noqa: S608
             table_exists = bool(self.db.fetchone()[0])
-            logger.trace(f"Table {table_name} exists: {table_exists}")
+            logger.trace("Table {} exists: {}", table_name, table_exists)
 
             if not table_exists:
-                logger.debug(f"Table {table_name} does not exist. Creating table.")
+                logger.debug("Table {} does not exist. Creating table.", table_name)
                 create_statement = f"CREATE TABLE {table_name} ({', '.join([f'{col} {col_type}' for col, col_type in schema.items()])})"
                 self.db.execute(create_statement)
                 self.conn.commit()
-                logger.trace(f"Committed table creation for {table_name}.")
+                logger.trace("Committed table creation for {}.", table_name)
                 logger.info(f"Table {table_name} created successfully.")
                 continue
 
-            logger.debug(f"Table {table_name} exists. Checking for missing or incorrect columns.")
+            logger.debug("Table {} exists. Checking for missing or incorrect columns.", table_name)
 
             self.db.execute(f"""PRAGMA table_info ({table_name})""")
             result = [dict(col) for col in self.db.fetchall()]
-            logger.trace(f"PRAGMA table_info result for {table_name}: {result}")
+            logger.trace("PRAGMA table_info result for {}: {}", table_name, result)
             # Get full column information including all attributes
             existing_columns = {}
             for element in result:
@@ -142,13 +295,13 @@ class Database:
 
                 existing_columns[col_name] = full_type
 
-            logger.trace(f"Existing columns in {table_name}: {existing_columns}")
+            logger.trace("Existing columns in {}: {}", table_name, existing_columns)
 
             # Add any missing columns
             columns_added = 0
             for column_name, column_type in schema.items():
                 if column_name not in existing_columns:
-                    logger.debug(f"Column {column_name} missing in table {table_name}. Adding column.")
+                    logger.debug("Column {} missing in table {}. Adding column.", column_name, table_name)
                     alter_statement = f"ALTER TABLE {table_name} ADD COLUMN {column_name} {column_type}"
                     self.db.execute(alter_statement)
                     columns_added += 1
@@ -162,12 +315,12 @@ class Database:
                             f"Column {column_name} in table {table_name} has type {column_type} but expected {schema[column_name]}"
                         )
                         raise OSError("Column type mismatch detected. Please check the database schema.")
-                    logger.trace(f"Column {column_name} in table {table_name} has correct type: {column_type}")
+                    logger.trace("Column {} in table {} has correct type: {}", column_name, table_name, column_type)
 
             if columns_added > 0:
-                logger.trace(f"Added {columns_added} column(s) to table {table_name}.")
+                logger.trace("Added {} column(s) to table {}.", columns_added, table_name)
                 self.conn.commit()
-                logger.trace(f"Committed schema changes for table {table_name}.")
+                logger.trace("Committed schema changes for table {}.", table_name)
 
         logger.info("Database schema check and update completed successfully. Checking for default values.")
 
@@ -177,28 +330,52 @@ class Database:
 
         # Insert default values into tables if they're empty
         for table_name, records in default_values.items():
-            logger.trace(f"Checking for default values in table: {table_name}")
+            logger.trace("Checking for default values in table: {}", table_name)
 
             self.db.execute(f"SELECT COUNT(*) FROM {table_name}")  # noqa: S608
             record_count = self.db.fetchone()[0]
-            logger.trace(f"Table {table_name} has {record_count} existing record(s).")
+            logger.trace("Table {} has {} existing record(s).", table_name, record_count)
 
             if record_count == 0:
-                logger.debug(f"Inserting default values into table: {table_name}")
+                logger.debug("Inserting default values into table: {}", table_name)
                 for idx, record in enumerate(records, 1):
                     columns = ", ".join(record.keys())
                     placeholders = ", ".join(["?" for _ in record])
                     values = tuple(record.values())
-                    logger.trace(f"Inserting record {idx}/{len(records)} into {table_name}: {record}")
+                    logger.trace("Inserting record {}/{} into {}: {}", idx, len(records), table_name, record)
                     self.db.execute(
                         f"""INSERT INTO {table_name} ({columns}) VALUES ({placeholders})""",  # noqa: S608
                         values,
                     )
                 self.conn.commit()
-                logger.trace(f"Committed {len(records)} default record(s) to {table_name}.")
+                logger.trace("Committed {} default record(s) to {}.", len(records), table_name)
                 logger.info(f"Inserted {len(records)} default record(s) into table: {table_name}")
             else:
-                logger.trace(f"Table {table_name} already has data. Skipping default value insertion.")
+                logger.trace("Table {} already has data. Skipping default value insertion.", table_name)
+
+    def _load_state_cache(self):
+        """
+        Loads the small, frequently checked tables (corked users, pins and auto responses) into memory.
+
+        All mutations write through to SQLite and the in-memory copies, so reads never need the lock.
+
+        :returns: None
+        """
+        logger.info("Loading corked users, pinned messages and auto responses into memory.")
+
+        self.db.execute("SELECT * FROM corked_users")
+        self._corked_users = {str(row["user_id"]): CorkedUser(row) for row in self.db.fetchall()}
+
+        self.db.execute("SELECT message_id, channel_id FROM pinned_messages")
+        self._pinned_messages = {str(row["message_id"]): str(row["channel_id"]) for row in self.db.fetchall()}
+
+        self.db.execute("SELECT * FROM auto_responses")
+        self._auto_responses = {row["name"]: AutoResponse(row) for row in self.db.fetchall()}
+
+        logger.info(
+            f"Loaded {len(self._corked_users)} corked user(s), {len(self._pinned_messages)} pinned message(s) "
+            + f"and {len(self._auto_responses)} auto response(s) into memory."
+        )
 
     async def get_unload_message_for_carrier(self, carrier_id: str) -> int | None:
         """
@@ -207,17 +384,17 @@ class Database:
         :param carrier_id: The carrier ID string.
         :returns: The discord message id or None if not found.
         """
-        logger.debug(f"Fetching unload message for carrier ID: {carrier_id}")
+        logger.debug("Fetching unload message for carrier ID: {}", carrier_id)
 
         async with self.lock:
             self.db.execute("SELECT unload_id FROM carrier_messages WHERE carrier_id = (?)", (carrier_id,))
 
             unload_id = self.db.fetchone()
         if not unload_id:
-            logger.debug(f"No unload message found in database for carrier ID: {carrier_id}.")
+            logger.debug("No unload message found in database for carrier ID: {}.", carrier_id)
             return None
         unload_id = unload_id[0]
-        logger.debug(f"Found unload message ID {unload_id} for carrier ID: {carrier_id}")
+        logger.debug("Found unload message ID {} for carrier ID: {}", unload_id, carrier_id)
         return unload_id
 
     async def get_carrier_for_unload_message(self, message_id: int) -> str | None:
@@ -227,17 +404,17 @@ class Database:
         :param message_id: The discord message ID.
         :returns: The carrier ID string or None if not found.
         """
-        logger.debug(f"Fetching carrier ID for unload message ID: {message_id}")
+        logger.debug("Fetching carrier ID for unload message ID: {}", message_id)
 
         async with self.lock:
             self.db.execute("SELECT carrier_id FROM carrier_messages WHERE unload_id = ?", (message_id,))
 
             carrier_id = self.db.fetchone()
         if not carrier_id:
-            logger.debug(f"No carrier ID found in database for unload message ID: {message_id}.")
+            logger.debug("No carrier ID found in database for unload message ID: {}.", message_id)
             return None
         carrier_id = carrier_id[0]
-        logger.debug(f"Found carrier ID {carrier_id} for unload message ID: {message_id}")
+        logger.debug("Found carrier ID {} for unload message ID: {}", carrier_id, message_id)
         return carrier_id
 
     async def set_unload_message_for_carrier(self, carrier_id: str, message_id: int) -> None:
@@ -247,7 +424,7 @@ class Database:
         :param carrier_id: The carrier ID string.
         :param message_id: The discord message ID.
         """
-        logger.debug(f"Setting unload message ID {message_id} for carrier ID: {carrier_id}")
+        logger.debug("Setting unload message ID {} for carrier ID: {}", message_id, carrier_id)
 
         async with self.lock:
             self.db.execute(
@@ -256,7 +433,7 @@ class Database:
                 (carrier_id, message_id, message_id),
             )
             self.conn.commit()
-        logger.debug(f"Successfully set unload message ID {message_id} for carrier ID: {carrier_id}")
+        logger.debug("Successfully set unload message ID {} for carrier ID: {}", message_id, carrier_id)
 
     async def get_unload_notification_sent(self, carrier_id: str) -> bool:
         """
@@ -265,7 +442,7 @@ class Database:
         :param carrier_id: The carrier ID string.
         :returns: The unload notification sent flag.
         """
-        logger.debug(f"Getting unload notification sent flag for carrier ID: {carrier_id}")
+        logger.debug("Getting unload notification sent flag for carrier ID: {}", carrier_id)
 
         async with self.lock:
             self.db.execute(
@@ -274,10 +451,10 @@ class Database:
 
             result = self.db.fetchone()
         if not result:
-            logger.debug(f"No carrier found in database for carrier ID: {carrier_id}.")
+            logger.debug("No carrier found in database for carrier ID: {}.", carrier_id)
             return False
         result = result[0]
-        logger.debug(f"Unload notification sent flag for carrier ID {carrier_id}: {result}")
+        logger.debug("Unload notification sent flag for carrier ID {}: {}", carrier_id, result)
         return result
 
     async def set_unload_notification_sent(self, carrier_id: str, notification_sent: bool) -> None:
@@ -287,7 +464,7 @@ class Database:
         :param carrier_id: The carrier ID string.
         :param notification_sent: The unload notification sent flag.
         """
-        logger.debug(f"Setting unload notification sent flag to {notification_sent} for carrier ID: {carrier_id}")
+        logger.debug("Setting unload notification sent flag to {} for carrier ID: {}", notification_sent, carrier_id)
 
         async with self.lock:
             self.db.execute(
@@ -297,9 +474,42 @@ class Database:
             )
             self.conn.commit()
         logger.debug(
-            f"Successfully set unload notification sent flag to {notification_sent} for carrier ID: {carrier_id}"
+            "Successfully set unload notification sent flag to {} for carrier ID: {}", notification_sent, carrier_id
         )
 
+    async def get_unload_reaction_tallies(self) -> list[sqlite3.Row]:
+        """
+        Retrieves the carrier done reaction tally of every open unload message.
+
+        :returns: A list of rows with carrier_id, unload_id and unload_done_reactions.
+        """
+        logger.debug("Retrieving unload reaction tallies from database")
+
+        async with self.lock:
+            self.db.execute(
+                "SELECT carrier_id, unload_id, unload_done_reactions FROM carrier_messages WHERE unload_id IS NOT NULL"
+            )
+            rows = self.db.fetchall()
+
+        logger.debug("Retrieved {} unload reaction tally(s) from database", len(rows))
+        return rows
+
+    async def set_unload_reaction_count(self, carrier_id: str, count: int) -> None:
+        """
+        Sets the carrier done reaction tally for a given carrier's unload message.
+
+        :param carrier_id: The carrier ID string.
+        :param count: The number of carrier done reactions.
+        """
+        logger.debug("Setting unload reaction count to {} for carrier ID: {}", count, carrier_id)
+
+        async with self.lock:
+            self.db.execute(
+                "UPDATE carrier_messages SET unload_done_reactions = ? WHERE carrier_id = ?", (count, carrier_id)
+            )
+            self.conn.commit()
+        logger.debug("Successfully set unload reaction count to {} for carrier ID: {}", count, carrier_id)
+
     async def get_departure_message_for_carrier(self, carrier_id: str) -> int | None:
         """
         Fetches the departure message for a given carrier ID.
@@ -307,17 +517,17 @@ class Database:
         :param carrier_id: The carrier ID string.
         :returns: The discord message id or None if not found.
         """
-        logger.debug(f"Fetching departure message for carrier ID: {carrier_id}")
+        logger.debug("Fetching departure message for carrier ID: {}", carrier_id)
 
         async with self.lock:
             self.db.execute("SELECT departure_id FROM carrier_messages WHERE carrier_id = (?)", (carrier_id,))
 
             departure_id = self.db.fetchone()
         if not departure_id:
-            logger.debug(f"No departure message found in database for carrier ID: {carrier_id}.")
+            logger.debug("No departure message found in database for carrier ID: {}.", carrier_id)
             return None
         departure_id = departure_id[0]
-        logger.debug(f"Found departure message ID {departure_id} for carrier ID: {carrier_id}")
+        logger.debug("Found departure message ID {} for carrier ID: {}", departure_id, carrier_id)
         return departure_id
 
     async def get_carrier_for_departure_message(self, message_id: int) -> str | None:
@@ -327,17 +537,17 @@ class Database:
         :param message_id: The discord message ID.
         :returns: The carrier ID string or None if not found.
         """
-        logger.debug(f"Fetching carrier ID for departure message ID: {message_id}")
+        logger.debug("Fetching carrier ID for departure message ID: {}", message_id)
 
         async with self.lock:
             self.db.execute("SELECT carrier_id FROM carrier_messages WHERE departure_id = ?", (message_id,))
 
             carrier_id = self.db.fetchone()
         if not carrier_id:
-            logger.debug(f"No carrier ID found in database for departure message ID: {message_id}.")
+            logger.debug("No carrier ID found in database for departure message ID: {}.", message_id)
             return None
         carrier_id = carrier_id[0]
-        logger.debug(f"Found carrier ID {carrier_id} for departure message ID: {message_id}")
+        logger.debug("Found carrier ID {} for departure message ID: {}", carrier_id, message_id)
         return carrier_id
 
     async def set_departure_message_for_carrier(self, carrier_id: str, message_id: int) -> None:
@@ -347,7 +557,7 @@ class Database:
         :param carrier_id: The carrier ID string.
         :param message_id: The discord message ID.
         """
-        logger.debug(f"Setting departure message ID {message_id} for carrier ID: {carrier_id}")
+        logger.debug("Setting departure message ID {} for carrier ID: {}", message_id, carrier_id)
 
         async with self.lock:
             self.db.execute(
@@ -356,7 +566,7 @@ class Database:
                 (carrier_id, message_id, message_id),
             )
             self.conn.commit()
-        logger.debug(f"Successfully set departure message ID {message_id} for carrier ID: {carrier_id}")
+        logger.debug("Successfully set departure message ID {} for carrier ID: {}", message_id, carrier_id)
 
     async def get_departure_notification_sent(self, carrier_id: str) -> bool:
         """
@@ -365,7 +575,7 @@ class Database:
         :param carrier_id: The carrier ID string.
         :returns: The departure notification sent flag.
         """
-        logger.debug(f"Getting departure notification sent flag for carrier ID: {carrier_id}")
+        logger.debug("Getting departure notification sent flag for carrier ID: {}", carrier_id)
 
         async with self.lock:
             self.db.execute(
@@ -374,10 +584,10 @@ class Database:
 
             result = self.db.fetchone()
         if not result:
-            logger.debug(f"No carrier found in database for carrier ID: {carrier_id}.")
+            logger.debug("No carrier found in database for carrier ID: {}.", carrier_id)
             return False
         result = result[0]
-        logger.debug(f"Departure notification sent flag for carrier ID {carrier_id}: {result}")
+        logger.debug("Departure notification sent flag for carrier ID {}: {}", carrier_id, result)
         return result
 
     async def set_departure_notification_sent(self, carrier_id: str, notification_sent: bool) -> None:
@@ -387,7 +597,7 @@ class Database:
         :param carrier_id: The carrier ID string.
         :param notification_sent: The departure notification sent flag.
         """
-        logger.debug(f"Setting departure notification sent flag to {notification_sent} for carrier ID: {carrier_id}")
+        logger.debug("Setting departure notification sent flag to {} for carrier ID: {}", notification_sent, carrier_id)
 
         async with self.lock:
             self.db.execute(
@@ -397,9 +607,65 @@ class Database:
             )
             self.conn.commit()
         logger.debug(
-            f"Successfully set departure notification sent flag to {notification_sent} for carrier ID: {carrier_id}"
+            "Successfully set departure notification sent flag to {} for carrier ID: {}", notification_sent, carrier_id
         )
 
+    async def set_departure_time(self, carrier_id: str, departure_time: int) -> None:
+        """
+        Sets the scheduled departure time for a given carrier ID.
+
+        :param carrier_id: The carrier ID string.
+        :param departure_time: The departure time as a unix timestamp.
+        """
+        logger.debug("Setting departure time to {} for carrier ID: {}", departure_time, carrier_id)
+
+        async with self.lock:
+            self.db.execute(
+                """INSERT INTO carrier_messages (carrier_id, departure_time) VALUES (?, ?)
+                ON CONFLICT(carrier_id) DO UPDATE SET departure_time = ?""",
+                (carrier_id, departure_time, departure_time),
+            )
+            self.conn.commit()
+        logger.debug("Successfully set departure time to {} for carrier ID: {}", departure_time, carrier_id)
+
+    async def get_pending_departures(self) -> list[sqlite3.Row]:
+        """
+        Retrieves all departures with a scheduled time whose owner has not yet been notified.
+
+        :returns: A list of rows with carrier_id, departure_id and departure_time.
+        """
+        logger.debug("Retrieving pending departures from database")
+
+        async with self.lock:
+            self.db.execute(
+                """SELECT carrier_id, departure_id, departure_time FROM carrier_messages
+                WHERE departure_id IS NOT NULL AND departure_time IS NOT NULL
+                AND (departure_notification_sent IS NULL OR departure_notification_sent = 0)"""
+            )
+            rows = self.db.fetchall()
+
+        logger.debug("Retrieved {} pending departure(s) from database", len(rows))
+        return rows
+
+    async def get_departures_without_time(self) -> list[sqlite3.Row]:
+        """
+        Retrieves the departures posted before departure times were stored, whose owner has not yet been notified.
+
+        :returns: A list of rows with carrier_id and departure_id.
+        """
+        logger.debug("Retrieving departures without a departure time from database")
+
+        async with self.lock:
+            self.db.execute(
+                """SELECT carrier_id, departure_id FROM carrier_messages
+                WHERE departure_id IS NOT NULL AND departure_time IS NULL
+                AND (departure_notification_sent IS NULL OR departure_notification_sent = 0)"""
+            )
+            rows = self.db.fetchall()
+
+        logger.debug("Retrieved {} departure(s) without a departure time from database", len(rows))
+        return rows
+
     async def delete_carrier_message(self, carrier_id: str, message_type: Literal["unload", "departure"]) -> None:
         """
         Deletes a carrier message entry (unload or departure) for a given carrier ID.
@@ -411,12 +677,12 @@ class Database:
         if message_type not in ["unload", "departure"]:
             raise ValueError(f"Invalid message_type: {message_type}. Must be 'unload' or 'departure'.")
 
-        logger.debug(f"Deleting {message_type} message entry for carrier ID: {carrier_id}")
+        logger.debug("Deleting {} message entry for carrier ID: {}", message_type, carrier_id)
 
         if message_type == "unload":
-            fields = "unload_id = NULL, unload_notification_sent = NULL"
+            fields = "unload_id = NULL, unload_notification_sent = NULL, unload_done_reactions = NULL"
         else:  # departure
-            fields = "departure_id = NULL, departure_notification_sent = NULL"
+            fields = "departure_id = NULL, departure_notification_sent = NULL, departure_time = NULL"
 
         async with self.lock:
             self.db.execute(f"UPDATE carrier_messages SET {fields} WHERE carrier_id = ?", (carrier_id,))  # noqa: S608
@@ -426,7 +692,233 @@ class Database:
                 (carrier_id,),
             )
             self.conn.commit()
-        logger.debug(f"Successfully deleted {message_type} message entry for carrier ID: {carrier_id}")
+        logger.debug("Successfully deleted {} message entry for carrier ID: {}", message_type, carrier_id)
+
+    async def get_load_messages(self) -> list[sqlite3.Row]:
+        """
+        Retrieves all tracked wine load messages.
+
+        :returns: A list of rows with carrier_id, message_id, owner_id and carrier_name.
+        """
+        logger.debug("Retrieving all load messages from database")
+
+        async with self.lock:
+            self.db.execute("SELECT carrier_id, message_id, owner_id, carrier_name FROM load_messages")
+            rows = self.db.fetchall()
+
+        logger.debug("Retrieved {} load message(s) from database", len(rows))
+        return rows
+
+    async def set_load_message(self, carrier_id: str, message_id: int, owner_id: int, carrier_name: str) -> None:
+        """
+        Stores or replaces the wine load message for a given carrier ID.
+
+        :param carrier_id: The carrier ID string.
+        :param message_id: The discord message ID.
+        :param owner_id: The discord ID of the carrier owner.
+        :param carrier_name: The carrier name shown in the load message.
+        """
+        logger.debug("Setting load message ID {} for carrier ID: {}", message_id, carrier_id)
+
+        async with self.lock:
+            self.db.execute(
+                """INSERT INTO load_messages (carrier_id, message_id, owner_id, carrier_name) VALUES (?, ?, ?, ?)
+                ON CONFLICT(carrier_id) DO UPDATE SET message_id = ?, owner_id = ?, carrier_name = ?""",
+                (
+                    carrier_id,
+                    str(message_id),
+                    str(owner_id),
+                    carrier_name,
+                    str(message_id),
+                    str(owner_id),
+                    carrier_name,
+                ),
+            )
+            self.conn.commit()
+        logger.debug("Successfully set load message ID {} for carrier ID: {}", message_id, carrier_id)
+
+    async def delete_load_message(self, carrier_id: str) -> None:
+        """
+        Deletes the wine load message entry for a given carrier ID.
+
+        :param carrier_id: The carrier ID string.
+        """
+        logger.debug("Deleting load message entry for carrier ID: {}", carrier_id)
+
+        async with self.lock:
+            self.db.execute("DELETE FROM load_messages WHERE carrier_id = ?", (carrier_id,))
+            self.conn.commit()
+        logger.debug("Successfully deleted load message entry for carrier ID: {}", carrier_id)
+
+    async def get_history_watermark(self, channel_id: int) -> int | None:
+        """
+        Gets the newest message ID already scanned in a channel's history.
+
+        :param channel_id: The discord channel ID.
+        :returns: The message ID, or None if the channel has never been scanned.
+        """
+        logger.debug("Fetching history watermark for channel ID: {}", channel_id)
+
+        async with self.lock:
+            self.db.execute("SELECT message_id FROM history_watermarks WHERE channel_id = ?", (str(channel_id),))
+            result = self.db.fetchone()
+        if not result:
+            logger.debug("No history watermark found for channel ID: {}", channel_id)
+            return None
+        logger.debug("History watermark for channel ID {}: {}", channel_id, result[0])
+        return int(result[0])
+
+    async def set_history_watermark(self, channel_id: int, message_id: int) -> None:
+        """
+        Sets the newest message ID already scanned in a channel's history.
+
+        :param channel_id: The discord channel ID.
+        :param message_id: The discord message ID.
+        """
+        logger.debug("Setting history watermark for channel ID {} to {}", channel_id, message_id)
+
+        async with self.lock:
+            self.db.execute(
+                """INSERT INTO history_watermarks (channel_id, message_id) VALUES (?, ?)
+                ON CONFLICT(channel_id) DO UPDATE SET message_id = ?""",
+                (str(channel_id), str(message_id), str(message_id)),
+            )
+            self.conn.commit()
+        logger.debug("Successfully set history watermark for channel ID {} to {}", channel_id, message_id)
+
+    async def get_last_unload_time(self) -> datetime | None:
+        """
+        Gets the time the most recent unload was completed, if no unload has been opened since.
+
+        :returns: The completion time, or None if not set.
+        """
+        logger.debug("Fetching last unload time")
+
+        async with self.lock:
+            self.db.execute("SELECT value FROM bot_state WHERE key = 'last_unload_time'")
+            result = self.db.fetchone()
+        if not result or result[0] is None:
+            logger.debug("No last unload time set")
+            return None
+        last_unload_time = datetime.fromtimestamp(int(result[0]), tz=UTC)
+        logger.debug("Last unload time: {}", last_unload_time)
+        return last_unload_time
+
+    async def set_last_unload_time(self, last_unload_time: datetime | None) -> None:
+        """
+        Sets the time the most recent unload was completed.
+
+        :param last_unload_time: The completion time, or None to clear it.
+        """
+        logger.debug("Setting last unload time to {}", last_unload_time)
+        value = str(int(last_unload_time.timestamp())) if last_unload_time else None
+
+        async with self.lock:
+            self.db.execute(
+                """INSERT INTO bot_state (key, value) VALUES ('last_unload_time', ?)
+                ON CONFLICT(key) DO UPDATE SET value = ?""",
+                (value, value),
+            )
+            self.conn.commit()
+        logger.debug("Successfully set last unload time to {}", last_unload_time)
+
+    async def get_status_message_id(self) -> int | None:
+        """
+        Gets the ID of the bot's current status embed message in the wine status channel.
+
+        :returns: The message ID, or None if not set.
+        """
+        logger.debug("Fetching status message ID")
+
+        async with self.lock:
+            self.db.execute("SELECT value FROM bot_state WHERE key = 'status_message_id'")
+            result = self.db.fetchone()
+        if not result or result[0] is None:
+            logger.debug("No status message ID set")
+            return None
+        logger.debug("Status message ID: {}", result[0])
+        return int(result[0])
+
+    async def set_status_message_id(self, message_id: int | None) -> None:
+        """
+        Sets the ID of the bot's current status embed message in the wine status channel.
+
+        :param message_id: The message ID, or None to clear it.
+        """
+        logger.debug("Setting status message ID to {}", message_id)
+        value = str(message_id) if message_id else None
+
+        async with self.lock:
+            self.db.execute(
+                """INSERT INTO bot_state (key, value) VALUES ('status_message_id', ?)
+                ON CONFLICT(key) DO UPDATE SET value = ?""",
+                (value, value),
+            )
+            self.conn.commit()
+        logger.debug("Successfully set status message ID to {}", message_id)
+
+    async def add_bulk_role_operation(self, message_id: int, channel_id: int, role_ids: list[int]) -> None:
+        """
+        Records a bulk role removal so that it can be resumed after a restart.
+
+        :param message_id: The discord message ID of the operation's status message.
+        :param channel_id: The discord channel ID of the status message.
+        :param role_ids: The IDs of the roles being removed.
+        """
+        logger.debug("Adding bulk role operation {} for roles {}", message_id, role_ids)
+
+        async with self.lock:
+            self.db.execute(
+                "INSERT INTO bulk_role_operations (message_id, channel_id, role_ids, removed_counts) VALUES (?, ?, ?, ?)",
+                (str(message_id), str(channel_id), ",".join(map(str, role_ids)), "{}"),
+            )
+            self.conn.commit()
+        logger.debug("Successfully added bulk role operation {}", message_id)
+
+    async def get_bulk_role_operations(self) -> list[sqlite3.Row]:
+        """
+        Retrieves all unfinished bulk role removals.
+
+        :returns: A list of rows with message_id, channel_id, role_ids and removed_counts.
+        """
+        logger.debug("Retrieving unfinished bulk role operations from database")
+
+        async with self.lock:
+            self.db.execute("SELECT message_id, channel_id, role_ids, removed_counts FROM bulk_role_operations")
+            rows = self.db.fetchall()
+
+        logger.debug("Retrieved {} bulk role operation(s) from database", len(rows))
+        return rows
+
+    async def set_bulk_role_operation_counts(self, message_id: int, removed_counts: str) -> None:
+        """
+        Updates the progress of a bulk role removal.
+
+        :param message_id: The discord message ID of the operation's status message.
+        :param removed_counts: JSON object of role ID to number of members removed so far.
+        """
+        logger.debug("Setting bulk role operation {} counts to {}", message_id, removed_counts)
+
+        async with self.lock:
+            self.db.execute(
+                "UPDATE bulk_role_operations SET removed_counts = ? WHERE message_id = ?",
+                (removed_counts, str(message_id)),
+            )
+            self.conn.commit()
+        logger.debug("Successfully updated bulk role operation {}", message_id)
+
+    async def delete_bulk_role_operation(self, message_id: int) -> None:
+        """
+        Removes a finished bulk role removal.
+
+        :param message_id: The discord message ID of the operation's status message.
+        """
+        logger.debug("Deleting bulk role operation {}", message_id)
+
+        async with self.lock:
+            self.db.execute("DELETE FROM bulk_role_operations WHERE message_id = ?", (str(message_id),))
+            self.conn.commit()
+        logger.debug("Successfully deleted bulk role operation {}", message_id)
 
     async def add_auto_response(self, name: str, trigger: str, response: str, is_regex: bool = False) -> None:
         """
@@ -437,7 +929,7 @@ class Database:
         :param response: The response text.
         :param is_regex: Whether the trigger is a regex.
         """
-        logger.debug(f"Adding auto response '{name}' with trigger '{trigger}' (is_regex={is_regex})")
+        logger.debug("Adding auto response '{}' with trigger '{}' (is_regex={})", name, trigger, is_regex)
 
         async with self.lock:
             self.db.execute(
@@ -445,44 +937,38 @@ class Database:
                 (name, trigger, is_regex, response),
             )
             self.conn.commit()
-        logger.debug(f"Successfully added auto response '{name}'")
+            self._auto_responses[name] = AutoResponse(
+                {"name": name, "trigger": trigger, "is_regex": is_regex, "response": response, "disabled": False}
+            )
+        logger.debug("Successfully added auto response '{}'", name)
 
     async def get_auto_responses(self) -> list[AutoResponse]:
         """
-        Retrieves all auto responses from the database.
+        Retrieves all auto responses from the in-memory copy of the database.
 
-        :returns: A list of auto response dictionaries.
+        :returns: A list of auto response objects.
         """
-        logger.debug("Retrieving all auto responses from database")
-
-        async with self.lock:
-            self.db.execute("SELECT * FROM auto_responses")
-            rows = self.db.fetchall()
-
-        auto_responses = [AutoResponse(row) for row in rows]
-        logger.debug(f"Retrieved {len(auto_responses)} auto response(s) from database")
+        self._ensure_open()
+        auto_responses = list(self._auto_responses.values())
+        logger.debug("Retrieved {} auto response(s) from memory", len(auto_responses))
         return auto_responses
 
     async def get_auto_response_by_name(self, name: str) -> AutoResponse | None:
         """
-        Retrieves an auto response by name from the database.
+        Retrieves an auto response by name from the in-memory copy of the database.
 
         :param name: The name of the auto response.
         :returns: An AutoResponse object or None if not found.
         """
-        logger.debug(f"Retrieving auto response by name: {name}")
-
-        async with self.lock:
-            self.db.execute("SELECT * FROM auto_responses WHERE name = ?", (name,))
-            row = self.db.fetchone()
+        logger.debug("Retrieving auto response by name: {}", name)
 
-        if row is None:
-            logger.debug(f"No auto response found with name: {name}")
+        self._ensure_open()
+        auto_response = self._auto_responses.get(name)
+        if auto_response is None:
+            logger.debug("No auto response found with name: {}", name)
             return None
 
-        auto_response = AutoResponse(row)
-
-        logger.debug(f"Found auto response '{name}' with trigger '{auto_response.trigger}'")
+        logger.debug("Found auto response '{}' with trigger '{}'", name, auto_response.trigger)
         return auto_response
 
     async def delete_auto_response(self, name: str) -> None:
@@ -491,45 +977,61 @@ class Database:
 
         :param str name: The name of the auto response to delete.
         """
-        logger.debug(f"Deleting auto response: {name}")
+        logger.debug("Deleting auto response: {}", name)
 
         async with self.lock:
             self.db.execute("DELETE FROM auto_responses WHERE name = ?", (name,))
             self.conn.commit()
-        logger.debug(f"Successfully deleted auto response: {name}")
+            self._auto_responses.pop(name, None)
+        logger.debug("Successfully deleted auto response: {}", name)
 
     async def update_auto_response(self, name: str, new_trigger: str, new_response: str) -> None:
         """
-        Updates an existing auto response in the database.
+        Updates an existing auto response in the database, re-enabling its trigger if it was disabled.
 
         :param name: The name of the auto response to update.
         :param new_trigger: The new trigger text or regex.
         :param new_response: The new response text.
         """
-        logger.debug(f"Updating auto response '{name}' with new trigger '{new_trigger}'")
+        logger.debug("Updating auto response '{}' with new trigger '{}'", name, new_trigger)
 
         async with self.lock:
             self.db.execute(
-                "UPDATE auto_responses SET trigger = ?, response = ? WHERE name = ?",
+                "UPDATE auto_responses SET trigger = ?, response = ?, disabled = 0 WHERE name = ?",
                 (new_trigger, new_response, name),
             )
             self.conn.commit()
-        logger.debug(f"Successfully updated auto response: {name}")
-
-    async def get_corked_users(self) -> list[CorkedUser]:
+            if auto_response := self._auto_responses.get(name):
+                auto_response.trigger = re.compile(new_trigger) if auto_response.is_regex else new_trigger.lower()
+                auto_response.response = new_response
+                auto_response.disabled = False
+                auto_response.regex_timeouts = 0
+        logger.debug("Successfully updated auto response: {}", name)
+
+    async def disable_auto_response(self, name: str) -> None:
         """
-        Retrieves a list of corked user IDs from the database.
+        Disables an auto response's trigger, leaving its !name command usable.
 
-        :returns: A list of corked user IDs.
+        :param name: The name of the auto response to disable.
         """
-        logger.debug("Retrieving corked users from database")
+        logger.debug("Disabling auto response trigger: {}", name)
 
         async with self.lock:
-            self.db.execute("SELECT * FROM corked_users")
-            rows = self.db.fetchall()
+            self.db.execute("UPDATE auto_responses SET disabled = 1 WHERE name = ?", (name,))
+            self.conn.commit()
+            if auto_response := self._auto_responses.get(name):
+                auto_response.disabled = True
+        logger.debug("Successfully disabled auto response trigger: {}", name)
+
+    async def get_corked_users(self) -> list[CorkedUser]:
+        """
+        Retrieves a list of corked users from the in-memory copy of the database.
 
-        corked_users = [CorkedUser(row) for row in rows]
-        logger.debug(f"Retrieved {len(corked_users)} corked user(s) from database")
+        :returns: A list of corked users.
+        """
+        self._ensure_open()
+        corked_users = list(self._corked_users.values())
+        logger.debug("Retrieved {} corked user(s) from memory", len(corked_users))
         return corked_users
 
     async def add_corked_user(self, user_id: int) -> None:
@@ -538,7 +1040,7 @@ class Database:
 
         :param user_id: The user ID to cork.
         """
-        logger.debug(f"Adding corked user: {user_id}")
+        logger.debug("Adding corked user: {}", user_id)
 
         timestamp_str = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
@@ -548,7 +1050,8 @@ class Database:
                 (str(user_id), timestamp_str),
             )
             self.conn.commit()
-        logger.debug(f"Successfully added corked user: {user_id}")
+            self._corked_users[str(user_id)] = CorkedUser({"user_id": str(user_id), "timestamp": timestamp_str})
+        logger.debug("Successfully added corked user: {}", user_id)
 
     async def remove_corked_user(self, user_id: int) -> None:
         """
@@ -556,13 +1059,14 @@ class Database:
 
         :param user_id: The user ID to uncork.
         """
-        logger.debug(f"Removing corked user: {user_id}")
+        logger.debug("Removing corked user: {}", user_id)
 
         async with self.lock:
             self.db.execute("DELETE FROM corked_users WHERE user_id = ?", (str(user_id),))
             self.conn.commit()
+            self._corked_users.pop(str(user_id), None)
 
-        logger.debug(f"Successfully removed corked user: {user_id}")
+        logger.debug("Successfully removed corked user: {}", user_id)
 
     async def is_user_corked(self, user_id: int) -> bool:
         """
@@ -571,14 +1075,9 @@ class Database:
         :param user_id: The user ID to check.
         :returns: True if the user is corked, False otherwise.
         """
-        logger.debug(f"Checking if user is corked: {user_id}")
-
-        async with self.lock:
-            self.db.execute("SELECT COUNT(*) FROM corked_users WHERE user_id = ?", (str(user_id),))
-            count = self.db.fetchone()[0]
-
-        is_corked = count > 0
-        logger.debug(f"User {user_id} corked status: {is_corked}")
+        self._ensure_open()
+        is_corked = str(user_id) in self._corked_users
+        logger.debug("User {} corked status: {}", user_id, is_corked)
         return is_corked
 
     async def pin_message(self, message_id: int, channel_id: int) -> None:
@@ -588,7 +1087,7 @@ class Database:
         :param message_id: The Discord message ID to pin.
         :param channel_id: The Discord channel ID where the message is located.
         """
-        logger.debug(f"Pinning message ID {message_id} in channel ID {channel_id}")
+        logger.debug("Pinning message ID {} in channel ID {}", message_id, channel_id)
 
         async with self.lock:
             self.db.execute(
@@ -596,7 +1095,8 @@ class Database:
                 (str(message_id), str(channel_id)),
             )
             self.conn.commit()
-        logger.debug(f"Successfully pinned message ID {message_id} in channel ID {channel_id}")
+            self._pinned_messages[str(message_id)] = str(channel_id)
+        logger.debug("Successfully pinned message ID {} in channel ID {}", message_id, channel_id)
 
     async def unpin_message(self, message_id: int) -> None:
         """
@@ -604,13 +1104,14 @@ class Database:
 
         :param message_id: The Discord message ID to unpin.
         """
-        logger.debug(f"Unpinning message ID {message_id}")
+        logger.debug("Unpinning message ID {}", message_id)
 
         async with self.lock:
             self.db.execute("DELETE FROM pinned_messages WHERE message_id = ?", (str(message_id),))
             self.conn.commit()
+            self._pinned_messages.pop(str(message_id), None)
 
-        logger.debug(f"Successfully unpinned message ID {message_id}")
+        logger.debug("Successfully unpinned message ID {}", message_id)
 
     async def clear_all_pins(self) -> None:
         """
@@ -621,22 +1122,19 @@ class Database:
         async with self.lock:
             self.db.execute("DELETE FROM pinned_messages")
             self.conn.commit()
+            self._pinned_messages.clear()
 
         logger.debug("Successfully cleared all pinned messages from database")
 
     async def get_all_pinned_messages(self) -> list[tuple[int, int]]:
         """
-        Retrieves all pinned messages from the database.
+        Retrieves all pinned messages from the in-memory copy of the database.
 
         :returns: A list of tuples containing message IDs and channel IDs.
         """
-        logger.debug("Retrieving all pinned messages from database")
-
-        async with self.lock:
-            self.db.execute("SELECT message_id, channel_id FROM pinned_messages")
-            pinned_messages = self.db.fetchall()
-
-        logger.debug(f"Retrieved {len(pinned_messages)} pinned message(s) from database")
+        self._ensure_open()
+        pinned_messages = list(self._pinned_messages.items())
+        logger.debug("Retrieved {} pinned message(s) from memory", len(pinned_messages))
         return pinned_messages
 
     async def is_message_pinned(self, message_id: int) -> bool:
@@ -646,18 +1144,16 @@ class Database:
         :param message_id: The Discord message ID to check.
         :returns: True if the message is pinned, False otherwise.
         """
-        logger.debug(f"Checking if message ID {message_id} is pinned")
-
-        async with self.lock:
-            self.db.execute("SELECT COUNT(*) FROM pinned_messages WHERE message_id = ?", (str(message_id),))
-            count = self.db.fetchone()[0]
-
-        is_pinned = count > 0
-        logger.debug(f"Message ID {message_id} pinned status: {is_pinned}")
+        self._ensure_open()
+        is_pinned = str(message_id) in self._pinned_messages
+        logger.debug("Message ID {} pinned status: {}", message_id, is_pinned)
         return is_pinned
 
 
 database = Database()
 
 if __name__ == "__main__":
-    database.dump_database()
+    if len(sys.argv) > 1 and sys.argv[1] == "backup":
+        database.backup_database_to_file()
+    else:
+        database.dump_database()
@@ -0,0 +1,138 @@
+"""
+Optional per-statement SQL latency profiler for the booze database.
+
+Statements are grouped by their normalised shape (literals replaced with ?, whitespace collapsed) so that the
+same query with different values is counted together.
+"""
+
+import math
+import re
+import sqlite3
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, ClassVar, override
+
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.modules.metrics import SQL_STATEMENT_DURATION
+
+sql_logger = get_logger("boozebot.database.sql")
+
+_STRING_LITERAL_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL_RE = re.compile(r"\b\d+(?:\.\d+)?\b")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Samples kept per statement shape for the percentile calculations
+_SAMPLES_PER_STATEMENT = 1000
+
+
+def normalise_statement(statement: str) -> str:
+    """
+    Reduces an SQL statement to its shape by removing literals and collapsing whitespace.
+
+    :param str statement: The SQL statement.
+    :returns: The normalised statement.
+    """
+    shape = _STRING_LITERAL_RE.sub("?", statement)
+    shape = _NUMBER_LITERAL_RE.sub("?", shape)
+    return _WHITESPACE_RE.sub(" ", shape).strip()
+
+
+def _percentile(sorted_samples: list[float], percentile: float) -> float:
+    index = max(math.ceil(percentile * len(sorted_samples)) - 1, 0)
+    return sorted_samples[index]
+
+
+@dataclass(slots=True)
+class SqlStatementStats:
+    statement: str
+    count: int
+    total: float
+    p50: float
+    p95: float
+    p99: float
+
+
+class SqlProfiler:
+    counts: dict[str, int]
+    totals: dict[str, float]
+    samples: dict[str, deque[float]]
+
+    def __init__(self):
+        self.counts = {}
+        self.totals = {}
+        self.samples = {}
+
+    def record(self, statement: str, duration: float) -> None:
+        """
+        Records the execution time of a statement.
+
+        :param str statement: The raw SQL statement.
+        :param float duration: The execution time in seconds.
+        """
+        shape = normalise_statement(statement)
+        self.counts[shape] = self.counts.get(shape, 0) + 1
+        self.totals[shape] = self.totals.get(shape, 0.0) + duration
+        self.samples.setdefault(shape, deque(maxlen=_SAMPLES_PER_STATEMENT)).append(duration)
+        SQL_STATEMENT_DURATION.labels(statement=shape[:200]).observe(duration)
+        sql_logger.trace(f"SQL ({duration * 1000:.3f}ms): {statement}")
+
+    def get_stats(self) -> list[SqlStatementStats]:
+        """
+        Summarises the recorded statements, slowest total time first.
+
+        :returns: A list of per-statement statistics.
+        """
+        stats = []
+        for shape, count in self.counts.items():
+            sorted_samples = sorted(self.samples[shape])
+            stats.append(
+                SqlStatementStats(
+                    statement=shape,
+                    count=count,
+                    total=self.totals[shape],
+                    p50=_percentile(sorted_samples, 0.50),
+                    p95=_percentile(sorted_samples, 0.95),
+                    p99=_percentile(sorted_samples, 0.99),
+                )
+            )
+        return sorted(stats, key=lambda stat: stat.total, reverse=True)
+
+    def format_stats(self) -> str:
+        """
+        Formats the recorded statistics as a plain text table.
+
+        :returns: The formatted statistics.
+        """
+        lines = [f"{'count':>7} {'total ms':>10} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statement"]
+        lines.extend(
+            f"{stat.count:>7} {stat.total * 1000:>10.2f} {stat.p50 * 1000:>8.3f} {stat.p95 * 1000:>8.3f} "
+            + f"{stat.p99 * 1000:>8.3f}  {stat.statement}"
+            for stat in self.get_stats()
+        )
+        return "\n".join(lines)
+
+
+class ProfilingCursor(sqlite3.Cursor):
+    """
+    Cursor that times every execute call and records it with the shared profiler.
+    """
+
+    profiler: ClassVar[SqlProfiler] = SqlProfiler()
+
+    @override
+    def execute(self, sql: str, parameters: Any = (), /) -> "ProfilingCursor":
+        started = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self.profiler.record(sql, time.perf_counter() - started)
+
+    @override
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> "ProfilingCursor":
+        started = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self.profiler.record(sql, time.perf_counter() - started)
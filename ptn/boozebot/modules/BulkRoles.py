@@ -0,0 +1,198 @@
+"""
+Bulk role removal used by the cruise cleanup commands.
+
+Removals run with bounded concurrency, report progress by editing a single status message, collect failures into one
+report, and are persisted so that an interrupted operation is resumed when the bot restarts.
+"""
+
+import asyncio
+import io
+import json
+import sqlite3
+from dataclasses import dataclass
+
+import discord
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.constants import bot
+from ptn.boozebot.database.database import database
+from ptn.boozebot.modules.SendQueue import send_queue
+
+logger = get_logger("boozebot.modules.bulkroles")
+
+# Role changes for every member share one guild-wide route bucket, so only a few are kept in flight at once.
+# discord.py waits out the bucket itself once it is exhausted.
+BULK_ROLE_CONCURRENCY = 4
+# How often the status message and persisted progress are updated
+BULK_ROLE_PROGRESS_INTERVAL = 5.0
+# Failure reports longer than this are attached as a file instead of being included in the message
+FAILURE_REPORT_INLINE_LIMIT = 1500
+
+
+@dataclass(slots=True)
+class BulkRoleFailure:
+    role_name: str
+    member_name: str
+    error: str
+
+
+class BulkRoleRemoval:
+    """
+    Removes a set of roles from every member that holds them.
+    """
+
+    roles: list[discord.Role]
+    status_message: discord.Message | discord.PartialMessage
+    removed: dict[int, int]
+    failures: list[BulkRoleFailure]
+    _total: int
+
+    def __init__(
+        self,
+        roles: list[discord.Role],
+        status_message: discord.Message | discord.PartialMessage,
+        removed: dict[int, int] | None = None,
+    ):
+        self.roles = roles
+        self.status_message = status_message
+        self.removed = {role.id: 0 for role in roles} | (removed or {})
+        self.failures = []
+        self._total = 0
+
+    @classmethod
+    async def start(cls, roles: list[discord.Role], channel: discord.abc.Messageable) -> "BulkRoleRemoval":
+        """
+        Posts the status message for a new removal and records the removal so it can be resumed.
+
+        :param roles: The roles to remove.
+        :param channel: The channel to post the status message in.
+        :returns: The removal, ready to run.
+        """
+        role_names = ", ".join(role.name for role in roles)
+        status_message = await send_queue.send(channel, content=f"Preparing to remove roles: {role_names}...")
+        await database.add_bulk_role_operation(status_message.id, status_message.channel.id, [r.id for r in roles])
+        return cls(roles, status_message)
+
+    @classmethod
+    async def load_unfinished(cls) -> list["BulkRoleRemoval"]:
+        """
+        Loads removals that were interrupted by a restart. A removal whose roles or channel no longer exist is
+        dropped, one that fails to load for another reason is skipped and tried again on the next start.
+
+        :returns: The unfinished removals, ready to run.
+        """
+        operations = []
+        for row in await database.get_bulk_role_operations():
+            message_id = int(row["message_id"])
+            try:
+                if operation := await cls._load_row(row):
+                    operations.append(operation)
+                else:
+                    await database.delete_bulk_role_operation(message_id)
+            except Exception as e:
+                logger.exception(f"Failed to load unfinished bulk role removal {message_id}, skipping it: {e}")
+        return operations
+
+    @classmethod
+    async def _load_row(cls, row: sqlite3.Row) -> "BulkRoleRemoval | None":
+        """
+        :param row: The stored removal.
+        :returns: The removal, or None if there is nothing left to resume.
+        """
+        message_id = int(row["message_id"])
+        roles = []
+        for role_id in row["role_ids"].split(","):
+            try:
+                role = await bot.get_or_fetch.role(int(role_id))
+            except discord.NotFound:
+                role = None
+            if role is None:
+                logger.warning(f"Role {role_id} of bulk role removal {message_id} no longer exists, skipping it.")
+                continue
+            roles.append(role)
+        if not roles:
+            logger.warning(f"None of the roles of bulk role removal {message_id} exist, dropping it.")
+            return None
+
+        try:
+            channel = await bot.get_or_fetch.channel(int(row["channel_id"]))
+        except discord.NotFound:
+            channel = None
+        if channel is None:
+            logger.warning(f"Status channel of bulk role removal {message_id} no longer exists, dropping it.")
+            return None
+
+        status_message = channel.get_partial_message(message_id)
+        role_ids = {role.id for role in roles}
+        removed = {
+            int(role_id): count
+            for role_id, count in json.loads(row["removed_counts"]).items()
+            if int(role_id) in role_ids
+        }
+        return cls(roles, status_message, removed)
+
+    async def run(self) -> None:
+        """
+        Removes the roles, then publishes the final summary and failure report.
+        """
+        # Members who already lost the role before a restart are no longer in role.members, so a resumed run only
+        # sees the remaining work
+        jobs = [(role, member) for role in self.roles for member in role.members]
+        self._total = len(jobs) + sum(self.removed.values())
+        logger.info(f"Removing {len(jobs)} role assignment(s) for roles: {[role.name for role in self.roles]}")
+
+        semaphore = asyncio.Semaphore(BULK_ROLE_CONCURRENCY)
+        progress_task = asyncio.create_task(self._report_progress())
+        try:
+            await asyncio.gather(*(self._remove(semaphore, role, member) for role, member in jobs))
+        finally:
+            progress_task.cancel()
+
+        await database.delete_bulk_role_operation(self.status_message.id)
+        await self._publish_summary()
+        logger.info(f"Bulk role removal finished: {self.removed}, {len(self.failures)} failure(s)")
+
+    async def _remove(self, semaphore: asyncio.Semaphore, role: discord.Role, member: discord.Member) -> None:
+        async with semaphore:
+            try:
+                await member.remove_roles(role, reason="Booze cruise role cleanup")
+                self.removed[role.id] += 1
+                logger.debug("Removed {} from member: {}", role, member.name)
+            except discord.HTTPException as e:
+                logger.warning(f"Unable to remove {role} from {member}: {e}")
+                self.failures.append(BulkRoleFailure(role.name, member.name, str(e)))
+
+    async def _report_progress(self) -> None:
+        while True:
+            await asyncio.sleep(BULK_ROLE_PROGRESS_INTERVAL)
+            try:
+                await database.set_bulk_role_operation_counts(
+                    self.status_message.id, json.dumps({str(k): v for k, v in self.removed.items()})
+                )
+                done = sum(self.removed.values()) + len(self.failures)
+                await send_queue.edit(
+                    self.status_message,
+                    content=f"Removing roles... {done}/{self._total} done"
+                    + (f", {len(self.failures)} failed" if self.failures else "")
+                    + f"\n{self._format_counts()}",
+                )
+            except Exception as e:
+                logger.exception(f"Failed to report bulk role removal progress: {e}")
+
+    def _format_counts(self) -> str:
+        return "\n".join(
+            f"Successfully removed {self.removed[role.id]} users from the {role.name} role." for role in self.roles
+        )
+
+    async def _publish_summary(self) -> None:
+        content = self._format_counts()
+        attachments = []
+        if self.failures:
+            report = "\n".join(f"{f.role_name}: {f.member_name} ({f.error})" for f in self.failures)
+            if len(report) <= FAILURE_REPORT_INLINE_LIMIT:
+                content += f"\n\nFailed to remove {len(self.failures)} role(s):\n{report}"
+            else:
+                content += f"\n\nFailed to remove {len(self.failures)} role(s), see the attached report."
+                attachments.append(discord.File(io.BytesIO(report.encode()), filename="role_removal_failures.txt"))
+
+        await send_queue.edit(self.status_message, content=content, attachments=attachments)
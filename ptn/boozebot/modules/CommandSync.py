@@ -0,0 +1,80 @@
+"""
+Syncs the application command tree only when it has changed.
+
+Command sync is one of Discord's most heavily rate limited endpoints and adds seconds to every restart. The payload
+sync would send, the commands' names, parameters, choices and context menus, is hashed and the hash stored after
+each successful sync, so a restart with the same commands skips the sync entirely.
+"""
+
+import hashlib
+import json
+import time
+
+from discord import Object
+from ptn_utils.global_constants import DISCORD_GUILD
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.constants import COMMAND_TREE_HASH_PATH, bot
+
+logger = get_logger("boozebot.modules.commandsync")
+
+
+def command_tree_fingerprint() -> str:
+    """
+    Hashes the guild's command tree as it would be sent to Discord by a sync.
+
+    :returns: The hex SHA-256 of the sync payload.
+    """
+    guild = Object(DISCORD_GUILD)
+    payload = sorted(
+        (command.to_dict(bot.tree) for command in bot.tree.get_commands(guild=guild)),
+        key=lambda command: (command.get("type", 1), command["name"]),
+    )
+    # The same commands synced to another application or guild still need syncing
+    document = {"application_id": bot.application_id, "guild_id": DISCORD_GUILD, "commands": payload}
+    return hashlib.sha256(json.dumps(document, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _read_stored_fingerprint() -> str | None:
+    try:
+        return COMMAND_TREE_HASH_PATH.read_text().strip() or None
+    except FileNotFoundError:
+        return None
+    except OSError as e:
+        logger.warning(f"Could not read the stored command tree hash, syncing anyway: {e}")
+        return None
+
+
+def _store_fingerprint(fingerprint: str) -> None:
+    try:
+        COMMAND_TREE_HASH_PATH.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = COMMAND_TREE_HASH_PATH.with_suffix(".tmp")
+        temp_path.write_text(fingerprint)
+        temp_path.replace(COMMAND_TREE_HASH_PATH)
+    except OSError as e:
+        # Only costs an unneeded sync on the next start
+        logger.warning(f"Could not store the command tree hash: {e}")
+
+
+async def sync_command_tree(force: bool = False) -> bool:
+    """
+    Copies the global commands to the guild and syncs the guild's commands, if they changed since the last sync.
+
+    :param force: Sync even if the commands are unchanged.
+    :returns: True if the tree was synced, False if the sync was skipped.
+    """
+    guild = Object(DISCORD_GUILD)
+    bot.tree.copy_global_to(guild=guild)
+
+    fingerprint = command_tree_fingerprint()
+    stored = _read_stored_fingerprint()
+    if not force and fingerprint == stored:
+        logger.info(f"Command tree unchanged ({fingerprint[:12]}), skipping sync.")
+        return False
+
+    logger.info(f"Syncing command tree ({stored and stored[:12]} -> {fingerprint[:12]}, forced: {force})...")
+    start = time.perf_counter()
+    synced = await bot.tree.sync(guild=guild)
+    logger.info(f"Synced {len(synced)} command(s) in {time.perf_counter() - start:.2f}s.")
+    _store_fingerprint(fingerprint)
+    return True
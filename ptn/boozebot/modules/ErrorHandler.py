@@ -42,6 +42,16 @@ class CommandRoleError(app_commands.CheckFailure):
         super().__init__(permitted_roles, formatted_role_list, "Role check error raised")
 
 
+class CacheNotReadyError(app_commands.CheckFailure):
+    """Cache readiness check error"""
+
+    caches: list[str]
+
+    def __init__(self, caches: list[str]):
+        self.caches = caches
+        super().__init__(caches, "Cache readiness check error raised")
+
+
 class AsyncioTimeoutError(Exception):
     """Timeout error"""
 
@@ -94,7 +104,7 @@ async def on_text_command_error(ctx: commands.Context[commands.Bot], error: Exce
         await ctx.send("**You do not have the required permissions to run this command**")
     elif isinstance(error, commands.MissingAnyRole):
         logger.debug("Missing any role error raised, reporting to user")
-        logger.debug(f"User missing roles: {error.missing_roles}")
+        logger.debug("User missing roles: {}", error.missing_roles)
         guild = cast("Guild", ctx.guild)
         roles = ", ".join(role.name for role_id in error.missing_roles if (role := guild.get_role(int(role_id))))
         await ctx.send(f"**You must have one of the following roles to use this command:** {roles}")
@@ -114,7 +124,7 @@ async def on_app_command_error(interaction: Interaction, error: AppCommandError)
         )
         if isinstance(error, CommandChannelError):
             logger.debug(
-                f"Channel check error raised. Permitted channel(s): {error.permitted_channel}, reporting to user"
+                "Channel check error raised. Permitted channel(s): {}, reporting to user", error.permitted_channel
             )
             formatted_channel_list = error.formatted_channel_list
 
@@ -126,7 +136,7 @@ async def on_app_command_error(interaction: Interaction, error: AppCommandError)
             logger.debug("Channel check error message sent to user")
 
         elif isinstance(error, CommandRoleError):
-            logger.debug(f"Role check error raised. Permitted role(s): {error.permitted_roles}, reporting to user")
+            logger.debug("Role check error raised. Permitted role(s): {}, reporting to user", error.permitted_roles)
             permitted_roles = error.permitted_roles
             formatted_role_list = error.formatted_role_list
             if len(permitted_roles) > 1:
@@ -142,10 +152,20 @@ async def on_app_command_error(interaction: Interaction, error: AppCommandError)
             await interaction.response.send_message(embed=embed, ephemeral=True)
             logger.debug("Role check error message sent to user")
 
+        elif isinstance(error, CacheNotReadyError):
+            logger.debug("Cache readiness check error raised. Cold cache(s): {}, reporting to user", error.caches)
+            embed = Embed(
+                description=f"Pirate Steve is still waking up and loading his {' and '.join(error.caches)}. "
+                + "Try again in a moment.",
+                color=EMBED_COLOUR_ERROR,
+            )
+            await interaction.response.send_message(embed=embed, ephemeral=True)
+            logger.debug("Cache readiness check error message sent to user")
+
         elif isinstance(error, CustomError):
             message = error.message
             is_private = error.is_private
-            logger.debug(f"Custom error raised with message: {message}, is_private: {is_private}")
+            logger.debug("Custom error raised with message: {}, is_private: {}", message, is_private)
             embed = Embed(description=f"❌ {message}", color=EMBED_COLOUR_ERROR)
             if is_private:  # message should be ephemeral
                 try:
@@ -160,7 +180,7 @@ async def on_app_command_error(interaction: Interaction, error: AppCommandError)
             logger.debug("Custom error message sent to user")
 
         elif isinstance(error, GenericError):
-            logger.debug(f"Generic error raised with message: {error}, reporting to user")
+            logger.debug("Generic error raised with message: {}, reporting to user", error)
             embed = Embed(description=f"❌ {error}", color=EMBED_COLOUR_ERROR)
             try:
                 await interaction.response.send_message(embed=embed, ephemeral=True)
@@ -169,7 +189,7 @@ async def on_app_command_error(interaction: Interaction, error: AppCommandError)
             logger.debug("Generic error message sent to user")
 
         elif isinstance(error, CommandInvokeError) and isinstance(error.original, HTTPStatusError):
-            logger.debug(f"HTTPStatusError raised with message: {error}, reporting to user without details")
+            logger.debug("HTTPStatusError raised with message: {}, reporting to user without details", error)
             status_code = error.original.response.status_code
             embed = Embed(description=f"❌ An HTTP error occurred: {status_code}", color=EMBED_COLOUR_ERROR)
             try:
@@ -181,7 +201,7 @@ async def on_app_command_error(interaction: Interaction, error: AppCommandError)
         elif isinstance(error, CommandInvokeError) and isinstance(
             error.original, (TimeoutException, ConnectError, NetworkError)
         ):
-            logger.debug(f"Network-related error raised with message: {error}, reporting to user")
+            logger.debug("Network-related error raised with message: {}, reporting to user", error)
             embed = Embed(description="❌ A network error occurred", color=EMBED_COLOUR_ERROR)
             try:
                 await interaction.response.send_message(embed=embed)
@@ -190,7 +210,7 @@ async def on_app_command_error(interaction: Interaction, error: AppCommandError)
             logger.debug("Network-related error message sent to user")
 
         else:
-            logger.debug(f"Unhandled error type: {type(error)}, reporting to user")
+            logger.debug("Unhandled error type: {}, reporting to user", type(error))
             embed = Embed(description=f"❌ Unhandled Error: {error}", color=EMBED_COLOUR_ERROR)
             try:
                 await interaction.response.send_message(embed=embed, ephemeral=True)
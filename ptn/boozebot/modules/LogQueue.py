@@ -0,0 +1,207 @@
+# pyright: reportPrivateUsage=false
+"""
+Moves log output off the event loop.
+
+Loguru writes to its sinks in the thread that made the log call, so with trace logging on every SQL statement and raw
+websocket frame blocks the event loop on a terminal or file write. The queued sink hands each formatted record to a
+background thread that does the writing. The queue is bounded, so a stalled output drops records rather than growing
+without limit, and the drops are counted.
+
+Only the stream of the stderr handlers set up by ptn_utils is swapped for the queue, so their level, format and filters
+are kept and any other handlers are left alone. Loguru has no public API for this, so it is only done on the loguru
+versions it was checked against, and log output is left unqueued on any other.
+"""
+
+import contextlib
+import queue
+import sys
+import threading
+from typing import TYPE_CHECKING, Any, TextIO
+
+import loguru
+from loguru import logger as root_logger
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.modules.metrics import LOG_RECORDS_DROPPED
+
+if TYPE_CHECKING:
+    from loguru import Message
+
+logger = get_logger("boozebot.modules.logqueue")
+
+# Records waiting to be written before new ones are dropped
+LOG_QUEUE_SIZE = 10_000
+# Time a warning or worse waits for space in a full queue before it is dropped too
+LOG_QUEUE_PUT_TIMEOUT = 0.1
+# Time allowed for the queue to drain when the bot shuts down
+LOG_QUEUE_DRAIN_TIMEOUT = 5.0
+# Loguru versions whose handler internals the stream swap was checked against, matching the pin in pyproject.toml
+_SUPPORTED_LOGURU_VERSION_PREFIX = "0.7."
+# Loguru severity number of WARNING
+_WARNING_LEVEL_NO = 30
+
+# Put on the queue to stop the writer thread
+_STOP = object()
+
+
+class QueuedLogSink:
+    """
+    A loguru sink that queues formatted records for a background thread to write.
+
+    Loguru still formats each record in the calling thread, only the write itself is moved off it. Once closed, records
+    are written straight to the target.
+    """
+
+    dropped: int
+    _target: TextIO
+    _queue: queue.Queue[str | object]
+    _thread: threading.Thread
+    _closed: bool
+    # Drops not yet reported in the log output
+    _unreported_drops: int
+    _drop_lock: threading.Lock
+
+    def __init__(self, target: TextIO, maxsize: int = LOG_QUEUE_SIZE):
+        """
+        :param target: The stream the records are written to.
+        :param maxsize: The number of records that can wait to be written.
+        """
+        self.dropped = 0
+        self._target = target
+        self._queue = queue.Queue(maxsize)
+        self._closed = False
+        self._unreported_drops = 0
+        self._drop_lock = threading.Lock()
+        self._thread = threading.Thread(target=self._writer, name="log_writer", daemon=True)
+        self._thread.start()
+
+    def write(self, message: "Message") -> None:
+        """
+        Called by loguru with each formatted record.
+
+        :param message: The formatted record.
+        """
+        if self._closed:
+            self._write_now(message)
+            return
+        try:
+            if message.record["level"].no >= _WARNING_LEVEL_NO:
+                self._queue.put(message, timeout=LOG_QUEUE_PUT_TIMEOUT)
+            else:
+                self._queue.put_nowait(message)
+        except queue.Full:
+            with self._drop_lock:
+                self.dropped += 1
+                self._unreported_drops += 1
+            LOG_RECORDS_DROPPED.inc()
+
+    def flush(self) -> None:
+        """
+        Called by loguru after each write. The writer thread flushes the target after every record it writes.
+        """
+
+    def isatty(self) -> bool:
+        # Lets loguru decide whether to colorize from the real stream
+        return self._target.isatty()
+
+    def drain(self, timeout: float = LOG_QUEUE_DRAIN_TIMEOUT) -> bool:
+        """
+        Waits for the records queued so far to be written.
+
+        :param timeout: The longest to wait, in seconds.
+        :returns: True if the queue drained in time.
+        """
+        with self._queue.all_tasks_done:
+            return self._queue.all_tasks_done.wait_for(lambda: not self._queue.unfinished_tasks, timeout)
+
+    def stop(self) -> None:
+        """
+        Called by loguru when the sink is removed. Writes out the queue and stops the writer thread.
+        """
+        self.close()
+
+    def close(self, timeout: float = LOG_QUEUE_DRAIN_TIMEOUT) -> None:
+        """
+        Writes out the queued records and stops the writer thread. Later records are written straight to the target.
+
+        :param timeout: The longest to wait for the queue to drain, in seconds.
+        """
+        if self._closed:
+            return
+        # A queue still full after the timeout is left to the daemon thread
+        with contextlib.suppress(queue.Full):
+            self._queue.put(_STOP, timeout=timeout)
+        self._thread.join(timeout)
+        self._closed = True
+        self._report_drops()
+        self._target.flush()
+
+    def _writer(self) -> None:
+        while True:
+            message = self._queue.get()
+            try:
+                if message is _STOP:
+                    return
+                self._report_drops()
+                self._write_now(message)
+            finally:
+                self._queue.task_done()
+
+    def _report_drops(self) -> None:
+        with self._drop_lock:
+            unreported, self._unreported_drops = self._unreported_drops, 0
+        if unreported:
+            self._write_now(f"[log queue full, dropped {unreported} record(s)]\n")
+
+    def _write_now(self, message: str) -> None:
+        try:
+            self._target.write(message)
+            self._target.flush()
+        except (OSError, ValueError):
+            # Nowhere left to report a failed log write
+            pass
+
+
+def _stderr_stream_sinks() -> list[Any] | None:
+    """
+    Finds the loguru stream sinks writing to stderr.
+
+    :returns: The sinks, or None if this loguru version is not one the stream swap was checked against or its
+        handlers are not laid out as expected.
+    """
+    if not loguru.__version__.startswith(_SUPPORTED_LOGURU_VERSION_PREFIX):
+        return None
+    # Loguru has no public API to change a handler's stream, and adding a new handler would lose the format and level
+    # ptn_utils configured. A stream handler writes through its sink's _stream.
+    handlers = getattr(getattr(root_logger, "_core", None), "handlers", None)
+    if not isinstance(handlers, dict):
+        return None
+    stream_sinks = []
+    for handler in handlers.values():
+        stream_sink = getattr(handler, "_sink", None)
+        if getattr(stream_sink, "_stream", None) is sys.stderr:
+            stream_sinks.append(stream_sink)
+    return stream_sinks
+
+
+def install_queued_log_sink() -> QueuedLogSink | None:
+    """
+    Moves the writes of loguru's stderr handlers to a queued sink writing to stderr. The handlers keep their level,
+    format and filters, and handlers writing anywhere else are left alone.
+
+    :returns: The installed sink, to be closed at shutdown, or None if there is no stderr handler or the loguru version
+        is not supported.
+    """
+    stream_sinks = _stderr_stream_sinks()
+    if stream_sinks is None:
+        logger.warning(f"Loguru {loguru.__version__} handlers not recognised, log output is not queued.")
+        return None
+    if not stream_sinks:
+        logger.warning("No stderr log handler found, log output is not queued.")
+        return None
+
+    sink = QueuedLogSink(sys.stderr)
+    for stream_sink in stream_sinks:
+        stream_sink._stream = sink
+    logger.info(f"Log output moved to a background writer, queue size {LOG_QUEUE_SIZE}.")
+    return sink
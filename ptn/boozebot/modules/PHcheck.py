@@ -26,11 +26,11 @@ async def get_state_from_edsm() -> tuple[bool, datetime]:
         r.raise_for_status()
         result = r.json()
 
-    logger.debug(f"EDSM API response: {result}")
+    logger.debug("EDSM API response: {}", result)
 
     faction = (result.get("factions") or [{}]).pop()
     active_states = {x["state"] for x in faction.get("activeStates", [])}
-    logger.debug(f"Active States: {active_states}")
+    logger.debug("Active States: {}", active_states)
     last_update = datetime.fromtimestamp(faction.get("lastUpdate") or 0, tz=UTC)
     now = datetime.now(UTC)
     if now - last_update > STALE_DATA_THRESHOLD:
@@ -0,0 +1,109 @@
+"""
+Applies permission overwrites to many channels at once.
+
+Each channel's overwrites sit on their own rate limit route, so the updates are made concurrently, bounded so a large
+batch does not run into the global request limit. discord.py waits out any per-route limit itself.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import discord
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.constants import bot
+from ptn.boozebot.modules.metrics import PERMISSION_BATCH_DURATION
+
+logger = get_logger("boozebot.modules.permissionbatch")
+
+# Upper bound on permission updates in flight at once
+PERMISSION_BATCH_CONCURRENCY = 5
+
+
+@dataclass(slots=True)
+class PermissionUpdate:
+    channel_id: int
+    target: discord.Role | discord.Member | discord.abc.Snowflake
+    # Permissions merged into the target's current overwrite, or None to remove the overwrite entirely
+    permissions: dict[str, bool | None] | None
+
+
+@dataclass(slots=True)
+class PermissionResult:
+    channel_id: int
+    error: str | None = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class PermissionBatchResult:
+    results: list[PermissionResult]
+    elapsed: float
+
+    @property
+    def failures(self) -> list[PermissionResult]:
+        return [result for result in self.results if not result.success]
+
+
+async def apply_permission_batch(
+    updates: list[PermissionUpdate],
+    reason: str | None = None,
+    scope: str = "channels",
+    on_result: Callable[[PermissionResult], None] | None = None,
+) -> PermissionBatchResult:
+    """
+    Applies a set of permission overwrite updates concurrently.
+
+    :param updates: The updates to apply.
+    :param reason: The audit log reason for the updates.
+    :param scope: The metric label for the batch, e.g. the command that made it.
+    :param on_result: Called with each result as its update finishes, for progress reporting.
+    :returns: One result per update, in the order given, and the total wall time of the batch.
+    """
+    semaphore = asyncio.Semaphore(PERMISSION_BATCH_CONCURRENCY)
+    start = time.perf_counter()
+    results = await asyncio.gather(*(_apply(semaphore, update, reason, on_result) for update in updates))
+    elapsed = time.perf_counter() - start
+    PERMISSION_BATCH_DURATION.labels(scope=scope).observe(elapsed)
+
+    batch = PermissionBatchResult(list(results), elapsed)
+    logger.info(
+        f"Applied {len(updates)} permission update(s) for {scope} in {elapsed:.2f}s, {len(batch.failures)} failed."
+    )
+    return batch
+
+
+async def _apply(
+    semaphore: asyncio.Semaphore,
+    update: PermissionUpdate,
+    reason: str | None,
+    on_result: Callable[[PermissionResult], None] | None,
+) -> PermissionResult:
+    result = await _set_permissions(semaphore, update, reason)
+    if on_result is not None:
+        on_result(result)
+    return result
+
+
+async def _set_permissions(
+    semaphore: asyncio.Semaphore, update: PermissionUpdate, reason: str | None
+) -> PermissionResult:
+    async with semaphore:
+        try:
+            channel = await bot.get_or_fetch.channel(update.channel_id)
+            logger.debug("Setting permissions for {} in channel ID: {}", update.target, update.channel_id)
+            if update.permissions is None:
+                await channel.set_permissions(update.target, overwrite=None, reason=reason)
+            else:
+                overwrite = channel.overwrites_for(update.target)
+                overwrite.update(**update.permissions)
+                await channel.set_permissions(update.target, overwrite=overwrite, reason=reason)
+        except Exception as e:
+            logger.exception(f"Failed to set permissions for {update.target} in channel ID: {update.channel_id}: {e}")
+            return PermissionResult(update.channel_id, str(e))
+        return PermissionResult(update.channel_id)
@@ -0,0 +1,293 @@
+"""
+Runs auto response regex triggers in a worker process with a hard time budget.
+
+Python's re module holds the GIL for the whole of a search, so a catastrophically backtracking pattern cannot be
+interrupted from a thread. Searches are made in a separate process instead, which is killed and restarted when a
+search overruns its budget.
+"""
+
+import asyncio
+import multiprocessing
+import re
+from dataclasses import dataclass
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.modules.metrics import REGEX_SANDBOX_TIMEOUTS
+
+logger = get_logger("boozebot.modules.regexsandbox")
+
+# Time allowed for one trigger search on a message
+REGEX_TIME_BUDGET = 0.05
+# Time allowed for one search of the worst-case corpus when a trigger is created or edited
+REGEX_BENCHMARK_BUDGET = 0.25
+# Length of the benchmark corpus strings, the longest message a Nitro user can send
+REGEX_BENCHMARK_LENGTH = 4000
+# Regex triggers that overrun their budget this many times are disabled
+REGEX_STRIKE_LIMIT = 3
+# Time allowed for a new worker process to start
+WORKER_START_TIMEOUT = 10.0
+# Compiled patterns cached by the worker before the cache is cleared
+WORKER_PATTERN_CACHE_SIZE = 256
+
+_BRACE_QUANTIFIER_RE = re.compile(r"\{(\d*)(,?)(\d*)\}")
+# Characters with a special meaning outside a character class
+_METACHARACTERS = frozenset("\\[](){}|.^$*+?")
+
+# (pattern, text) to search
+RegexJob = tuple[str, str]
+
+
+def _worker_main(conn: Connection) -> None:
+    patterns: dict[str, re.Pattern[str]] = {}
+    conn.send("ready")
+    while True:
+        try:
+            jobs: list[RegexJob] = conn.recv()
+        except EOFError:
+            return
+        for pattern, text in jobs:
+            compiled = patterns.get(pattern)
+            if compiled is None:
+                if len(patterns) >= WORKER_PATTERN_CACHE_SIZE:
+                    patterns.clear()
+                compiled = patterns[pattern] = re.compile(pattern)
+            conn.send(compiled.search(text) is not None)
+
+
+@dataclass(slots=True)
+class SandboxResult:
+    # One result per job completed, in order
+    matches: list[bool]
+    # The index of the job that overran its budget, the jobs after it were not run
+    timed_out: int | None = None
+
+
+class RegexSandbox:
+    """
+    A single worker process that searches regex patterns, replaced whenever a search overruns.
+    """
+
+    _process: BaseProcess | None
+    _conn: Connection | None
+    _lock: asyncio.Lock
+
+    def __init__(self):
+        self._process = None
+        self._conn = None
+        self._lock = asyncio.Lock()
+
+    async def run(self, jobs: list[RegexJob], budget: float = REGEX_TIME_BUDGET) -> SandboxResult:
+        """
+        Searches each job's text for its pattern, in order, stopping at the first search to overrun.
+
+        :param jobs: The searches to make.
+        :param budget: The time allowed for each search, in seconds.
+        :returns: The results of the searches completed, and the index of the search that overran, if any.
+        """
+        if not jobs:
+            return SandboxResult([])
+        async with self._lock:
+            return await asyncio.to_thread(self._run_blocking, jobs, budget)
+
+    def _run_blocking(self, jobs: list[RegexJob], budget: float) -> SandboxResult:
+        matches: list[bool] = []
+        try:
+            conn = self._ensure_worker()
+            conn.send(jobs)
+            for index in range(len(jobs)):
+                if not conn.poll(budget):
+                    logger.warning(f"Regex search overran its {budget}s budget: {jobs[index][0]}")
+                    REGEX_SANDBOX_TIMEOUTS.inc()
+                    self.stop()
+                    return SandboxResult(matches, index)
+                matches.append(conn.recv())
+        except (EOFError, OSError) as e:
+            # The jobs that were not completed are treated as not matching
+            logger.error(f"Regex sandbox worker failed: {e}")
+            self.stop()
+        return SandboxResult(matches)
+
+    def _ensure_worker(self) -> Connection:
+        if self._process is not None and self._process.is_alive() and self._conn is not None:
+            return self._conn
+
+        self.stop()
+        # Spawned rather than forked, the bot's event loop and threads must not be copied into the worker
+        context = multiprocessing.get_context("spawn")
+        self._conn, child_conn = context.Pipe()
+        self._process = context.Process(target=_worker_main, args=(child_conn,), name="regex_sandbox", daemon=True)
+        self._process.start()
+        child_conn.close()
+        if not self._conn.poll(WORKER_START_TIMEOUT):
+            self.stop()
+            raise OSError("Regex sandbox worker did not start in time")
+        self._conn.recv()
+        logger.info(f"Started regex sandbox worker with PID {self._process.pid}")
+        return self._conn
+
+    def stop(self) -> None:
+        """
+        Kills the worker process, if there is one. A new worker is started by the next search.
+        """
+        if self._process is not None:
+            self._process.kill()
+            self._process.join(timeout=1)
+        if self._conn is not None:
+            self._conn.close()
+        self._process = None
+        self._conn = None
+
+
+def has_nested_quantifier(pattern: str) -> bool:
+    """
+    Checks a regex for a repeated group that itself contains a repeat, such as (a+)+ or (?:\\w+\\s*)*, the usual
+    cause of catastrophic backtracking.
+
+    A repeat of a single literal character followed by a different literal that must match, as in (?:a+b)+, can only
+    end in one place and so is not counted. Overlapping alternatives such as (a|aa)+ are not detected, and are left to
+    the benchmark.
+
+    :param pattern: The regex pattern.
+    :returns: True if the pattern has a nested quantifier.
+    """
+    # Whether each currently open group contains a repeat
+    open_groups: list[bool] = []
+    # Whether the previous token is a group containing a repeat
+    after_repeating_group = False
+    # The previous token, if it is a single literal character
+    previous_literal: str | None = None
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        end = index + 1
+        literal = _literal_at(pattern, index)
+        is_repeat = char in "*+"
+        if char == "{" and (brace := _BRACE_QUANTIFIER_RE.match(pattern, index)):
+            low, comma, high = brace.groups()
+            # {n,} and {n,m} repeat unless capped at one, {n} repeats when n is more than one
+            is_repeat = (not high or int(high) > 1) if comma else (bool(low) and int(low) > 1)
+            end = brace.end()
+            literal = None
+
+        if is_repeat:
+            if after_repeating_group:
+                return True
+            # Skip the lazy or possessive modifier
+            if end < len(pattern) and pattern[end] in "?+":
+                end += 1
+            if open_groups and not _is_delimited(pattern, previous_literal, end):
+                open_groups[-1] = True
+            literal = None
+        elif char == "\\":
+            end = index + 2
+        elif char == "[":
+            end = _skip_character_class(pattern, index)
+        elif char == "(":
+            open_groups.append(False)
+        elif char == ")" and open_groups:
+            contains_repeat = open_groups.pop()
+            if contains_repeat and open_groups:
+                open_groups[-1] = True
+            after_repeating_group = contains_repeat
+            previous_literal = None
+            index = end
+            continue
+
+        after_repeating_group = False
+        previous_literal = literal[0] if literal else None
+        index = end
+    return False
+
+
+def _literal_at(pattern: str, index: int) -> tuple[str, int] | None:
+    """
+    :returns: The literal character at the index and the index after it, or None if the token there is not a single
+        literal character.
+    """
+    if index >= len(pattern):
+        return None
+    char = pattern[index]
+    if char == "\\":
+        # Escaped letters and digits are classes, anchors or backreferences
+        if index + 1 < len(pattern) and not pattern[index + 1].isalnum():
+            return pattern[index + 1], index + 2
+        return None
+    if char in _METACHARACTERS:
+        return None
+    return char, index + 1
+
+
+def _is_delimited(pattern: str, repeated: str | None, index: int) -> bool:
+    """
+    :param repeated: The literal character being repeated, or None if the repeated token is not a single literal.
+    :param index: The index after the repeat.
+    :returns: True if the repeat is followed by a different literal character that must match, which ends the repeat
+        in exactly one place.
+    """
+    if repeated is None:
+        return False
+    following = _literal_at(pattern, index)
+    if following is None or following[0] == repeated:
+        return False
+    after = following[1]
+    # An optional or repeated delimiter does not end the repeat
+    return after >= len(pattern) or pattern[after] not in "*?{"
+
+
+def _skip_character_class(pattern: str, index: int) -> int:
+    index += 1
+    if index < len(pattern) and pattern[index] == "^":
+        index += 1
+    # A ] straight after the opening bracket is a literal
+    if index < len(pattern) and pattern[index] == "]":
+        index += 1
+    while index < len(pattern) and pattern[index] != "]":
+        index += 2 if pattern[index] == "\\" else 1
+    return index + 1
+
+
+def worst_case_corpus(pattern: str) -> list[str]:
+    """
+    Builds long strings likely to make a backtracking pattern slow: runs of the characters the pattern uses, with and
+    without a final character that forces the match to fail.
+
+    :param pattern: The regex pattern.
+    :returns: The corpus strings, lowercased like the messages triggers are searched in.
+    """
+    chars = sorted({char for char in pattern.lower() if char.isalnum() or char in " .,!?'-_"} | {"a", "0", " "})[:16]
+    runs = [char * REGEX_BENCHMARK_LENGTH for char in chars]
+    runs.append(("".join(chars) * REGEX_BENCHMARK_LENGTH)[:REGEX_BENCHMARK_LENGTH])
+    return [text for run in runs for text in (run, run[:-1] + "\0")]
+
+
+async def check_regex_trigger(pattern: str) -> str | None:
+    """
+    Checks that a regex trigger is valid and safe to run on every message.
+
+    :param pattern: The regex pattern.
+    :returns: Why the pattern was rejected, or None if it is safe.
+    """
+    try:
+        re.compile(pattern)
+    except re.error as e:
+        return f"Invalid regex pattern: {e}"
+
+    if has_nested_quantifier(pattern):
+        return "The pattern repeats a group that itself contains a repeat, e.g. `(a+)+`, which can backtrack forever."
+
+    corpus = worst_case_corpus(pattern)
+    result = await regex_sandbox.run([(pattern, text) for text in corpus], REGEX_BENCHMARK_BUDGET)
+    if result.timed_out is not None:
+        sample = corpus[result.timed_out]
+        logger.info(f"Regex trigger {pattern} rejected, overran the benchmark on {sample[:10]!r}...")
+        return (
+            f"The pattern took more than {REGEX_BENCHMARK_BUDGET}s on a {len(sample)} character message "
+            f"starting {sample[:10]!r}."
+        )
+    return None
+
+
+regex_sandbox = RegexSandbox()
@@ -0,0 +1,335 @@
+"""
+Runs the bot's periodic background jobs from a single loop.
+
+Each job has a base interval, which can be overridden per cruise state so a job runs often while a cruise is active
+and rarely once it has ended. Random jitter is added to every interval so jobs drift apart rather than firing
+together. Jobs falling due within TICK_COALESCE_WINDOW of each other run in the same tick and share a snapshot of the
+cruise state, which is fetched at most once per tick. A job is rescheduled when its run finishes, so it never
+overlaps itself.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from ptn_utils.enums.booze_enums import CruiseSystemState
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.classes.Cruise import CruiseState
+from ptn.boozebot.modules.metrics import SCHEDULER_JOB_DURATION, SCHEDULER_JOB_LAG, SCHEDULER_JOB_OVERLAPS
+
+logger = get_logger("boozebot.modules.scheduler")
+
+# Fraction of a job's interval added or taken away at random each run
+DEFAULT_JITTER = 0.1
+# Jobs due this many seconds after the first due job are run in the same tick
+TICK_COALESCE_WINDOW = 5.0
+# Runs kept per job for the task status summary
+JOB_HISTORY_SIZE = 50
+
+CruiseStateSource = Callable[[], Awaitable[CruiseState]]
+
+
+class TickSnapshot:
+    """
+    Data shared by the jobs run in one scheduler tick, each fetched at most once and only when first asked for.
+    """
+
+    tick_at: datetime
+    _cruise_state_source: CruiseStateSource | None
+    _cruise_state: asyncio.Future[CruiseState] | None
+
+    def __init__(self, cruise_state_source: CruiseStateSource | None):
+        self.tick_at = datetime.now(tz=UTC)
+        self._cruise_state_source = cruise_state_source
+        self._cruise_state = None
+
+    async def cruise_state(self) -> CruiseState:
+        """
+        :returns: The cruise state, as fetched for this tick.
+        """
+        if self._cruise_state_source is None:
+            raise RuntimeError("No cruise state source registered with the scheduler")
+        if self._cruise_state is None:
+            self._cruise_state = asyncio.ensure_future(self._cruise_state_source())
+        # Shielded so a job cancelled mid-fetch does not cancel the fetch for the other jobs in the tick
+        return await asyncio.shield(self._cruise_state)
+
+
+@dataclass(slots=True)
+class JobRun:
+    duration: float
+    # Seconds the run started after it was due
+    lag: float
+    failed: bool
+
+
+@dataclass(slots=True)
+class JobStats:
+    runs: int
+    failures: int
+    overlaps: int
+    mean_duration: float
+    max_duration: float
+    mean_lag: float
+    max_lag: float
+
+
+class ScheduledJob:
+    """
+    A periodic job run by the scheduler.
+
+    Exposes the same start/cancel/is_running/next_iteration/last_run_time surface as a tasks.loop so it can be managed
+    by the background task commands and the startup orchestrator.
+    """
+
+    name: str
+    interval: float
+    state_intervals: dict[CruiseSystemState, float]
+    jitter: float
+    last_run_time: datetime | None
+    # Seconds until the next run after the current one, for the cruise state at the last run
+    current_interval: float
+    history: deque[JobRun]
+    overlaps: int
+    _callback: Callable[[TickSnapshot], Awaitable[None]]
+    _scheduler: "Scheduler"
+    _running: bool
+    _due: float | None
+    _current: asyncio.Task[None] | None
+
+    def __init__(
+        self,
+        scheduler: "Scheduler",
+        name: str,
+        callback: Callable[[TickSnapshot], Awaitable[None]],
+        interval: float,
+        state_intervals: dict[CruiseSystemState, float] | None = None,
+        jitter: float = DEFAULT_JITTER,
+    ):
+        self._scheduler = scheduler
+        self.name = name
+        self._callback = callback
+        self.interval = interval
+        self.state_intervals = state_intervals or {}
+        self.jitter = jitter
+        self.current_interval = interval
+        self.last_run_time = None
+        self.history = deque(maxlen=JOB_HISTORY_SIZE)
+        self.overlaps = 0
+        self._running = False
+        self._due = None
+        self._current = None
+
+    @property
+    def next_iteration(self) -> datetime | None:
+        if self._due is None:
+            return None
+        return datetime.now(tz=UTC) + timedelta(seconds=max(0.0, self._due - time.monotonic()))
+
+    def is_running(self) -> bool:
+        return self._running
+
+    def start(self, delay: float = 0.0) -> None:
+        """
+        Starts the job.
+
+        :param delay: Seconds until the first run, which is otherwise straight away.
+        """
+        self._running = True
+        self._due = time.monotonic() + delay
+        self._scheduler.wake()
+
+    def cancel(self) -> None:
+        """
+        Stops the job, cancelling its current run if there is one.
+        """
+        self._running = False
+        self._due = None
+        if self._current is not None:
+            self._current.cancel()
+
+    @property
+    def due(self) -> float | None:
+        """
+        The monotonic time the job is next due, or None while it is running or stopped.
+        """
+        return self._due if self._running else None
+
+    def is_due(self, by: float) -> bool:
+        return self.due is not None and self.due <= by
+
+    def stats(self) -> JobStats | None:
+        """
+        :returns: A summary of the job's recent runs, or None if it has not run yet.
+        """
+        if not self.history:
+            return None
+        durations = [run.duration for run in self.history]
+        lags = [run.lag for run in self.history]
+        return JobStats(
+            runs=len(self.history),
+            failures=sum(run.failed for run in self.history),
+            overlaps=self.overlaps,
+            mean_duration=sum(durations) / len(durations),
+            max_duration=max(durations),
+            mean_lag=sum(lags) / len(lags),
+            max_lag=max(lags),
+        )
+
+    def launch(self, snapshot: TickSnapshot, now: float) -> None:
+        """
+        Runs the job as part of a tick, unless its previous run is still going.
+
+        :param snapshot: The tick's shared data.
+        :param now: The monotonic time of the tick.
+        """
+        if self._current is not None and not self._current.done():
+            # The run in progress reschedules the job when it finishes
+            self.overlaps += 1
+            SCHEDULER_JOB_OVERLAPS.labels(job=self.name).inc()
+            logger.warning(f"Scheduled job {self.name} is still running from its last run, skipping this run.")
+            self._due = None
+            return
+
+        lag = max(0.0, now - (self._due or now))
+        self._due = None
+        self._current = asyncio.create_task(self._execute(snapshot, lag), name=f"scheduled_job:{self.name}")
+
+    async def _execute(self, snapshot: TickSnapshot, lag: float) -> None:
+        logger.debug("Running scheduled job {} ({:.2f}s late)", self.name, lag)
+        start = time.perf_counter()
+        failed = False
+        try:
+            await self._callback(snapshot)
+        except asyncio.CancelledError:
+            # Restarted while this run was being cancelled, and the new start was skipped as an overlap
+            if self._running and self._due is None:
+                self._schedule_next(None)
+            raise
+        except Exception as e:
+            logger.exception(f"Scheduled job {self.name} failed: {e}")
+            failed = True
+        duration = time.perf_counter() - start
+
+        self.last_run_time = datetime.now(tz=UTC)
+        self.history.append(JobRun(duration, lag, failed))
+        SCHEDULER_JOB_DURATION.labels(job=self.name).observe(duration)
+        SCHEDULER_JOB_LAG.labels(job=self.name).observe(lag)
+        logger.debug("Scheduled job {} finished in {:.2f}s", self.name, duration)
+
+        # Stopped, or started again while running, which sets its own due time
+        if self._running and self._due is None:
+            self._schedule_next(await self._cruise_state_or_none(snapshot))
+
+    def _schedule_next(self, state: CruiseSystemState | None) -> None:
+        self.current_interval = self._interval_for(state)
+        delay = self.current_interval * (1 + random.uniform(-self.jitter, self.jitter))
+        self._due = time.monotonic() + delay
+        self._scheduler.wake()
+
+    async def _cruise_state_or_none(self, snapshot: TickSnapshot) -> CruiseSystemState | None:
+        if not self.state_intervals:
+            return None
+        try:
+            return (await snapshot.cruise_state())["state"]
+        except Exception as e:
+            logger.warning(f"Could not get the cruise state to schedule {self.name}, using its base interval: {e}")
+            return None
+
+    def _interval_for(self, state: CruiseSystemState | None) -> float:
+        if state is None:
+            return self.interval
+        return self.state_intervals.get(state, self.interval)
+
+
+class Scheduler:
+    """
+    The loop running every scheduled job.
+    """
+
+    _jobs: dict[str, ScheduledJob]
+    _cruise_state_source: CruiseStateSource | None
+    _task: asyncio.Task[None] | None
+    _wakeup: asyncio.Event
+
+    def __init__(self):
+        self._jobs = {}
+        self._cruise_state_source = None
+        self._task = None
+        self._wakeup = asyncio.Event()
+
+    def add_job(
+        self,
+        name: str,
+        callback: Callable[[TickSnapshot], Awaitable[None]],
+        interval: float,
+        state_intervals: dict[CruiseSystemState, float] | None = None,
+        jitter: float = DEFAULT_JITTER,
+    ) -> ScheduledJob:
+        """
+        Registers a job, stopped until it is started. A job registered again under the same name replaces the old one.
+
+        :param name: The job name, used in logs, metrics and the background task commands.
+        :param callback: Called with the tick's shared data on every run.
+        :param interval: Seconds between runs, when the cruise state is unknown or has no interval of its own.
+        :param state_intervals: Seconds between runs for particular cruise states.
+        :param jitter: Fraction of the interval added or taken away at random each run.
+        :returns: The job.
+        """
+        if (old := self._jobs.get(name)) is not None:
+            old.cancel()
+        job = ScheduledJob(self, name, callback, interval, state_intervals, jitter)
+        self._jobs[name] = job
+        return job
+
+    def get_job(self, name: str) -> ScheduledJob | None:
+        return self._jobs.get(name)
+
+    def set_cruise_state_source(self, source: CruiseStateSource) -> None:
+        """
+        Sets where the cruise state shared by each tick is fetched from.
+
+        :param source: Fetches the cruise state.
+        """
+        self._cruise_state_source = source
+
+    def wake(self) -> None:
+        """
+        Makes the loop recheck when the next job is due, starting the loop if needed.
+        """
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="scheduler")
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            self._wakeup.clear()
+            due_times = [job.due for job in self._jobs.values() if job.due is not None]
+            if not due_times:
+                await self._wakeup.wait()
+                continue
+
+            wait = min(due_times) - time.monotonic()
+            if wait > 0:
+                with suppress(TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), wait)
+                continue
+
+            self._tick()
+
+    def _tick(self) -> None:
+        now = time.monotonic()
+        due = [job for job in self._jobs.values() if job.is_due(now + TICK_COALESCE_WINDOW)]
+        logger.debug("Scheduler tick running {}", [job.name for job in due])
+        snapshot = TickSnapshot(self._cruise_state_source)
+        for job in due:
+            job.launch(snapshot, now)
+
+
+scheduler = Scheduler()
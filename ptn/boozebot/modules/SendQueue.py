@@ -0,0 +1,228 @@
+"""
+Central queue for outbound Discord channel messages.
+
+Sends and edits are grouped into per-channel route buckets that mirror Discord's message rate limits, and each
+bucket is drained in priority order. Pending edits to the same message are coalesced into one request, and low
+priority requests are held back or dropped when a bucket is running out of headroom.
+"""
+
+import asyncio
+import heapq
+import itertools
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Any, Literal
+
+import discord
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.modules.metrics import SEND_QUEUE_COALESCED, SEND_QUEUE_DROPPED, SEND_QUEUE_WAIT
+
+logger = get_logger("boozebot.modules.sendqueue")
+
+# Discord allows 5 messages per 5 seconds per channel route
+ROUTE_BUCKET_CAPACITY = 5
+ROUTE_BUCKET_WINDOW = 5.0
+# Tokens kept back for higher priority requests, low priority requests wait while headroom is at or below this
+LOW_PRIORITY_RESERVE = 2
+# Low priority requests that have waited longer than this are dropped rather than sent late
+LOW_PRIORITY_MAX_AGE = 30.0
+
+
+class SendPriority(IntEnum):
+    # Pings someone who is waiting on the bot, e.g. an owner asked to close their unload
+    HIGH = 0
+    # Operational posts such as unload alerts and departure notices
+    NORMAL = 1
+    # Cosmetic output such as GIFs and tally refreshes, may be dropped under pressure
+    LOW = 2
+
+
+RouteKey = tuple[Literal["send", "edit"], int]
+
+
+@dataclass(slots=True)
+class QueuedRequest:
+    target: discord.abc.Messageable | discord.Message | discord.PartialMessage
+    kwargs: dict[str, Any]
+    priority: SendPriority
+    enqueued_at: float
+    futures: list[asyncio.Future[discord.Message | None]] = field(default_factory=list)
+    done: bool = False
+
+    @property
+    def is_edit(self) -> bool:
+        return isinstance(self.target, discord.Message | discord.PartialMessage)
+
+
+class RouteBucket:
+    """
+    Token bucket approximating one Discord rate limit bucket, with the requests waiting on it.
+    """
+
+    tokens: float
+    updated_at: float
+    heap: list[tuple[SendPriority, int, QueuedRequest]]
+    pending_edits: dict[int, QueuedRequest]
+    task: asyncio.Task[None] | None
+
+    def __init__(self):
+        self.tokens = ROUTE_BUCKET_CAPACITY
+        self.updated_at = time.monotonic()
+        self.heap = []
+        self.pending_edits = {}
+        self.task = None
+
+    def headroom(self) -> float:
+        """
+        :returns: The number of requests that can be made on this route right now.
+        """
+        now = time.monotonic()
+        refill = (now - self.updated_at) * ROUTE_BUCKET_CAPACITY / ROUTE_BUCKET_WINDOW
+        self.tokens = min(self.tokens + refill, ROUTE_BUCKET_CAPACITY)
+        self.updated_at = now
+        return self.tokens
+
+    def seconds_until(self, tokens: float) -> float:
+        """
+        :returns: How long until the bucket holds the given number of tokens.
+        """
+        return max(tokens - self.headroom(), 0) * ROUTE_BUCKET_WINDOW / ROUTE_BUCKET_CAPACITY
+
+
+class SendQueue:
+    _buckets: dict[RouteKey, RouteBucket]
+    _sequence: Iterator[int]
+
+    def __init__(self):
+        self._buckets = {}
+        self._sequence = itertools.count()
+
+    def send(
+        self, channel: discord.abc.Messageable, priority: SendPriority = SendPriority.NORMAL, **kwargs: Any
+    ) -> asyncio.Future[discord.Message | None]:
+        """
+        Queues a message to be sent to a channel.
+
+        :param channel: The channel to send to.
+        :param priority: The priority of the message.
+        :param kwargs: Arguments passed to channel.send.
+        :returns: A future resolving to the sent message, or None if a low priority message was dropped.
+        """
+        request = QueuedRequest(channel, kwargs, priority, time.monotonic())
+        return self._enqueue(("send", channel.id), request)
+
+    def edit(
+        self,
+        message: discord.Message | discord.PartialMessage,
+        priority: SendPriority = SendPriority.NORMAL,
+        **kwargs: Any,
+    ) -> asyncio.Future[discord.Message | None]:
+        """
+        Queues an edit to a message. If an edit to the same message is still waiting, the two are merged and both
+        futures resolve once the combined edit is made.
+
+        :param message: The message to edit.
+        :param priority: The priority of the edit.
+        :param kwargs: Arguments passed to message.edit.
+        :returns: A future resolving to the edited message, or None if a low priority edit was dropped.
+        """
+        route: RouteKey = ("edit", message.channel.id)
+        bucket = self._buckets.setdefault(route, RouteBucket())
+        pending = bucket.pending_edits.get(message.id)
+        if pending is None:
+            request = QueuedRequest(message, kwargs, priority, time.monotonic())
+            bucket.pending_edits[message.id] = request
+            return self._enqueue(route, request)
+
+        logger.debug("Coalescing edit to message {} with a pending edit.", message.id)
+        SEND_QUEUE_COALESCED.inc()
+        pending.kwargs.update(kwargs)
+        future = self._new_future()
+        pending.futures.append(future)
+        if priority < pending.priority:
+            # Queue the merged request again at the higher priority, the stale heap entry is skipped once done
+            pending.priority = priority
+            heapq.heappush(bucket.heap, (priority, next(self._sequence), pending))
+        return future
+
+    def _new_future(self) -> asyncio.Future[discord.Message | None]:
+        future: asyncio.Future[discord.Message | None] = asyncio.get_running_loop().create_future()
+        # Failures are logged by the queue, so callers that do not await the future are not warned about them
+        future.add_done_callback(lambda f: f.cancelled() or f.exception())
+        return future
+
+    def _enqueue(self, route: RouteKey, request: QueuedRequest) -> asyncio.Future[discord.Message | None]:
+        bucket = self._buckets.setdefault(route, RouteBucket())
+        future = self._new_future()
+        request.futures.append(future)
+        heapq.heappush(bucket.heap, (request.priority, next(self._sequence), request))
+        if bucket.task is None or bucket.task.done():
+            bucket.task = asyncio.create_task(self._drain(route, bucket), name=f"send_queue_{route[0]}_{route[1]}")
+        return future
+
+    async def _drain(self, route: RouteKey, bucket: RouteBucket) -> None:
+        while bucket.heap:
+            priority, _, request = bucket.heap[0]
+            if request.done:
+                heapq.heappop(bucket.heap)
+                continue
+
+            waited = time.monotonic() - request.enqueued_at
+            if priority == SendPriority.LOW:
+                if waited > LOW_PRIORITY_MAX_AGE:
+                    heapq.heappop(bucket.heap)
+                    self._detach(bucket, request)
+                    logger.info(f"Dropping low priority request on route {route} after waiting {waited:.1f}s.")
+                    SEND_QUEUE_DROPPED.labels(priority=priority.name).inc()
+                    self._finish(request, result=None)
+                    continue
+                required = LOW_PRIORITY_RESERVE + 1
+            else:
+                required = 1
+
+            if delay := bucket.seconds_until(required):
+                # Sleep rather than wait on the heap, a newly queued higher priority request is picked up next loop
+                await asyncio.sleep(min(delay, ROUTE_BUCKET_WINDOW / ROUTE_BUCKET_CAPACITY))
+                continue
+
+            heapq.heappop(bucket.heap)
+            # Detach before the request is made, so later edits queue a new request instead of merging into this one
+            self._detach(bucket, request)
+            bucket.tokens -= 1
+            SEND_QUEUE_WAIT.labels(priority=priority.name).observe(waited)
+            try:
+                if request.is_edit:
+                    result = await request.target.edit(**request.kwargs)
+                else:
+                    result = await request.target.send(**request.kwargs)
+            except Exception as e:
+                if isinstance(e, discord.HTTPException) and e.status == 429:
+                    bucket.tokens = 0
+                logger.warning(f"Queued request on route {route} failed: {e}")
+                self._finish(request, exception=e)
+            else:
+                self._finish(request, result=result)
+
+    @staticmethod
+    def _detach(bucket: RouteBucket, request: QueuedRequest) -> None:
+        request.done = True
+        if request.is_edit and bucket.pending_edits.get(request.target.id) is request:
+            del bucket.pending_edits[request.target.id]
+
+    @staticmethod
+    def _finish(
+        request: QueuedRequest, *, result: discord.Message | None = None, exception: Exception | None = None
+    ) -> None:
+        for future in request.futures:
+            if future.done():
+                continue
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                future.set_result(result)
+
+
+send_queue = SendQueue()
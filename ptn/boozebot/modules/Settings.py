@@ -23,12 +23,33 @@ class Settings:
         "timed_unload_hold_duration": 5,
     }
 
+    settings: SettingsDict
+    _loaded: bool
+
     def __init__(self) -> None:
+        self.settings = {}
+        self._loaded = False
+
+    def _ensure_loaded(self) -> None:
+        if not self._loaded:
+            self.load()
+
+    def load(self) -> None:
+        """
+        Reads the settings file, creating it and adding any missing defaults. Called by the startup orchestrator, or on
+        first use. If loading fails, the next use tries again.
+        """
+        if self._loaded:
+            return
         logger.info("Initializing Settings module.")
-        self.settings: SettingsDict = {}
-        self._create_file_if_not_exists()
-        self._load_settings()
-        self._create_defaults()
+        try:
+            self._create_file_if_not_exists()
+            self._load_settings()
+            self._create_defaults()
+        except Exception:
+            self.settings = {}
+            raise
+        self._loaded = True
         logger.info("Settings initialized successfully.")
 
     def _create_file_if_not_exists(self) -> None:
@@ -53,9 +74,9 @@ class Settings:
         logger.info("Ensuring all default settings are present.")
         updated = False
         for key, value in self.default_settings.items():
-            logger.debug(f"Checking setting '{key}'")
+            logger.debug("Checking setting '{}'", key)
             if key not in self.settings:
-                logger.debug(f"Setting default for missing setting '{key}': {value}, adding to settings.")
+                logger.debug("Setting default for missing setting '{}': {}, adding to settings.", key, value)
                 self.settings[key] = value
                 updated = True
         if updated:
@@ -79,6 +100,7 @@ class Settings:
 
     def get_setting(self, key: str):
         """Get a setting value with proper type checking based on the key."""
+        self._ensure_loaded()
         return self.settings.get(key)
 
     @overload
@@ -92,6 +114,7 @@ class Settings:
 
     def set_setting(self, key: str, value: Any) -> None:
         """Set a setting value based on the key."""
+        self._ensure_loaded()
         logger.info(f"Setting '{key}' to '{value}'")
         self.settings[key] = value
         self._save_settings()
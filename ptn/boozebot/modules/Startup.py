@@ -0,0 +1,173 @@
+"""
+Runs the bot's startup in explicit, timed stages.
+
+1. construct: opens the database, settings and BoozeSheets client, which are otherwise opened on first use
+2. cogs, login, sync: adds the cogs, logs in and syncs the command tree
+3. warm-up: on the first on_ready, warms the caches registered by the cogs, all at once as they are independent
+4. tasks: starts the background tasks registered by the cogs, once the caches they read are warm
+
+Commands reading a cache are gated on it with helpers.check_cache_ready, so they answer gracefully during warm-up.
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Protocol
+
+from ptn_utils.logger.logger import get_logger
+
+from ptn.boozebot.modules.metrics import STARTUP_STAGE_DURATION, STARTUP_TIME_TO_READY
+
+logger = get_logger("boozebot.modules.startup")
+
+# Caches warmed after login, which commands can be gated on
+CACHE_CARRIERS = "carrier cache"
+CACHE_LOAD_MESSAGES = "load message cache"
+
+
+class BackgroundTask(Protocol):
+    """
+    The part of a tasks.loop, or a scheduler with the same surface, used to start it.
+    """
+
+    def is_running(self) -> bool: ...
+
+    def start(self, *args: object, **kwargs: object) -> object: ...
+
+
+@dataclass(slots=True)
+class StageTiming:
+    name: str
+    elapsed: float
+    failed: bool = False
+
+
+class StartupOrchestrator:
+    """
+    Times the startup stages, runs the warm-ups and task starts registered by the cogs, and tracks which caches are
+    warm.
+    """
+
+    timings: list[StageTiming]
+    # Set once the caches are warm and the background tasks started
+    ready: asyncio.Event
+    _started_at: float
+    _warm_ups: dict[str, Callable[[], Awaitable[object]]]
+    _tasks: dict[str, BackgroundTask]
+    _warm: set[str]
+    _warm_up_started: bool
+
+    def __init__(self):
+        self.timings = []
+        self.ready = asyncio.Event()
+        self._started_at = time.perf_counter()
+        self._warm_ups = {}
+        self._tasks = {}
+        self._warm = set()
+        self._warm_up_started = False
+
+    def begin(self) -> None:
+        """
+        Marks the start of startup, which the time to ready is measured from.
+        """
+        self._started_at = time.perf_counter()
+        self.timings.clear()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """
+        Times the enclosed block as a startup stage.
+
+        :param name: The stage name.
+        """
+        logger.info(f"Startup stage {name} starting.")
+        start = time.perf_counter()
+        failed = True
+        try:
+            yield
+            failed = False
+        finally:
+            self._record(StageTiming(name, time.perf_counter() - start, failed))
+
+    def add_warm_up(self, cache: str, warm_up: Callable[[], Awaitable[object]]) -> None:
+        """
+        Registers a cache to warm on the first on_ready, in parallel with the others.
+
+        :param cache: The cache name, which commands can be gated on.
+        :param warm_up: Warms the cache.
+        """
+        self._warm_ups[cache] = warm_up
+
+    def add_task(self, name: str, task: BackgroundTask) -> None:
+        """
+        Registers a background task to start once the caches are warm.
+
+        :param name: The task name, for the timings.
+        :param task: The task to start.
+        """
+        self._tasks[name] = task
+
+    def is_warm(self, cache: str) -> bool:
+        """
+        :param cache: The cache name.
+        :returns: True if the cache has been warmed. A cache whose warm-up failed counts as warm, it is filled on
+            demand as before.
+        """
+        return cache in self._warm
+
+    async def on_ready(self) -> None:
+        """
+        Listener for on_ready. The first time, warms the caches and then starts the background tasks.
+        """
+        if self._warm_up_started:
+            return
+        self._warm_up_started = True
+
+        with self.stage("warm-up"):
+            await asyncio.gather(*(self._warm_up(cache, warm_up) for cache, warm_up in self._warm_ups.items()))
+
+        with self.stage("tasks"):
+            for name, task in self._tasks.items():
+                if task.is_running():
+                    continue
+                try:
+                    task.start()
+                    logger.debug("Started background task {}", name)
+                except Exception as e:
+                    logger.exception(f"Failed to start background task {name}: {e}")
+
+        self.ready.set()
+        total = time.perf_counter() - self._started_at
+        STARTUP_TIME_TO_READY.set(total)
+        logger.info(f"Booze bot ready {total:.2f}s after startup.\n{self.format_timings()}")
+
+    async def _warm_up(self, cache: str, warm_up: Callable[[], Awaitable[object]]) -> None:
+        start = time.perf_counter()
+        failed = False
+        try:
+            await warm_up()
+        except Exception as e:
+            logger.exception(f"Failed to warm up the {cache}: {e}")
+            failed = True
+        self._warm.add(cache)
+        self._record(StageTiming(f"warm-up: {cache}", time.perf_counter() - start, failed))
+
+    def _record(self, timing: StageTiming) -> None:
+        self.timings.append(timing)
+        STARTUP_STAGE_DURATION.labels(stage=timing.name).set(timing.elapsed)
+        logger.info(f"Startup stage {timing.name} {'failed' if timing.failed else 'done'} in {timing.elapsed:.2f}s.")
+
+    def format_timings(self) -> str:
+        """
+        :returns: The per-stage timing breakdown, one stage per line in the order they finished.
+        """
+        width = max((len(timing.name) for timing in self.timings), default=0)
+        return "\n".join(
+            f"{timing.name:<{width}}  {timing.elapsed:>7.2f}s{'  (failed)' if timing.failed else ''}"
+            for timing in self.timings
+        )
+
+
+startup = StartupOrchestrator()
@@ -46,7 +46,7 @@ class ConfirmView(OwnedView):
 async def interaction_check_owner(view: OwnedView, interaction: Interaction):
     """only allow original command user to interact with buttons"""
 
-    logger.debug(f"Checking interaction user ID {interaction.user.id} against view author ID {view.author.id}")
+    logger.debug("Checking interaction user ID {} against view author ID {}", interaction.user.id, view.author.id)
 
     if interaction.user.id == view.author.id:
         logger.debug("Interaction user is the command author. Allowing interaction.")
@@ -64,7 +64,9 @@ class DynamicButton(
     template=r"steve:user:(?P<user_id>[0-9]+):payload:(?P<payload>[^:]+):action:(?P<action>[a-z_]+)",
 ):
     def __init__(self, label: str, action: str, user_id: int, payload: str) -> None:
-        logger.debug(f"Creating DynamicButton: label={label}, action={action}, user_id={user_id}, payload={payload}")
+        logger.debug(
+            "Creating DynamicButton: label={}, action={}, user_id={}, payload={}", label, action, user_id, payload
+        )
         super().__init__(
             ui.Button(
                 label=label,
@@ -81,7 +83,7 @@ class DynamicButton(
     @classmethod
     async def from_custom_id(cls, interaction: discord.Interaction, item: ui.Item[Any], match: re.Match[str], /):
         item = cast("ui.Button[ui.View]", item)
-        logger.debug(f"Parsing DynamicButton from custom_id: {item.custom_id}")
+        logger.debug("Parsing DynamicButton from custom_id: {}", item.custom_id)
         action = str(match["action"])
         user_id = int(match["user_id"])
         payload = str(match["payload"])
@@ -2,8 +2,9 @@ import asyncio
 import json
 from collections.abc import Callable
 from contextlib import suppress
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from enum import Enum
+from functools import cached_property
 from typing import Any, Literal, override
 
 import discord
@@ -24,8 +25,11 @@ from tenacity.stop import stop_base
 
 from ptn.boozebot.classes.BoozeCarrier import BoozeCarrier, CarrierStats
 from ptn.boozebot.classes.Cruise import Cruise, CruiseState, CruiseStats
+from ptn.boozebot.classes.CruiseAggregator import CruiseAggregator
 from ptn.boozebot.constants import BOOZESHEETS_API_BASE_URL, BOOZESHEETS_API_KEY, bot
 from ptn.boozebot.modules.helpers import is_staff
+from ptn.boozebot.modules.metrics import CRUISE_AGGREGATE_TRUSTED
+from ptn.boozebot.modules.Scheduler import ScheduledJob, TickSnapshot, scheduler
 
 
 class PayloadType(Enum):
@@ -37,6 +41,12 @@ logger = get_logger("boozebot.modules.boozeSheetsApi")
 
 _background_tasks: set[asyncio.Task[None]] = set()
 
+# How long a fetched cruise state is trusted before it is fetched again
+CRUISE_STATE_CACHE_TTL = timedelta(minutes=5)
+# Seconds between polls of the full carrier list, less often once a cruise has ended and the carriers stop changing
+CARRIER_POLL_INTERVAL = 300
+CARRIER_POLL_STATE_INTERVALS = {CruiseSystemState.ENDED: 1800}
+
 
 def _should_retry_exception(exception: Exception) -> bool:
     """
@@ -139,42 +149,61 @@ class BoozeSheetsApi:
     _ws_connected: bool
     _ws_running: bool
     _ws_connection: websockets.ClientConnection | None
-    _carrier_poll_running: bool
     _carrier_cache_last_refresh: datetime | None
     ws_task: asyncio.Task[None] | None
-    carrier_poll_task: asyncio.Task[None] | None
+    carrier_poll: ScheduledJob
     ws_client: AsyncClient | None
     bot: Bot
     client_lock: asyncio.Lock
     carrier_cache_lock: asyncio.Lock
-    client: AsyncClient
     base_url: str
     carrier_cache: dict[int, BoozeCarrier]
+    cruise_state_cache: CruiseState | None
+    cruise_aggregator: CruiseAggregator
+    _cruise_state_cached_at: datetime | None
 
     def __init__(self):
         self.base_url = BOOZESHEETS_API_BASE_URL
-        # Configure transport with retries for connection-level failures
-        transport = httpx.AsyncHTTPTransport(retries=3)
-        self.client = httpx.AsyncClient(
-            base_url=self.base_url,
-            cookies={"X-API-KEY": BOOZESHEETS_API_KEY},
-            timeout=10.0,
-            transport=transport,
-        )
         self.client_lock = asyncio.Lock()
         self.bot = bot
         self.ws_client = None
         self.ws_task = None
         self._ws_running = False
-        self._carrier_poll_running = False
         self._last_ws_message_time: datetime | None = None
         self._carrier_cache_last_refresh = None
         self._ws_connected = False
         self._reconnect_delay: int = 5
         self._ws_connection = None
-        self.carrier_poll_task = None
+        self.carrier_poll = scheduler.add_job(
+            "carrier_poll", self._poll_carriers, CARRIER_POLL_INTERVAL, CARRIER_POLL_STATE_INTERVALS
+        )
         self.carrier_cache = {}
         self.carrier_cache_lock = asyncio.Lock()
+        self.cruise_state_cache = None
+        self.cruise_aggregator = CruiseAggregator()
+        self._cruise_state_cached_at = None
+        # Scheduler ticks share the cached cruise state, so a tick fetches it at most once
+        scheduler.set_cruise_state_source(self.get_cached_cruise_state)
+
+    @cached_property
+    def client(self) -> AsyncClient:
+        """
+        The HTTP client, created on first use or by the startup orchestrator as it loads the TLS certificates.
+        """
+        # Configure transport with retries for connection-level failures
+        transport = httpx.AsyncHTTPTransport(retries=3)
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            cookies={"X-API-KEY": BOOZESHEETS_API_KEY},
+            timeout=10.0,
+            transport=transport,
+        )
+
+    async def warm_up(self) -> None:
+        """
+        Fills the carrier cache and the cruise state cache at once, for the startup warm-up.
+        """
+        await asyncio.gather(self._refresh_carrier_cache(), self.get_current_cruise_state())
 
     async def _refresh_carrier_cache(self) -> dict[int, BoozeCarrier]:
         """
@@ -188,6 +217,7 @@ class BoozeSheetsApi:
         async with self.carrier_cache_lock:
             self.carrier_cache = refreshed_cache
             self._carrier_cache_last_refresh = datetime.now(tz=UTC)
+            self.cruise_aggregator.rebuild(carriers)
 
         logger.info(f"Carrier cache refreshed from poll with {len(refreshed_cache)} carriers")
         return refreshed_cache
@@ -199,7 +229,7 @@ class BoozeSheetsApi:
         :param event_type: The websocket event type (e.g. carrier_created, carrier_updated).
         :param data: The raw websocket payload.
         """
-        logger.debug(f"Carrier WS cache update called for event_type={event_type}")
+        logger.debug("Carrier WS cache update called for event_type={}", event_type)
 
         if event_type not in {"carrier_update", "carrier_created"}:
             logger.debug("Not a carrier update/create event, skipping cache update")
@@ -209,58 +239,49 @@ class BoozeSheetsApi:
             carrier = BoozeCarrier(data["carrier"])
 
             self.carrier_cache[carrier.db_id] = carrier
+            self.cruise_aggregator.update(carrier)
 
         logger.debug(
-            f"Carrier cache updated from websocket event for carrier_id={carrier.db_id}, event_type={event_type}"
+            "Carrier cache updated from websocket event for carrier_id={}, event_type={}", carrier.db_id, event_type
         )
 
     async def start_carrier_polling(self):
         """
-        Start the periodic carrier cache polling loop (every 5 minutes).
+        Start the periodic carrier cache polling job on the scheduler.
         """
-        if self._carrier_poll_running:
+        if self.carrier_poll.is_running():
             logger.warning("Carrier polling loop is already running")
             return
 
-        self._carrier_poll_running = True
-        self.carrier_poll_task = asyncio.create_task(self._carrier_poll_loop())
-        logger.info("Started carrier polling loop")
+        # A refresh made since the last poll, e.g. by the startup warm-up, stands in for the first one
+        delay = 0.0
+        if self._carrier_cache_last_refresh is not None:
+            since_refresh = (datetime.now(tz=UTC) - self._carrier_cache_last_refresh).total_seconds()
+            delay = max(0.0, CARRIER_POLL_INTERVAL - since_refresh)
+
+        self.carrier_poll.start(delay=delay)
+        logger.info(f"Started carrier polling loop, first poll in {delay:.0f}s")
 
     async def stop_carrier_polling(self):
         """
-        Stop the periodic carrier cache polling loop.
+        Stop the periodic carrier cache polling job.
         """
-        if not self._carrier_poll_running:
+        if not self.carrier_poll.is_running():
             logger.warning("Carrier polling loop is not running")
             return
 
-        self._carrier_poll_running = False
-        if self.carrier_poll_task:
-            self.carrier_poll_task.cancel()
-            with suppress(asyncio.CancelledError):
-                await self.carrier_poll_task
-            self.carrier_poll_task = None
-
+        self.carrier_poll.cancel()
         logger.info("Stopped carrier polling loop")
 
-    async def _carrier_poll_loop(self):
+    async def _poll_carriers(self, _snapshot: TickSnapshot):
         """
-        Periodically refresh the carrier cache every 5 minutes.
+        Refresh the carrier cache, run by the scheduler every CARRIER_POLL_INTERVAL seconds.
         """
-        while self._carrier_poll_running:
-            try:
-                await self._refresh_carrier_cache()
-            except asyncio.CancelledError:
-                logger.info("Carrier polling loop cancelled")
-                break
-            except Exception as e:
-                logger.exception(f"Carrier polling loop iteration failed: {e}")
-
-            await asyncio.sleep(300)
+        await self._refresh_carrier_cache()
 
     def carrier_autocomplete(self, only_owned: bool = True, state: Literal["full", "unloading", "empty"] | None = None):
         async def autocomplete(interaction: discord.Interaction, current: str) -> list[app_commands.Choice[str]]:
-            logger.debug(f"Carrier autocomplete called with current input: '{current}' and only_owned={only_owned}")
+            logger.debug("Carrier autocomplete called with current input: '{}' and only_owned={}", current, only_owned)
 
             show_only_owned = only_owned and not is_staff(interaction.user)
             owned_carriers = [c for c in self.carrier_cache.values() if c.owner.discord_id == interaction.user.id]
@@ -289,7 +310,9 @@ class BoozeSheetsApi:
                 for name, value in display_items
                 if current.lower() in name.lower()
             ]
-            logger.debug(f"Carrier autocomplete choices: {[choice.name for choice in filtered]}")
+            logger.opt(lazy=True).debug(
+                "Carrier autocomplete choices: {}", lambda: [choice.name for choice in filtered]
+            )
             return filtered[:25]
 
         return autocomplete
@@ -319,7 +342,11 @@ class BoozeSheetsApi:
         """
 
         logger.debug(
-            f"Sending {method} request to BoozeSheets API: endpoint={endpoint}, data={data}, PayloadType: {payload_type}"
+            "Sending {} request to BoozeSheets API: endpoint={}, data={}, PayloadType: {}",
+            method,
+            endpoint,
+            data,
+            payload_type,
         )
 
         async with self.client_lock:
@@ -334,7 +361,7 @@ class BoozeSheetsApi:
 
         response.raise_for_status()
         response_data = response.json()
-        logger.debug(f"Received response from BoozeSheets API: {response_data}")
+        logger.debug("Received response from BoozeSheets API: {}", response_data)
 
         return response_data
 
@@ -346,11 +373,11 @@ class BoozeSheetsApi:
         :return: The carrier information as a dictionary.
         """
 
-        logger.debug(f"Getting carrier info for carrier_id={carrier_id}")
+        logger.debug("Getting carrier info for carrier_id={}", carrier_id)
         carrier_id = carrier_id.upper()
         endpoint = f"/carriers/by-callsign/{carrier_id}"
 
-        logger.debug(f"Sending GET request to {endpoint}")
+        logger.debug("Sending GET request to {}", endpoint)
         try:
             carrier_info = await self._request("GET", endpoint)
         except httpx.HTTPStatusError as e:
@@ -358,7 +385,7 @@ class BoozeSheetsApi:
                 logger.warning(f"Carrier not found for carrier_id={carrier_id}")
                 return None
             raise
-        logger.debug(f"Carrier info retrieved: {carrier_info}")
+        logger.debug("Carrier info retrieved: {}", carrier_info)
 
         return BoozeCarrier(carrier_info)
 
@@ -372,7 +399,7 @@ class BoozeSheetsApi:
         logger.debug("Getting info for all carriers")
         endpoint = "/carriers"
 
-        logger.debug(f"Sending GET request to {endpoint}")
+        logger.debug("Sending GET request to {}", endpoint)
         try:
             carriers_info = await self._request("GET", endpoint)
         except httpx.HTTPStatusError as e:
@@ -380,7 +407,7 @@ class BoozeSheetsApi:
                 logger.warning("No carriers found")
                 return []
             raise
-        logger.debug(f"All carriers info retrieved: {carriers_info}")
+        logger.debug("All carriers info retrieved: {}", carriers_info)
 
         return [BoozeCarrier(info) for info in carriers_info]
 
@@ -393,12 +420,12 @@ class BoozeSheetsApi:
         :return: The updated carrier information as a dictionary.
         """
 
-        logger.debug(f"Updating carrier info for carrier_id={carrier_id}")
+        logger.debug("Updating carrier info for carrier_id={}", carrier_id)
         endpoint = f"/carriers/{carrier_id}/admin"
 
         updated_carrier_info = await self._request("PATCH", endpoint, update_data, PayloadType.BODY)
 
-        logger.debug(f"Carrier info updated: {updated_carrier_info}")
+        logger.debug("Carrier info updated: {}", updated_carrier_info)
         return BoozeCarrier(updated_carrier_info)
 
     async def start_carrier_unload(self, carrier_id: str, delay: int | None = None) -> BoozeCarrier:
@@ -410,16 +437,16 @@ class BoozeSheetsApi:
         :return: The updated carrier information as a dictionary.
         """
 
-        logger.debug(f"Starting unload for carrier_id={carrier_id}, delay={delay}")
+        logger.debug("Starting unload for carrier_id={}, delay={}", carrier_id, delay)
         endpoint = f"/carriers/{carrier_id}/unload"
 
         data: dict[str, str | int] = {"unloading": "true"}
         if delay is not None:
             data["delay"] = delay
 
-        logger.debug(f"Sending POST request to {endpoint} with data={data}")
+        logger.debug("Sending POST request to {} with data={}", endpoint, data)
         updated_carrier = await self._request("POST", endpoint, data, PayloadType.QUERY)
-        logger.debug(f"Carrier unload started: {updated_carrier}")
+        logger.debug("Carrier unload started: {}", updated_carrier)
 
         return BoozeCarrier(updated_carrier)
 
@@ -431,13 +458,13 @@ class BoozeSheetsApi:
         :return: The updated carrier information as a dictionary.
         """
 
-        logger.debug(f"Completing unload for carrier_id={carrier_id}")
+        logger.debug("Completing unload for carrier_id={}", carrier_id)
         endpoint = f"/carriers/{carrier_id}/unload"
 
         data = {"unloading": "false"}
-        logger.debug(f"Sending POST request to {endpoint} with data={data}")
+        logger.debug("Sending POST request to {} with data={}", endpoint, data)
         updated_carrier = await self._request("POST", endpoint, data, PayloadType.QUERY)
-        logger.debug(f"Carrier unload completed: {updated_carrier}")
+        logger.debug("Carrier unload completed: {}", updated_carrier)
 
         return BoozeCarrier(updated_carrier)
 
@@ -452,9 +479,9 @@ class BoozeSheetsApi:
         endpoint = "/carriers"
         data = {"wine_status": "Full"}
 
-        logger.debug(f"Sending GET request to {endpoint} with data={data}")
+        logger.debug("Sending GET request to {} with data={}", endpoint, data)
         carriers_info = await self._request("GET", endpoint, data, PayloadType.QUERY)
-        logger.debug(f"All carriers info retrieved: {carriers_info}")
+        logger.debug("All carriers info retrieved: {}", carriers_info)
 
         return [BoozeCarrier(info) for info in carriers_info]
 
@@ -469,9 +496,9 @@ class BoozeSheetsApi:
         endpoint = "/carriers"
         data = {"wine_status": ["Unloading"]}
 
-        logger.debug(f"Sending GET request to {endpoint} with data={data}")
+        logger.debug("Sending GET request to {} with data={}", endpoint, data)
         carriers_info = await self._request("GET", endpoint, data, PayloadType.QUERY)
-        logger.debug(f"All carriers info retrieved: {carriers_info}")
+        logger.debug("All carriers info retrieved: {}", carriers_info)
 
         return [BoozeCarrier(info) for info in carriers_info]
 
@@ -485,7 +512,7 @@ class BoozeSheetsApi:
         logger.debug("Getting list of all cruises")
         endpoint = "/cruises"
 
-        logger.debug(f"Sending GET request to {endpoint}")
+        logger.debug("Sending GET request to {}", endpoint)
         try:
             cruises = await self._request("GET", endpoint)
         except httpx.HTTPStatusError as e:
@@ -493,7 +520,7 @@ class BoozeSheetsApi:
                 logger.warning("No cruises found")
                 return []
             raise
-        logger.debug(f"Cruises list retrieved: {cruises}")
+        logger.debug("Cruises list retrieved: {}", cruises)
         return cruises
 
     async def get_current_cruise_state(self) -> CruiseState:
@@ -506,23 +533,65 @@ class BoozeSheetsApi:
         logger.debug("Getting current cruise state")
         endpoint = "/cruises/state"
 
-        logger.debug(f"Sending GET request to {endpoint}")
+        logger.debug("Sending GET request to {}", endpoint)
         try:
             state_data: dict[str, str] = await self._request("GET", endpoint)
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to get current cruise state: {e}")
             raise
 
-        logger.debug(f"Current cruise state from backend: {state_data}")
+        logger.debug("Current cruise state from backend: {}", state_data)
 
         if "state" not in state_data or "updatedAt" not in state_data:
             logger.error(f"Invalid cruise state response format: {state_data}")
             raise KeyError("Missing 'state' or 'updatedAt' in cruise state response")
 
-        return {
+        cruise_state: CruiseState = {
             "state": CruiseSystemState(state_data["state"]),
             "updated_at": datetime.fromisoformat(state_data["updatedAt"]),
         }
+        self.cruise_state_cache = cruise_state
+        self._cruise_state_cached_at = datetime.now(tz=UTC)
+        return cruise_state
+
+    async def get_cached_cruise_state(self) -> CruiseState:
+        """
+        Returns the last fetched cruise state, fetching it again if it is older than CRUISE_STATE_CACHE_TTL.
+
+        :return: The current cruise state.
+        """
+        if (
+            self.cruise_state_cache is not None
+            and self._cruise_state_cached_at is not None
+            and datetime.now(tz=UTC) - self._cruise_state_cached_at < CRUISE_STATE_CACHE_TTL
+        ):
+            logger.debug("Using cached cruise state: {}", self.cruise_state_cache)
+            return self.cruise_state_cache
+
+        return await self.get_current_cruise_state()
+
+    async def cross_check_cruise_aggregate(self) -> Cruise | None:
+        """
+        Fetches the current cruise stats and cross-checks the local cruise aggregate against them.
+
+        :return: The current cruise as returned by the backend, or None if there is no current cruise.
+        """
+        cruise = await self.get_cruise_with_stats(0)
+        if cruise is None:
+            return None
+
+        async with self.carrier_cache_lock:
+            self.cruise_aggregator.cross_check(cruise, list(self.carrier_cache.values()))
+        CRUISE_AGGREGATE_TRUSTED.set(int(self.cruise_aggregator.trusted))
+        return cruise
+
+    def has_open_unloads(self) -> bool:
+        """
+        Checks the carrier cache for any carrier that is currently unloading.
+
+        :return: True if any cached carrier is unloading.
+        """
+        return any(carrier.wine_status == "Unloading" for carrier in self.carrier_cache.values())
 
     async def get_cruise_with_stats(
         self, cruise_id: int, include_not_unloaded: bool | None = None, exclude_staff: bool | None = None
@@ -537,7 +606,10 @@ class BoozeSheetsApi:
         """
 
         logger.debug(
-            f"Getting cruise stats for cruise_id={cruise_id}, include_not_unloaded={include_not_unloaded}, exclude_staff={exclude_staff}"
+            "Getting cruise stats for cruise_id={}, include_not_unloaded={}, exclude_staff={}",
+            cruise_id,
+            include_not_unloaded,
+            exclude_staff,
         )
 
         stats_endpoint = f"/cruises/{cruise_id}"
@@ -548,7 +620,7 @@ class BoozeSheetsApi:
         if exclude_staff:
             data["exclude_staff"] = exclude_staff
 
-        logger.debug(f"Sending GET request to {stats_endpoint} with data={data}")
+        logger.debug("Sending GET request to {} with data={}", stats_endpoint, data)
         try:
             cruise_data = await self._request("GET", stats_endpoint, data, PayloadType.QUERY)
         except httpx.HTTPStatusError as e:
@@ -556,7 +628,7 @@ class BoozeSheetsApi:
                 logger.warning(f"Cruise stats not found for cruise_id={cruise_id}")
                 return None
             raise
-        logger.debug(f"Cruise stats retrieved: {cruise_data}")
+        logger.debug("Cruise stats retrieved: {}", cruise_data)
 
         return Cruise(cruise_data)
 
@@ -571,7 +643,7 @@ class BoozeSheetsApi:
         endpoint = "/cruises/biggest_cruise"
         data = {"include_not_unloaded": include_not_unloaded} if include_not_unloaded is not None else {}
 
-        logger.debug(f"Sending GET request to {endpoint} with data={data}")
+        logger.debug("Sending GET request to {} with data={}", endpoint, data)
         try:
             cruise_data = await self._request("GET", endpoint, data, PayloadType.QUERY)
         except httpx.HTTPStatusError as e:
@@ -579,7 +651,7 @@ class BoozeSheetsApi:
                 logger.warning("Biggest cruise stats not found")
                 return None
             raise
-        logger.debug(f"Biggest cruise stats retrieved: {cruise_data}")
+        logger.debug("Biggest cruise stats retrieved: {}", cruise_data)
 
         return Cruise(cruise_data)
 
@@ -592,10 +664,10 @@ class BoozeSheetsApi:
         :return: The trip data.
         """
 
-        logger.debug(f"Getting trip for carrier_id={carrier_id}, trip_id={trip_id}")
+        logger.debug("Getting trip for carrier_id={}, trip_id={}", carrier_id, trip_id)
         endpoint = f"/carriers/by-callsign/{carrier_id}/{trip_id}"
 
-        logger.debug(f"Sending GET request to {endpoint}")
+        logger.debug("Sending GET request to {}", endpoint)
         try:
             trip_data = await self._request("GET", endpoint)
         except httpx.HTTPStatusError as e:
@@ -603,7 +675,7 @@ class BoozeSheetsApi:
                 logger.warning(f"Trip not found for carrier_id={carrier_id}, trip_id={trip_id}")
                 return None
             raise
-        logger.debug(f"Trip data retrieved: {trip_data}")
+        logger.debug("Trip data retrieved: {}", trip_data)
 
         return BoozeCarrier(trip_data)
 
@@ -615,12 +687,12 @@ class BoozeSheetsApi:
         :return: The carrier stats.
         """
 
-        logger.debug(f"Getting carrier stats for carrier_id={carrier_id}")
+        logger.debug("Getting carrier stats for carrier_id={}", carrier_id)
         endpoint = f"/carriers/by-callsign/{carrier_id}/stats"
 
         data = {"include_not_unloaded": include_not_unloaded} if include_not_unloaded is not None else {}
 
-        logger.debug(f"Sending GET request to {endpoint}")
+        logger.debug("Sending GET request to {}", endpoint)
         try:
             stats_data = await self._request("GET", endpoint, data, PayloadType.QUERY)
         except httpx.HTTPStatusError as e:
@@ -628,7 +700,7 @@ class BoozeSheetsApi:
                 logger.warning(f"Carrier stats not found for carrier_id={carrier_id}")
                 return None
             raise
-        logger.debug(f"Carrier stats retrieved: {stats_data}")
+        logger.debug("Carrier stats retrieved: {}", stats_data)
 
         return CarrierStats(stats_data)
 
@@ -643,9 +715,9 @@ class BoozeSheetsApi:
         endpoint = "/carriers"
         data = {"owner_pinged": False, "pending": True}
 
-        logger.debug(f"Sending GET request to {endpoint} with data={data}")
+        logger.debug("Sending GET request to {} with data={}", endpoint, data)
         carriers_info = await self._request("GET", endpoint, data, PayloadType.QUERY)
-        logger.debug(f"Unpinged signups info retrieved: {carriers_info}")
+        logger.debug("Unpinged signups info retrieved: {}", carriers_info)
         return [BoozeCarrier(info) for info in carriers_info]
 
     async def set_user_pinged(self, user_id: int) -> None:
@@ -655,15 +727,15 @@ class BoozeSheetsApi:
         :param user_id: The Discord ID of the user to set as pinged.
         """
 
-        logger.debug(f"Setting user_id={user_id} as pinged")
+        logger.debug("Setting user_id={} as pinged", user_id)
         endpoint = f"/users/{user_id}/pinged"
 
-        logger.debug(f"Sending POST request to {endpoint}")
+        logger.debug("Sending POST request to {}", endpoint)
         try:
             await self._request("POST", endpoint)
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to set user_id={user_id} as pinged: {e}")
-        logger.debug(f"User_id={user_id} set as pinged")
+        logger.debug("User_id={} set as pinged", user_id)
 
     async def get_all_time_stats(self) -> CruiseStats | None:
         """
@@ -675,13 +747,13 @@ class BoozeSheetsApi:
         logger.debug("Getting all-time stats")
         endpoint = "/cruises/all_time"
 
-        logger.debug(f"Sending GET request to {endpoint}")
+        logger.debug("Sending GET request to {}", endpoint)
         try:
             stats_data = await self._request("GET", endpoint)
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to get all-time stats: {e}")
             return None
-        logger.debug(f"All-time stats retrieved: {stats_data}")
+        logger.debug("All-time stats retrieved: {}", stats_data)
 
         return CruiseStats(stats_data)
 
@@ -692,12 +764,14 @@ class BoozeSheetsApi:
         :param state: The new cruise state.
         """
 
-        logger.debug(f"Updating cruise state to {state}")
+        logger.debug("Updating cruise state to {}", state)
         endpoint = "/cruises/state"
         data = {"state": state}
 
         await self._request("PATCH", endpoint, data, PayloadType.BODY)
-        logger.debug(f"Cruise state updated to {state}")
+        self.cruise_state_cache = {"state": CruiseSystemState(state), "updated_at": datetime.now(tz=UTC)}
+        self._cruise_state_cached_at = datetime.now(tz=UTC)
+        logger.debug("Cruise state updated to {}", state)
 
     async def set_refresh_discord_data(self, user: User):
         """
@@ -706,17 +780,17 @@ class BoozeSheetsApi:
         :param user: The Discord user to set the flag for.
         """
 
-        logger.debug(f"Setting refresh_discord_data for user_id={user.id}")
+        logger.debug("Setting refresh_discord_data for user_id={}", user.id)
         endpoint = "/users/force-refresh"
 
         data = {"discord_id": str(user.id)}
 
-        logger.debug(f"Sending POST request to {endpoint} with data={data}")
+        logger.debug("Sending POST request to {} with data={}", endpoint, data)
         try:
             await self._request("POST", endpoint, data, PayloadType.QUERY)
         except httpx.HTTPStatusError as e:
             logger.error(f"Failed to set refresh_discord_data for user_id={user.id}: {e}")
-        logger.debug(f"refresh_discord_data set for user_id={user.id}")
+        logger.debug("refresh_discord_data set for user_id={}", user.id)
 
     async def update_cruise_start(self, cruise_start: datetime):
         """
@@ -734,7 +808,7 @@ class BoozeSheetsApi:
             logger.error(f"Failed to get current cruise state before updating cruise start: {e}")
             raise RuntimeError("Cannot update cruise start without knowing current cruise state") from e
 
-        logger.debug(f"Current cruise state is {state}")
+        logger.debug("Current cruise state is {}", state)
         if state in [CruiseSystemState.PREP, CruiseSystemState.ACTIVE]:
             logger.info(f"Updating current cruise start to {cruise_start}")
             await self._request("PATCH", endpoint, data, PayloadType.BODY)
@@ -758,7 +832,7 @@ class BoozeSheetsApi:
             logger.error(f"Failed to get current cruise state before updating cruise end: {e}")
             raise RuntimeError("Cannot update cruise end without knowing current cruise state") from e
 
-        logger.debug(f"Current cruise state is {state}")
+        logger.debug("Current cruise state is {}", state)
         if state == CruiseSystemState.ACTIVE:
             logger.info(f"Updating current cruise end to {cruise_end}")
             await self._request("PATCH", endpoint, data, PayloadType.BODY)
@@ -848,7 +922,7 @@ class BoozeSheetsApi:
             self._reconnect_delay = 5
 
             async for message in self._ws_connection:
-                logger.trace(f"Websocket message received: {message}")
+                logger.trace("Websocket message received: {}", message)
 
                 if not self._ws_running:
                     break
@@ -873,7 +947,7 @@ class BoozeSheetsApi:
                 logger.warning(f"Received message without event type: {data}")
                 return
 
-            logger.debug(f"Received websocket event: {event_type}")
+            logger.debug("Received websocket event: {}", event_type)
 
             try:
                 await self._carrier_cache_ws_update(event_type, data)
@@ -885,7 +959,7 @@ class BoozeSheetsApi:
 
             if self.bot:
                 self.bot.dispatch(event_name, data)
-                logger.debug(f"Dispatched event: on_{event_name}")
+                logger.debug("Dispatched event: on_{}", event_name)
 
         except json.JSONDecodeError as e:
             logger.error(f"Failed to decode websocket message: {e}")
@@ -907,7 +981,7 @@ class BoozeSheetsApi:
 
         :return: A tuple containing poll status, last refresh timestamp, and cache size.
         """
-        status = "Running" if self._carrier_poll_running else "Stopped"
+        status = "Running" if self.carrier_poll.is_running() else "Stopped"
         return status, self._carrier_cache_last_refresh, len(self.carrier_cache)
 
     async def send_action_ack(self, action_id: str, success: bool = True, error: str | None = None) -> None:
@@ -927,7 +1001,7 @@ class BoozeSheetsApi:
         payload = json.dumps({"type": "action_ack", "actionId": action_id, "success": success, "error": error})
         try:
             await self._ws_connection.send(payload)
-            logger.debug(f"Sent action_ack: action_id={action_id}, success={success}")
+            logger.debug("Sent action_ack: action_id={}, success={}", action_id, success)
         except Exception as e:
             logger.error(f"Failed to send action_ack for action_id={action_id}: {e}")
 
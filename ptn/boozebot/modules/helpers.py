@@ -1,14 +1,10 @@
 """
 A module for helper functions called by other modules.
 
-Depends on: constants, ErrorHandler, database
+Depends on: constants, ErrorHandler, database, Startup
 """
 
-import functools
-from collections.abc import Callable
 from datetime import UTC, datetime
-from types import CoroutineType
-from typing import Any
 
 import discord
 import isodate
@@ -27,7 +23,8 @@ from ptn_utils.global_constants import (
 from ptn_utils.logger.logger import get_logger
 
 from ptn.boozebot.constants import bot
-from ptn.boozebot.modules.ErrorHandler import CommandChannelError, CommandRoleError
+from ptn.boozebot.modules.ErrorHandler import CacheNotReadyError, CommandChannelError, CommandRoleError
+from ptn.boozebot.modules.Startup import startup
 
 logger = get_logger("boozebot.modules.helpers")
 
@@ -37,13 +34,13 @@ async def checkroles_actual(interaction: discord.Interaction, permitted_role_ids
     Check if the user has at least one of the permitted roles to run a command
     """
     try:
-        logger.debug(f"checkroles_actual called for user {interaction.user} ({interaction.user.id})")
+        logger.debug("checkroles_actual called for user {} ({})", interaction.user, interaction.user.id)
         author_roles = interaction.user.roles
         permitted_roles = [await bot.get_or_fetch.role(role) for role in permitted_role_ids]
-        logger.debug(f"Author roles: {[role.name for role in author_roles]}")
-        logger.debug(f"Permitted roles: {[role.name for role in permitted_roles if role]}")
+        logger.opt(lazy=True).debug("Author roles: {}", lambda: [role.name for role in author_roles])
+        logger.opt(lazy=True).debug("Permitted roles: {}", lambda: [role.name for role in permitted_roles if role])
         permission = any(x in permitted_roles for x in author_roles)
-        logger.debug(f"Permission granted: {permission}")
+        logger.debug("Permission granted: {}", permission)
         return permission, permitted_roles
     except Exception as e:
         logger.exception(f"Error in checkroles_actual: {e}")
@@ -55,7 +52,7 @@ def check_roles(permitted_role_ids: list[int]):
         interaction: discord.Interaction,
     ):
         permission, permitted_roles = await checkroles_actual(interaction, permitted_role_ids)
-        logger.debug(f"Permission result from checkroles_actual: {permission}")
+        logger.debug("Permission result from checkroles_actual: {}", permission)
         formatted_role_list = ""
         if not permission:
             role_list = []
@@ -68,7 +65,7 @@ def check_roles(permitted_role_ids: list[int]):
             try:
                 raise CommandRoleError(permitted_roles, formatted_role_list)
             except CommandRoleError as e:
-                logger.debug(f"CommandRoleError raised: {e}")
+                logger.debug("CommandRoleError raised: {}", e)
                 raise
         logger.info(f"User {interaction.user} ({interaction.user.id}) has required role permissions.")
         return permission
@@ -86,7 +83,7 @@ def check_command_channel(permitted_channel: int | list[int]):
         """
         Check if the channel the command was run from matches any permitted channels for that command
         """
-        logger.debug(f"check_command_channel called for channel {ctx.channel.name} ({ctx.channel.id})")
+        logger.debug("check_command_channel called for channel {} ({})", ctx.channel.name, ctx.channel.id)
         if isinstance(permitted_channel, list):
             permitted_channels = [await bot.get_or_fetch.channel(chan_id) for chan_id in permitted_channel]
         else:
@@ -95,7 +92,7 @@ def check_command_channel(permitted_channel: int | list[int]):
         channel_list = [f"<#{channel.id}>" for channel in permitted_channels]
         formatted_channel_list = " • ".join(channel_list)
 
-        logger.debug(f"Permitted channels: {[ch.name for ch in permitted_channels if ch]}")
+        logger.opt(lazy=True).debug("Permitted channels: {}", lambda: [ch.name for ch in permitted_channels if ch])
 
         permission = any(channel == ctx.channel for channel in permitted_channels)
         if not permission:
@@ -106,7 +103,7 @@ def check_command_channel(permitted_channel: int | list[int]):
             try:
                 raise CommandChannelError(permitted_channel, formatted_channel_list)
             except CommandChannelError as e:
-                logger.debug(f"CommandChannelError raised: {e}")
+                logger.debug("CommandChannelError raised: {}", e)
                 raise
         else:
             logger.info(f"Command run in permitted channel: {ctx.channel.name}")
@@ -115,6 +112,22 @@ def check_command_channel(permitted_channel: int | list[int]):
     return app_commands.check(check_channel)
 
 
+# decorator for interaction cache readiness checks
+def check_cache_ready(*caches: str):
+    """
+    Decorator used on an interaction to hold it off until the caches it reads have been warmed at startup
+    """
+
+    async def check_ready(interaction: discord.Interaction):
+        cold = [cache for cache in caches if not startup.is_warm(cache)]
+        if cold:
+            logger.info(f"Command from {interaction.user} held off, cache(s) still warming up: {cold}")
+            raise CacheNotReadyError(cold)
+        return True
+
+    return app_commands.check(check_ready)
+
+
 # decorator for text command channel checks
 def check_text_command_channel(permitted_channel: list[int]):
     """
@@ -125,9 +138,9 @@ def check_text_command_channel(permitted_channel: list[int]):
         """
         Check if the channel the command was run in, matches the channel it can only be run from
         """
-        logger.debug(f"check_text_command_channel called for channel {ctx.channel.name} ({ctx.channel.id})")
+        logger.debug("check_text_command_channel called for channel {} ({})", ctx.channel.name, ctx.channel.id)
         permitted = await bot.get_or_fetch.channel(permitted_channel)
-        logger.debug(f"Permitted channel: {permitted.name if permitted else 'None'} ({permitted_channel})")
+        logger.debug("Permitted channel: {} ({})", permitted.name if permitted else "None", permitted_channel)
 
         if ctx.channel != permitted:
             # problem, wrong channel, no progress
@@ -155,7 +168,7 @@ async def bc_channel_status():
         bc_chat_channel = await bot.get_or_fetch.channel(CHANNEL_BC_BOOZE_CRUISE_CHAT)
         pilot_role = await bot.get_or_fetch.role(ROLE_PILOT)
 
-        logger.debug(f"Fetched bc_chat_channel and pilot_role. {bc_chat_channel}, {pilot_role}")
+        logger.debug("Fetched bc_chat_channel and pilot_role. {}, {}", bc_chat_channel, pilot_role)
 
         if bc_chat_channel.permissions_for(pilot_role).view_channel:
             logger.info("Booze Cruise channel is open to pilots.")
@@ -168,25 +181,6 @@ async def bc_channel_status():
         return False
 
 
-# Decorator to track the last run time of a task
-def track_last_run():
-    def decorator(coro: Callable[..., CoroutineType[Any, Any, None]]):
-        logger.debug(f"Applying track_last_run decorator to {coro.__name__}")
-
-        @functools.wraps(coro)
-        async def wrapper(self: Any, *args: Any, **kwargs: Any):
-            logger.debug(f"Executing wrapped coroutine {coro.__name__}")
-            result = await coro(self, *args, **kwargs)
-            loop = getattr(self, coro.__name__)
-            loop.last_run_time = datetime.now(UTC)
-            logger.debug(f"Updated last_run_time for {coro.__name__} to {loop.last_run_time}")
-            return result
-
-        return wrapper
-
-    return decorator
-
-
 def is_staff(user: discord.Member) -> bool:
     """
     Check if a user is wine staff based on their roles.
@@ -195,7 +189,7 @@ def is_staff(user: discord.Member) -> bool:
     :returns: True if the user is wine staff, False otherwise.
     """
 
-    logger.debug(f"Checking if user {user} ({user.id}) is wine staff.")
+    logger.debug("Checking if user {} ({}) is wine staff.", user, user.id)
     staff_roles = {
         ROLE_SOMM,
         ROLE_CONN,
@@ -204,7 +198,7 @@ def is_staff(user: discord.Member) -> bool:
     }
 
     is_wine_staff = any(role.id in staff_roles for role in user.roles)
-    logger.debug(f"User {user} wine staff status: {is_wine_staff}")
+    logger.debug("User {} wine staff status: {}", user, is_wine_staff)
     return is_wine_staff
 
 
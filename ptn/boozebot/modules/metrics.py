@@ -0,0 +1,113 @@
+"""
+Prometheus metrics shared across BoozeBot.
+
+Metrics are registered on the default prometheus_client registry, which is the one exported by the
+PrometheusCog added in application.boozebot.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Database backups
+DB_BACKUP_DURATION = Histogram(
+    "boozebot_db_backup_duration_seconds",
+    "Time taken to take an online backup of the booze database.",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+DB_BACKUP_SIZE = Gauge("boozebot_db_backup_size_bytes", "Compressed size of the most recent database backup.")
+DB_BACKUP_LAST_SUCCESS = Gauge(
+    "boozebot_db_backup_last_success_timestamp_seconds", "Unix timestamp of the most recent successful backup."
+)
+
+# SQL profiling, only populated when BOOZEBOT_SQL_PROFILE is enabled
+SQL_STATEMENT_DURATION = Histogram(
+    "boozebot_sql_statement_duration_seconds",
+    "Execution time of SQL statements, grouped by normalised statement shape.",
+    labelnames=("statement",),
+    buckets=(0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5),
+)
+
+# Unload reaction handling
+UNLOAD_REACTION_EVENTS = Counter(
+    "boozebot_unload_reaction_events_total", "Reaction add/remove events received on the unloading channel."
+)
+UNLOAD_REACTION_EVALUATIONS = Counter(
+    "boozebot_unload_reaction_evaluations_total", "Debounced evaluations of reactions on unloading channel messages."
+)
+UNLOAD_REACTION_REST_CALLS_SAVED = Counter(
+    "boozebot_unload_reaction_rest_calls_saved_total",
+    "Message fetches avoided by counting and coalescing unload reactions locally.",
+)
+UNLOAD_LOCK_WAIT = Histogram(
+    "boozebot_unload_lock_wait_seconds",
+    "Time spent waiting to acquire unload locks, by lock scope.",
+    labelnames=("scope",),
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10),
+)
+
+# Outbound Discord send queue
+SEND_QUEUE_WAIT = Histogram(
+    "boozebot_send_queue_wait_seconds",
+    "Time outbound messages spent queued before being sent, by priority.",
+    labelnames=("priority",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30),
+)
+SEND_QUEUE_DROPPED = Counter(
+    "boozebot_send_queue_dropped_total",
+    "Outbound messages dropped under rate limit pressure.",
+    labelnames=("priority",),
+)
+SEND_QUEUE_COALESCED = Counter(
+    "boozebot_send_queue_coalesced_total", "Message edits merged into an already queued edit of the same message."
+)
+
+# Local cruise aggregate
+CRUISE_AGGREGATE_TRUSTED = Gauge(
+    "boozebot_cruise_aggregate_trusted", "1 if the local cruise aggregate matched the backend at the last cross-check."
+)
+
+# Batched channel permission updates
+PERMISSION_BATCH_DURATION = Histogram(
+    "boozebot_permission_batch_duration_seconds",
+    "Wall time taken to apply a batch of channel permission updates, by scope.",
+    labelnames=("scope",),
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+
+# Auto response regex sandbox
+REGEX_SANDBOX_TIMEOUTS = Counter(
+    "boozebot_regex_sandbox_timeouts_total", "Auto response regex searches killed for overrunning their time budget."
+)
+
+# Queued log output
+LOG_RECORDS_DROPPED = Counter(
+    "boozebot_log_records_dropped_total", "Log records dropped because the background log writer fell behind."
+)
+
+# Staged startup
+STARTUP_STAGE_DURATION = Gauge(
+    "boozebot_startup_stage_duration_seconds",
+    "Wall time of each startup stage at the last start.",
+    labelnames=("stage",),
+)
+STARTUP_TIME_TO_READY = Gauge(
+    "boozebot_startup_time_to_ready_seconds", "Time from startup until the caches were warm and the tasks started."
+)
+
+# Background job scheduler
+SCHEDULER_JOB_DURATION = Histogram(
+    "boozebot_scheduler_job_duration_seconds",
+    "Run time of scheduled background jobs, by job.",
+    labelnames=("job",),
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+SCHEDULER_JOB_LAG = Histogram(
+    "boozebot_scheduler_job_lag_seconds",
+    "Time scheduled background jobs started after they were due, by job.",
+    labelnames=("job",),
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+SCHEDULER_JOB_OVERLAPS = Counter(
+    "boozebot_scheduler_job_overlaps_total",
+    "Scheduled runs skipped because the job's previous run had not finished, by job.",
+    labelnames=("job",),
+)
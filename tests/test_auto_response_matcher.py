@@ -0,0 +1,169 @@
+import random
+import re
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import discord
+from ptn_utils.global_constants import ROLE_SOMM
+
+from ptn.boozebot.classes import AutoResponseMatcher as matcher_module
+from ptn.boozebot.classes.AutoResponse import AutoResponse
+from ptn.boozebot.classes.AutoResponseMatcher import AutoResponseMatcher, LiteralAutomaton
+from ptn.boozebot.modules.RegexSandbox import RegexJob, SandboxResult
+
+CHANNEL_ID = 100
+OTHER_CHANNEL_ID = 200
+
+
+class FakeSandbox:
+    """Searches in process, recording the patterns searched and overrunning on the patterns marked slow."""
+
+    def __init__(self, slow: set[str] | None = None):
+        self.slow = slow or set()
+        self.searched: list[str] = []
+
+    async def run(self, jobs: list[RegexJob], _budget: float = 0.0) -> SandboxResult:
+        matches = []
+        for index, (pattern, text) in enumerate(jobs):
+            self.searched.append(pattern)
+            if pattern in self.slow:
+                return SandboxResult(matches, index)
+            matches.append(re.search(pattern, text) is not None)
+        return SandboxResult(matches)
+
+
+def make_response(name: str, trigger: str, is_regex: bool = False, disabled: bool = False) -> AutoResponse:
+    return AutoResponse(
+        {"name": name, "trigger": trigger, "response": f"{name} response", "is_regex": is_regex, "disabled": disabled}
+    )
+
+
+def make_message(content: str, *, staff: bool = False, member: bool = True, channel_id: int = CHANNEL_ID):
+    author = mock.Mock(spec=discord.Member if member else discord.User)
+    author.roles = [SimpleNamespace(id=ROLE_SOMM)] if staff else [SimpleNamespace(id=0)]
+    return SimpleNamespace(content=content, channel=SimpleNamespace(id=channel_id), author=author)
+
+
+class LiteralAutomatonTests(unittest.TestCase):
+    def test_finds_overlapping_patterns(self):
+        automaton = LiteralAutomaton(["he", "she", "his", "hers"])
+        self.assertEqual(automaton.find("ushers"), {0, 1, 3})
+        self.assertEqual(automaton.find("this"), {2})
+        self.assertEqual(automaton.find("nothing"), set())
+
+    def test_empty_pattern_always_found(self):
+        self.assertEqual(LiteralAutomaton(["", "ab"]).find("xyz"), {0})
+
+    def test_matches_substring_search(self):
+        rng = random.Random(44)
+        for _ in range(200):
+            patterns = ["".join(rng.choices("abc", k=rng.randint(1, 4))) for _ in range(rng.randint(1, 8))]
+            text = "".join(rng.choices("abc", k=rng.randint(0, 30)))
+            expected = {index for index, pattern in enumerate(patterns) if pattern in text}
+            self.assertEqual(LiteralAutomaton(patterns).find(text), expected, (patterns, text))
+
+
+class AutoResponseMatcherTests(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.sandbox = FakeSandbox()
+        patcher = mock.patch.object(matcher_module, "regex_sandbox", self.sandbox)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def match(self, responses: list[AutoResponse], content: str, **kwargs: bool) -> AutoResponse | None:
+        return (await AutoResponseMatcher(responses).match(make_message(content, **kwargs))).auto_response
+
+    async def test_literal_trigger_ignores_case(self):
+        responses = [make_response("wine", "Wine Time")]
+        self.assertIs(await self.match(responses, "is it WINE TIME yet?"), responses[0])
+        self.assertIsNone(await self.match(responses, "is it beer time?"))
+
+    async def test_first_match_in_list_order_wins(self):
+        responses = [make_response("first", "boat"), make_response("second", "booze")]
+        self.assertIs(await self.match(responses, "booze boat"), responses[0])
+
+    async def test_earlier_regex_beats_later_literal(self):
+        responses = [make_response("regex", r"bo+ze", is_regex=True), make_response("literal", "boat")]
+        self.assertIs(await self.match(responses, "boat full of booooze"), responses[0])
+
+    async def test_regex_after_literal_match_is_not_searched(self):
+        responses = [make_response("literal", "boat"), make_response("regex", r"bo+ze", is_regex=True)]
+        self.assertIs(await self.match(responses, "boat full of booooze"), responses[0])
+        self.assertEqual(self.sandbox.searched, [])
+
+    async def test_response_on_cooldown_is_skipped(self):
+        responses = [make_response("first", "boat"), make_response("second", "booze")]
+        matcher = AutoResponseMatcher(responses)
+        self.assertIs((await matcher.match(make_message("booze boat"))).auto_response, responses[0])
+        self.assertIs((await matcher.match(make_message("booze boat"))).auto_response, responses[1])
+        self.assertIsNone((await matcher.match(make_message("booze boat"))).auto_response)
+        # Cooldowns are per channel
+        message = make_message("booze boat", channel_id=OTHER_CHANNEL_ID)
+        self.assertIs((await matcher.match(message)).auto_response, responses[0])
+
+    async def test_regex_on_cooldown_is_skipped(self):
+        responses = [make_response("regex", r"bo+ze", is_regex=True), make_response("literal", "booze")]
+        responses[0].start_cooldown(CHANNEL_ID)
+        self.assertIs(await self.match(responses, "booze"), responses[1])
+        self.assertEqual(self.sandbox.searched, [])
+
+    async def test_staff_only_match_commands(self):
+        responses = [make_response("booze", "booze"), make_response("regex", r"bo+ze", is_regex=True)]
+        self.assertIsNone(await self.match(responses, "booze", staff=True))
+        self.assertEqual(self.sandbox.searched, [])
+        self.assertIs(await self.match(responses, "!booze please", staff=True), responses[0])
+        self.assertIs(await self.match(responses, "!regex", staff=True), responses[1])
+
+    async def test_non_members_only_match_commands(self):
+        responses = [make_response("booze", "booze")]
+        self.assertIsNone(await self.match(responses, "booze", member=False))
+        self.assertIs(await self.match(responses, "!booze", member=False), responses[0])
+
+    async def test_empty_message(self):
+        self.assertIsNone(await self.match([make_response("any", "")], ""))
+
+    async def test_disabled_regex_is_not_searched(self):
+        responses = [make_response("regex", r"bo+ze", is_regex=True, disabled=True)]
+        self.assertIsNone(await self.match(responses, "booze"))
+        self.assertEqual(self.sandbox.searched, [])
+        # A disabled trigger can still be used by name
+        self.assertIs(await self.match(responses, "!regex"), responses[0])
+
+    def test_regexes_with_groups_or_flags_are_not_merged(self):
+        responses = [
+            make_response("plain", r"bo+ze", is_regex=True),
+            make_response("class", r"w[i1]ne", is_regex=True),
+            make_response("group", r"(rum)+", is_regex=True),
+            make_response("flag", r"(?i)grog", is_regex=True),
+            make_response("named", r"(?P<drink>ale)", is_regex=True),
+        ]
+        matcher = AutoResponseMatcher(responses)
+        self.assertEqual(matcher._merged_regex, r"(?:bo+ze)|(?:w[i1]ne)")
+        self.assertEqual([index for index, _ in matcher._separate_regexes], [2, 3, 4])
+
+    async def test_merged_regex_rules_out_mergeable_triggers(self):
+        responses = [make_response("booze", r"bo+ze", is_regex=True), make_response("wine", r"w[i1]ne", is_regex=True)]
+        matcher = AutoResponseMatcher(responses)
+        self.assertIsNone((await matcher.match(make_message("just water"))).auto_response)
+        self.assertEqual(self.sandbox.searched, [matcher._merged_regex])
+
+    async def test_merged_regex_match_finds_first_trigger(self):
+        responses = [make_response("booze", r"bo+ze", is_regex=True), make_response("wine", r"w[i1]ne", is_regex=True)]
+        matcher = AutoResponseMatcher(responses)
+        self.assertIs((await matcher.match(make_message("w1ne and booze"))).auto_response, responses[0])
+        self.assertEqual(self.sandbox.searched, [matcher._merged_regex, r"bo+ze", r"w[i1]ne"])
+
+    async def test_grouped_regex_matches(self):
+        responses = [make_response("rum", r"(rum)+", is_regex=True), make_response("booze", "booze")]
+        self.assertIs(await self.match(responses, "rumrum and booze"), responses[0])
+
+    async def test_timed_out_regex_is_reported(self):
+        responses = [
+            make_response("slow", r"(s|ss)+$", is_regex=True),
+            make_response("grog", r"(gr)og", is_regex=True),
+        ]
+        self.sandbox.slow = {r"(s|ss)+$"}
+        result = await AutoResponseMatcher(responses).match(make_message("grog"))
+        self.assertIs(result.auto_response, responses[1])
+        self.assertEqual(result.timed_out, [responses[0]])
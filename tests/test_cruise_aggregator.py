@@ -0,0 +1,238 @@
+import random
+import unittest
+from typing import Any
+
+from ptn.boozebot.classes.BoozeCarrier import BoozeCarrier
+from ptn.boozebot.classes.Cruise import Cruise, CruiseStats
+from ptn.boozebot.classes.CruiseAggregator import CruiseAggregator, StreamingStats
+
+CRUISE_ID = 7
+
+STAT_NAMES = (
+    "total_wine",
+    "total_trips",
+    "total_carriers",
+    "carriers_remaining",
+    "total_owners",
+    "wine_remaining",
+    "total_profit",
+    "avg_unload_dur",
+    "min_unload_dur",
+    "max_unload_dur",
+)
+
+
+def make_carrier(
+    callsign: str,
+    trip_id: int,
+    wine: int,
+    owner_id: int,
+    *,
+    cruise_id: int = CRUISE_ID,
+    unloaded_minutes: int | None = None,
+) -> BoozeCarrier:
+    info: dict[str, Any] = {
+        "fcId": hash((callsign, trip_id)) % 100000,
+        "fcData": {
+            "fcName": f"Carrier {callsign}",
+            "fcCallsign": callsign,
+            "owner": {"discordId": str(owner_id), "username": f"owner{owner_id}", "displayName": f"Owner {owner_id}"},
+        },
+        "cruiseId": cruise_id,
+        "tripId": trip_id,
+        "wineTotal": wine,
+    }
+    if unloaded_minutes is not None:
+        info["unloadClosed"] = "2026-01-01T12:00:00+00:00"
+        info["unloadDur"] = f"PT{unloaded_minutes}M"
+    return BoozeCarrier(info)
+
+
+def make_cruise(stats: CruiseStats, cruise_id: int = CRUISE_ID) -> Cruise:
+    cruise = Cruise({"cruiseId": cruise_id})
+    cruise.stats = stats
+    return cruise
+
+
+def stats_tuple(stats: CruiseStats) -> tuple[Any, ...]:
+    return tuple(getattr(stats, name) for name in STAT_NAMES)
+
+
+class StreamingStatsTests(unittest.TestCase):
+    def test_empty(self):
+        stats = StreamingStats()
+        self.assertIsNone(stats.mean)
+        self.assertIsNone(stats.min)
+        self.assertIsNone(stats.max)
+
+    def test_set_replace_and_remove(self):
+        stats = StreamingStats()
+        stats.set(("A", 1), 10.0)
+        stats.set(("B", 1), 30.0)
+        stats.set(("C", 1), 20.0)
+        self.assertEqual((len(stats), stats.mean, stats.min, stats.max), (3, 20.0, 10.0, 30.0))
+
+        stats.set(("B", 1), 25.0)
+        self.assertEqual((len(stats), stats.mean, stats.max), (3, 55.0 / 3, 25.0))
+
+        stats.remove(("A", 1))
+        self.assertEqual((stats.mean, stats.min, stats.max), (22.5, 20.0, 25.0))
+
+        stats.set(("C", 1), None)
+        self.assertEqual((len(stats), stats.mean, stats.min, stats.max), (1, 25.0, 25.0, 25.0))
+
+    def test_remove_unknown_key(self):
+        stats = StreamingStats()
+        stats.set(("A", 1), 10.0)
+        stats.remove(("B", 1))
+        self.assertEqual((len(stats), stats.min, stats.max), (1, 10.0, 10.0))
+
+
+class CruiseAggregatorTests(unittest.TestCase):
+    def setUp(self):
+        self.aggregator = CruiseAggregator()
+        self.aggregator.cruise_id = CRUISE_ID
+
+    def rebuilt_from(self, carriers: list[BoozeCarrier]) -> CruiseAggregator:
+        rebuilt = CruiseAggregator()
+        rebuilt.cruise_id = CRUISE_ID
+        rebuilt.rebuild(carriers)
+        return rebuilt
+
+    def test_update_counts_trips(self):
+        self.aggregator.update(make_carrier("AAA-001", 1, 20000, 1))
+        self.aggregator.update(make_carrier("AAA-001", 2, 15000, 1, unloaded_minutes=10))
+        self.aggregator.update(make_carrier("BBB-002", 1, 10000, 2))
+        stats = self.aggregator.to_stats()
+        self.assertEqual(stats.total_wine, 45000)
+        self.assertEqual(stats.total_trips, 3)
+        self.assertEqual(stats.total_carriers, 2)
+        self.assertEqual(stats.total_owners, 2)
+        self.assertEqual(stats.carriers_remaining, 2)
+        self.assertEqual(stats.wine_remaining, 30000)
+        self.assertEqual(stats.avg_unload_dur, 600.0)
+
+    def test_update_ignores_other_cruises(self):
+        self.aggregator.update(make_carrier("AAA-001", 1, 20000, 1, cruise_id=CRUISE_ID - 1))
+        self.assertEqual(self.aggregator.to_stats().total_trips, 0)
+
+    def test_update_replaces_trip(self):
+        self.aggregator.update(make_carrier("AAA-001", 1, 20000, 1))
+        self.aggregator.update(make_carrier("AAA-001", 1, 18000, 2, unloaded_minutes=5))
+        stats = self.aggregator.to_stats()
+        self.assertEqual((stats.total_wine, stats.total_trips, stats.total_owners), (18000, 1, 1))
+        self.assertEqual((stats.carriers_remaining, stats.wine_remaining), (0, 0))
+        self.assertEqual(self.aggregator.owner_trip_counts, {2: 1})
+
+    def test_updates_match_rebuild(self):
+        changes = [
+            make_carrier("AAA-001", 1, 20000, 1),
+            make_carrier("BBB-002", 1, 10000, 2),
+            make_carrier("AAA-001", 1, 21000, 1),
+            make_carrier("CCC-003", 1, 5000, 2),
+            make_carrier("AAA-001", 1, 21000, 1, unloaded_minutes=12),
+            make_carrier("AAA-001", 2, 19000, 1),
+            make_carrier("BBB-002", 1, 10000, 3, unloaded_minutes=3),
+            make_carrier("CCC-003", 1, 5000, 2, unloaded_minutes=30),
+            make_carrier("CCC-003", 1, 5000, 2, unloaded_minutes=8),
+        ]
+        latest: dict[tuple[str, int], BoozeCarrier] = {}
+        for carrier in changes:
+            self.aggregator.update(carrier)
+            latest[(carrier.carrier_identifier, carrier.trip_id)] = carrier
+            self.assertEqual(
+                stats_tuple(self.aggregator.to_stats()),
+                stats_tuple(self.rebuilt_from(list(latest.values())).to_stats()),
+            )
+
+    def test_random_updates_match_rebuild(self):
+        rng = random.Random(39)
+        latest: dict[tuple[str, int], BoozeCarrier] = {}
+        for _ in range(500):
+            carrier = make_carrier(
+                f"X{rng.randrange(8):02}-000",
+                rng.randrange(1, 4),
+                rng.randrange(1, 25) * 1000,
+                rng.randrange(1, 6),
+                cruise_id=rng.choice((CRUISE_ID, CRUISE_ID, CRUISE_ID, CRUISE_ID + 1)),
+                unloaded_minutes=rng.choice((None, rng.randrange(1, 60))),
+            )
+            self.aggregator.update(carrier)
+            if carrier.cruise_id == CRUISE_ID:
+                latest[(carrier.carrier_identifier, carrier.trip_id)] = carrier
+
+        self.assertEqual(
+            stats_tuple(self.aggregator.to_stats()),
+            stats_tuple(self.rebuilt_from(list(latest.values())).to_stats()),
+        )
+
+
+class CrossCheckTests(unittest.TestCase):
+    def setUp(self):
+        self.carriers = [
+            make_carrier("AAA-001", 1, 20000, 1, unloaded_minutes=10),
+            make_carrier("BBB-002", 1, 10000, 2),
+        ]
+        self.aggregator = CruiseAggregator()
+
+    def backend_stats(self, **overrides: int) -> CruiseStats:
+        values = {
+            "totalWine": 30000,
+            "totalTrips": 2,
+            "totalCarriers": 2,
+            "carriersRemaining": 1,
+            "totalCarrierOwners": 2,
+            "wineRemaining": 10000,
+            "totalProfit": 3000000,
+        }
+        values.update(overrides)
+        return CruiseStats(values)
+
+    def test_matching_stats_are_trusted(self):
+        result = self.aggregator.cross_check(make_cruise(self.backend_stats()), self.carriers)
+        self.assertTrue(result.matches)
+        self.assertEqual(result.mismatches, {})
+        self.assertTrue(self.aggregator.trusted)
+
+        cruise = self.aggregator.to_cruise()
+        self.assertIsNotNone(cruise)
+        self.assertEqual(cruise.stats.total_wine, 30000)
+        # Profit is estimated from the backend's profit per tonne
+        self.assertEqual(cruise.stats.total_profit, 3000000)
+
+    def test_drift_clears_trusted(self):
+        self.aggregator.cross_check(make_cruise(self.backend_stats()), self.carriers)
+        self.assertTrue(self.aggregator.trusted)
+
+        result = self.aggregator.cross_check(
+            make_cruise(self.backend_stats(totalWine=31000, wineRemaining=11000)), self.carriers
+        )
+        self.assertFalse(result.matches)
+        self.assertEqual(result.mismatches, {"total_wine": (30000, 31000), "wine_remaining": (10000, 11000)})
+        self.assertFalse(self.aggregator.trusted)
+        self.assertIsNone(self.aggregator.to_cruise())
+
+    def test_missed_update_is_caught(self):
+        self.aggregator.cross_check(make_cruise(self.backend_stats()), self.carriers)
+        # An unload closed on the backend without the update reaching the aggregate
+        result = self.aggregator.cross_check(
+            make_cruise(self.backend_stats(carriersRemaining=0, wineRemaining=0)), self.carriers
+        )
+        self.assertFalse(result.matches)
+        self.assertEqual(set(result.mismatches), {"carriers_remaining", "wine_remaining"})
+
+    def test_new_cruise_rebuilds_from_carriers(self):
+        self.aggregator.cross_check(make_cruise(self.backend_stats()), self.carriers)
+        next_cruise_carriers = [make_carrier("CCC-003", 1, 5000, 3, cruise_id=CRUISE_ID + 1)]
+        result = self.aggregator.cross_check(
+            make_cruise(
+                self.backend_stats(
+                    totalWine=5000, totalTrips=1, totalCarriers=1, totalCarrierOwners=1, wineRemaining=5000
+                ),
+                cruise_id=CRUISE_ID + 1,
+            ),
+            next_cruise_carriers,
+        )
+        self.assertTrue(result.matches)
+        self.assertEqual(self.aggregator.cruise_id, CRUISE_ID + 1)
+        self.assertEqual(list(self.aggregator.trips), [("CCC-003", 1)])
@@ -0,0 +1,86 @@
+import unittest
+
+from ptn.boozebot.modules.RegexSandbox import (
+    REGEX_BENCHMARK_LENGTH,
+    check_regex_trigger,
+    has_nested_quantifier,
+    regex_sandbox,
+    worst_case_corpus,
+)
+
+
+class NestedQuantifierTests(unittest.TestCase):
+    def assert_nested(self, *patterns: str):
+        for pattern in patterns:
+            with self.subTest(pattern=pattern):
+                self.assertTrue(has_nested_quantifier(pattern))
+
+    def assert_not_nested(self, *patterns: str):
+        for pattern in patterns:
+            with self.subTest(pattern=pattern):
+                self.assertFalse(has_nested_quantifier(pattern))
+
+    def test_nested_repeats(self):
+        self.assert_nested(r"(a+)+", r"(a*)*", r"^(\d+)*$", r"(?:\w+\s*)*", r"((a+)b)+", r"(a+?)+", r"x(?:y|z+)+")
+
+    def test_unrepeated_groups(self):
+        self.assert_not_nested(r"(a+)", r"(a+)?", r"(ab)+", r"a+b+", r"(?:booze|wine)+", r"hello (world)")
+
+    def test_escaped_parens(self):
+        self.assert_not_nested(r"\(a+\)+", r"\((a)\)*")
+        self.assert_nested(r"\((a+)+\)")
+
+    def test_character_classes(self):
+        self.assert_not_nested(r"[(]a+[)]+", r"[^)(]+", r"[]a]+", r"[^]]+", r"[\]]+")
+        self.assert_nested(r"[)](a+)+", r"[]a](b+)+", r"([a-z]+)+")
+
+    def test_brace_quantifiers(self):
+        self.assert_not_nested(r"(a{1})+", r"(a+){1}", r"(a+){0,1}", r"(a+){,1}", r"(a{0,1})+", r"a{}")
+        self.assert_nested(r"(a{2,})+", r"(a{2})+", r"(a+){2}", r"(a+){2,}", r"(a+){,3}", r"(a{1,5}){3}")
+
+    def test_lookarounds(self):
+        self.assert_not_nested(r"(?=a+)b", r"(?<=a)b+", r"(?!\d+)\w", r"foo(?=bar+)")
+        self.assert_nested(r"(?:(?=a)a+)+")
+
+    def test_repeat_ended_by_different_literal(self):
+        # A repeat cut off by a different, required character can only end in one place
+        self.assert_not_nested(r"(?:a+b)+c", r"(?:a+b)+", r"(?:a{2,}b)+", r"(?:\.+,)+", r"(?:x*y)+")
+
+    def test_repeat_not_ended_by_different_literal(self):
+        self.assert_nested(r"(?:a+a)+", r"(?:a+b?)+", r"(?:a+b*)+", r"(?:x+\w)+", r"(?:a+|b)+", r"(?:[ab]+c)+")
+
+    def test_overlapping_alternatives_not_detected(self):
+        # Left to the benchmark, see RegexTriggerCheckTests.test_benchmark_rejects_slow_pattern
+        self.assertFalse(has_nested_quantifier(r"(a|aa)+"))
+
+
+class WorstCaseCorpusTests(unittest.TestCase):
+    def test_runs_of_pattern_characters(self):
+        corpus = worst_case_corpus(r"Bo+ZE")
+        self.assertTrue(all(len(text) == REGEX_BENCHMARK_LENGTH for text in corpus))
+        for char in "boz":
+            self.assertIn(char * REGEX_BENCHMARK_LENGTH, corpus)
+        self.assertNotIn("B" * REGEX_BENCHMARK_LENGTH, corpus)
+
+    def test_each_run_has_a_failing_variant(self):
+        corpus = worst_case_corpus(r"a+")
+        self.assertEqual(len(corpus) % 2, 0)
+        for run, failing in zip(corpus[::2], corpus[1::2], strict=True):
+            self.assertEqual(failing, run[:-1] + "\0")
+
+
+class RegexTriggerCheckTests(unittest.IsolatedAsyncioTestCase):
+    def tearDown(self):
+        regex_sandbox.stop()
+
+    async def test_invalid_pattern(self):
+        self.assertTrue((await check_regex_trigger(r"(booze")).startswith("Invalid regex pattern"))
+
+    async def test_nested_quantifier_rejected(self):
+        self.assertIn("(a+)+", await check_regex_trigger(r"(\w+)+"))
+
+    async def test_safe_pattern_accepted(self):
+        self.assertIsNone(await check_regex_trigger(r"\bbo+ze\b"))
+
+    async def test_benchmark_rejects_slow_pattern(self):
+        self.assertIn("took more than", await check_regex_trigger(r"^(a|aa)+$"))
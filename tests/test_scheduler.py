@@ -0,0 +1,254 @@
+import asyncio
+import unittest
+from datetime import UTC, datetime, timedelta
+from unittest import mock
+
+from ptn_utils.enums.booze_enums import CruiseSystemState
+
+from ptn.boozebot.classes.Cruise import CruiseState
+from ptn.boozebot.modules import Scheduler as scheduler_module
+from ptn.boozebot.modules.Scheduler import TICK_COALESCE_WINDOW, Scheduler, TickSnapshot
+
+INTERVAL = 600.0
+ACTIVE_INTERVAL = 60.0
+
+
+class FakeClock:
+    """Stands in for the time module inside the scheduler, moving only when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def monotonic(self) -> float:
+        return self.now
+
+    def perf_counter(self) -> float:
+        return self.now
+
+
+class FakeJob:
+    """A job callback recording each run's snapshot, which can be held until released."""
+
+    def __init__(self, clock: FakeClock, *, duration: float = 0.0, fail: bool = False, hold: bool = False):
+        self.clock = clock
+        self.duration = duration
+        self.fail = fail
+        self.release = asyncio.Event()
+        if not hold:
+            self.release.set()
+        self.snapshots: list[TickSnapshot] = []
+
+    async def __call__(self, snapshot: TickSnapshot) -> None:
+        self.snapshots.append(snapshot)
+        await self.release.wait()
+        self.clock.now += self.duration
+        if self.fail:
+            raise ValueError("job failed")
+
+
+class SlowCancelJob(FakeJob):
+    """A job which keeps running until released after being cancelled, as if cleaning up."""
+
+    async def __call__(self, snapshot: TickSnapshot) -> None:
+        self.snapshots.append(snapshot)
+        try:
+            await asyncio.Event().wait()
+        except asyncio.CancelledError:
+            await self.release.wait()
+            raise
+
+
+class SchedulerTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch.object(scheduler_module, "time", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.scheduler = Scheduler()
+        self.cruise_state_fetches = 0
+        self.scheduler.set_cruise_state_source(self.fetch_cruise_state)
+
+    async def asyncTearDown(self):
+        for job in self.scheduler._jobs.values():
+            job.cancel()
+        if self.scheduler._task is not None:
+            self.scheduler._task.cancel()
+        await self.settle()
+
+    async def fetch_cruise_state(self) -> CruiseState:
+        self.cruise_state_fetches += 1
+        return {"state": CruiseSystemState.ACTIVE, "updated_at": datetime.now(tz=UTC)}
+
+    @staticmethod
+    async def settle():
+        # Lets the scheduler loop and the job runs go until they next wait
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    async def advance(self, seconds: float):
+        self.clock.now += seconds
+        self.scheduler.wake()
+        await self.settle()
+
+    def add_job(self, name: str, callback: FakeJob, **kwargs):
+        return self.scheduler.add_job(name, callback, INTERVAL, jitter=0.0, **kwargs)
+
+    async def test_runs_when_started_and_reschedules_after_run(self):
+        callback = FakeJob(self.clock)
+        job = self.add_job("job", callback)
+        self.assertIsNone(job.stats())
+
+        job.start()
+        await self.settle()
+        self.assertEqual(len(callback.snapshots), 1)
+        self.assertIsNotNone(job.last_run_time)
+        self.assertEqual(job.due, self.clock.now + INTERVAL)
+
+        await self.advance(INTERVAL - 1)
+        self.assertEqual(len(callback.snapshots), 1)
+        await self.advance(1)
+        self.assertEqual(len(callback.snapshots), 2)
+
+    async def test_interval_follows_cruise_state(self):
+        job = self.add_job("job", FakeJob(self.clock), state_intervals={CruiseSystemState.ACTIVE: ACTIVE_INTERVAL})
+        job.start()
+        await self.settle()
+        self.assertEqual(job.current_interval, ACTIVE_INTERVAL)
+        self.assertEqual(job.due, self.clock.now + ACTIVE_INTERVAL)
+
+    async def test_base_interval_when_cruise_state_unavailable(self):
+        async def failing_source() -> CruiseState:
+            raise ConnectionError("backend down")
+
+        self.scheduler.set_cruise_state_source(failing_source)
+        job = self.add_job("job", FakeJob(self.clock), state_intervals={CruiseSystemState.ACTIVE: ACTIVE_INTERVAL})
+        job.start()
+        await self.settle()
+        self.assertEqual(job.current_interval, INTERVAL)
+        self.assertEqual(job.due, self.clock.now + INTERVAL)
+
+    async def test_jobs_due_within_window_share_tick(self):
+        first, second, later = FakeJob(self.clock), FakeJob(self.clock), FakeJob(self.clock)
+        self.add_job("first", first).start()
+        self.add_job("second", second).start(delay=TICK_COALESCE_WINDOW - 1)
+        self.add_job("later", later).start(delay=TICK_COALESCE_WINDOW + 1)
+        await self.settle()
+
+        self.assertEqual(len(first.snapshots), 1)
+        self.assertEqual(len(second.snapshots), 1)
+        self.assertIs(first.snapshots[0], second.snapshots[0])
+        self.assertEqual(later.snapshots, [])
+
+        await self.advance(TICK_COALESCE_WINDOW + 1)
+        self.assertEqual(len(later.snapshots), 1)
+        self.assertIsNot(later.snapshots[0], first.snapshots[0])
+
+    async def test_cruise_state_fetched_once_per_tick(self):
+        state_intervals = {CruiseSystemState.ACTIVE: ACTIVE_INTERVAL}
+        first, second = FakeJob(self.clock), FakeJob(self.clock)
+        self.add_job("first", first, state_intervals=state_intervals).start()
+        self.add_job("second", second, state_intervals=state_intervals).start()
+        await self.settle()
+        await first.snapshots[0].cruise_state()
+        self.assertEqual(self.cruise_state_fetches, 1)
+
+        await self.advance(ACTIVE_INTERVAL)
+        self.assertEqual(len(first.snapshots), 2)
+        self.assertEqual(self.cruise_state_fetches, 2)
+
+    async def test_jobs_without_state_intervals_do_not_fetch_cruise_state(self):
+        self.add_job("job", FakeJob(self.clock)).start()
+        await self.settle()
+        self.assertEqual(self.cruise_state_fetches, 0)
+
+    async def test_restart_while_running_is_skipped_as_overlap(self):
+        callback = FakeJob(self.clock, hold=True)
+        job = self.add_job("job", callback)
+        job.start()
+        await self.settle()
+
+        job.start()
+        await self.settle()
+        self.assertEqual(len(callback.snapshots), 1)
+        self.assertEqual(job.overlaps, 1)
+        self.assertIsNone(job.due)
+
+        # The run in progress reschedules the job when it finishes
+        callback.release.set()
+        await self.settle()
+        self.assertEqual(job.due, self.clock.now + INTERVAL)
+        self.assertEqual(job.stats().overlaps, 1)
+
+    async def test_cancel_during_run_stops_job(self):
+        callback = FakeJob(self.clock, hold=True)
+        job = self.add_job("job", callback)
+        job.start()
+        await self.settle()
+
+        job.cancel()
+        await self.settle()
+        self.assertTrue(job._current.cancelled())
+        self.assertFalse(job.is_running())
+        self.assertIsNone(job.due)
+        self.assertIsNone(job.stats())
+
+    async def test_restart_while_cancelling_reschedules(self):
+        callback = SlowCancelJob(self.clock, hold=True)
+        job = self.add_job("job", callback)
+        job.start()
+        await self.settle()
+
+        job.cancel()
+        job.start()
+        await self.settle()
+        # The cancelled run is still cleaning up, so the restart is skipped
+        self.assertEqual(job.overlaps, 1)
+        self.assertIsNone(job.due)
+
+        callback.release.set()
+        await self.settle()
+        self.assertTrue(job._current.cancelled())
+        self.assertEqual(job.due, self.clock.now + INTERVAL)
+
+    async def test_failed_run_is_recorded_and_rescheduled(self):
+        job = self.add_job("job", FakeJob(self.clock, fail=True))
+        job.start()
+        await self.settle()
+        self.assertEqual(job.stats().failures, 1)
+        self.assertEqual(job.due, self.clock.now + INTERVAL)
+
+    async def test_stats(self):
+        job = self.add_job("job", FakeJob(self.clock, duration=2.0))
+        job.start()
+        # The tick happens three seconds after the job was due
+        self.clock.now += 3
+        await self.settle()
+        await self.advance(INTERVAL + 1)
+
+        stats = job.stats()
+        self.assertEqual((stats.runs, stats.failures, stats.overlaps), (2, 0, 0))
+        self.assertEqual((stats.mean_duration, stats.max_duration), (2.0, 2.0))
+        self.assertEqual((stats.mean_lag, stats.max_lag), (2.0, 3.0))
+
+    async def test_is_due_and_next_iteration(self):
+        job = self.add_job("job", FakeJob(self.clock))
+        self.assertIsNone(job.next_iteration)
+        self.assertFalse(job.is_due(self.clock.now + INTERVAL))
+
+        job.start(delay=30)
+        self.assertFalse(job.is_due(self.clock.now + 29))
+        self.assertTrue(job.is_due(self.clock.now + 30))
+        expected = datetime.now(tz=UTC) + timedelta(seconds=30)
+        self.assertAlmostEqual(job.next_iteration.timestamp(), expected.timestamp(), delta=1)
+
+        job.cancel()
+        self.assertIsNone(job.next_iteration)
+        self.assertFalse(job.is_due(self.clock.now + 30))
+
+    async def test_add_job_replaces_job_with_same_name(self):
+        old = self.add_job("job", FakeJob(self.clock))
+        old.start(delay=30)
+        new = self.add_job("job", FakeJob(self.clock))
+        self.assertFalse(old.is_running())
+        self.assertIs(self.scheduler.get_job("job"), new)
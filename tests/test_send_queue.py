@@ -0,0 +1,145 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from typing import Any
+from unittest import mock
+
+import discord
+
+from ptn.boozebot.modules import SendQueue as send_queue_module
+from ptn.boozebot.modules.SendQueue import ROUTE_BUCKET_CAPACITY, SendPriority, SendQueue
+
+
+class FakeChannel:
+    """A Messageable recording what is sent to it."""
+
+    def __init__(self, channel_id: int = 1, fail_with: list[Exception] | None = None):
+        self.id = channel_id
+        self.sent: list[dict[str, Any]] = []
+        self.fail_with = fail_with or []
+
+    async def send(self, **kwargs: Any):
+        if self.fail_with:
+            raise self.fail_with.pop(0)
+        self.sent.append(kwargs)
+        return FakeMessage(self, len(self.sent))
+
+
+class FakeMessage(discord.PartialMessage):
+    """A message recording the edits made to it, shared through the channel's edit log."""
+
+    def __init__(self, channel: FakeChannel, message_id: int, edits: list[tuple[int, dict[str, Any]]] | None = None):
+        self.channel = channel
+        self.id = message_id
+        self.edits = edits if edits is not None else []
+
+    async def edit(self, **kwargs: Any):
+        self.edits.append((self.id, kwargs))
+        return self
+
+
+def rate_limited() -> discord.HTTPException:
+    return discord.HTTPException(SimpleNamespace(status=429, reason="Too Many Requests"), "You are being rate limited.")
+
+
+class SendQueueTests(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.queue = SendQueue()
+
+    async def asyncTearDown(self):
+        for bucket in self.queue._buckets.values():
+            if bucket.task is not None:
+                bucket.task.cancel()
+
+    @staticmethod
+    async def settle():
+        # Lets the drain tasks run until they next sleep
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+    async def test_send_resolves_to_sent_message(self):
+        channel = FakeChannel()
+        message = await self.queue.send(channel, content="hello")
+        self.assertEqual(channel.sent, [{"content": "hello"}])
+        self.assertEqual(message.id, 1)
+
+    async def test_bucket_limits_burst_to_capacity(self):
+        channel = FakeChannel()
+        for i in range(ROUTE_BUCKET_CAPACITY + 2):
+            self.queue.send(channel, content=str(i))
+        await self.settle()
+        self.assertEqual(len(channel.sent), ROUTE_BUCKET_CAPACITY)
+
+    async def test_sends_in_priority_order(self):
+        channel = FakeChannel()
+        futures = [
+            self.queue.send(channel, SendPriority.LOW, content="low"),
+            self.queue.send(channel, SendPriority.NORMAL, content="normal"),
+            self.queue.send(channel, SendPriority.HIGH, content="high"),
+        ]
+        await asyncio.gather(*futures)
+        self.assertEqual([kwargs["content"] for kwargs in channel.sent], ["high", "normal", "low"])
+
+    async def test_low_priority_held_back_for_reserve(self):
+        channel = FakeChannel()
+        for i in range(ROUTE_BUCKET_CAPACITY - send_queue_module.LOW_PRIORITY_RESERVE):
+            self.queue.send(channel, content=str(i))
+        low = self.queue.send(channel, SendPriority.LOW, content="low")
+        await self.settle()
+        self.assertNotIn({"content": "low"}, channel.sent)
+        self.assertFalse(low.done())
+
+    async def test_low_priority_dropped_after_max_age(self):
+        channel = FakeChannel()
+        with mock.patch.object(send_queue_module, "LOW_PRIORITY_MAX_AGE", -1.0):
+            result = await self.queue.send(channel, SendPriority.LOW, content="gif")
+        self.assertIsNone(result)
+        self.assertEqual(channel.sent, [])
+
+    async def test_pending_edits_are_coalesced(self):
+        channel = FakeChannel()
+        message = FakeMessage(channel, 10)
+        first = self.queue.edit(message, content="first")
+        second = self.queue.edit(message, embed="embed")
+        third = self.queue.edit(message, content="third")
+        results = await asyncio.gather(first, second, third)
+        self.assertEqual(message.edits, [(10, {"content": "third", "embed": "embed"})])
+        self.assertEqual(results, [message, message, message])
+
+    async def test_coalesced_edit_moves_up_to_higher_priority(self):
+        channel = FakeChannel()
+        edits: list[tuple[int, dict[str, Any]]] = []
+        low_message = FakeMessage(channel, 10, edits)
+        normal_message = FakeMessage(channel, 20, edits)
+        futures = [
+            self.queue.edit(low_message, SendPriority.LOW, content="low"),
+            self.queue.edit(normal_message, SendPriority.NORMAL, content="normal"),
+            self.queue.edit(low_message, SendPriority.HIGH, content="high"),
+        ]
+        await asyncio.gather(*futures)
+        # The stale low priority entry is skipped, so the merged edit is made once
+        self.assertEqual(edits, [(10, {"content": "high"}), (20, {"content": "normal"})])
+
+    async def test_edit_after_request_made_is_queued_again(self):
+        channel = FakeChannel()
+        message = FakeMessage(channel, 10)
+        await self.queue.edit(message, content="first")
+        await self.queue.edit(message, content="second")
+        self.assertEqual(message.edits, [(10, {"content": "first"}), (10, {"content": "second"})])
+
+    async def test_rate_limit_empties_bucket(self):
+        channel = FakeChannel(fail_with=[rate_limited()])
+        failed = self.queue.send(channel, content="first")
+        second = self.queue.send(channel, content="second")
+        with self.assertRaises(discord.HTTPException):
+            await failed
+        await self.settle()
+        self.assertEqual(channel.sent, [])
+        self.assertFalse(second.done())
+        self.assertLess(self.queue._buckets[("send", channel.id)].tokens, 1)
+
+    async def test_failure_is_passed_to_caller(self):
+        channel = FakeChannel(fail_with=[ValueError("bad request")])
+        with self.assertRaises(ValueError):
+            await self.queue.send(channel, content="first")
+        self.assertEqual(await self.queue.send(channel, content="second"), FakeMessage(channel, 1))